@@ -0,0 +1,79 @@
+"""
+エフェメリスごとの1年あたりの計算コストを測定するベンチマーク
+
+カタログ（koyomi.core.ephemeris.EPHEMERIDES）の各ファイルについて、
+ファイルを開く時間と、二十四節気の一括探索・太陽黄経の評価の1年あたりの時間を表示する。
+カレントディレクトリにないファイルは測定しない（skyfieldのloadで取得しておくこと）。
+
+使い方:
+    python bench_ephemeris.py [--years 10]
+"""
+import argparse
+import os
+import time
+import numpy as np
+from koyomi.core.ephemeris import EPHEMERIDES, EphemerisRegistry
+from koyomi.core.astronomical import AstronomicalCalculator
+from koyomi.seasonal.sekki import SolarTerms
+
+# 各ファイルで測定する期間の中心（対応期間に収まるように切り詰める）
+SAMPLE_CENTER_YEAR = 2000
+
+
+def sample_years(spec, years: int):
+    """対応期間のうち、SAMPLE_CENTER_YEARに最も近いyears年間"""
+    start = min(max(SAMPLE_CENTER_YEAR - years // 2, spec.start_year), spec.end_year - years + 1)
+    return start, start + years - 1
+
+
+def bench(spec, years: int) -> dict:
+    """1つのファイルについて測定"""
+    EphemerisRegistry.clear()
+    start_year, end_year = sample_years(spec, years)
+    
+    start = time.perf_counter()
+    calculator = AstronomicalCalculator(69.0, ephemeris_file=spec.filename)
+    calculator.eph
+    open_time = time.perf_counter() - start
+    
+    sekki = SolarTerms()
+    sekki.ephemeris = spec.filename
+    start = time.perf_counter()
+    sekki.calculate_range(start_year, end_year)
+    sweep_time = time.perf_counter() - start
+    
+    tt = calculator.ts.utc(start_year, 1, np.arange(1, 365 * years + 1)).tt
+    start = time.perf_counter()
+    calculator.get_solar_longitude(calculator.ts.tt_jd(tt))
+    longitude_time = time.perf_counter() - start
+    
+    return {
+        '期間': f"{start_year}-{end_year}",
+        'サイズ(MB)': os.path.getsize(spec.filename) / 1024 / 1024,
+        '読み込み(ms)': open_time * 1000,
+        '節気/年(ms)': sweep_time / years * 1000,
+        '黄経365日/年(ms)': longitude_time / years * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='エフェメリスごとの計算コストを測定する')
+    parser.add_argument('--years', type=int, default=10, help='測定する年数')
+    args = parser.parse_args(argv)
+    
+    print(f"{'ファイル':<20} {'期間':<11} {'サイズ(MB)':>10} {'読み込み(ms)':>12} "
+          f"{'節気/年(ms)':>12} {'黄経365日/年(ms)':>16}")
+    print("-" * 90)
+    for specs in EPHEMERIDES.values():
+        for spec in specs:
+            if not os.path.exists(spec.filename):
+                print(f"{spec.filename:<20} （ファイルがないため省略）")
+                continue
+            result = bench(spec, args.years)
+            print(f"{spec.filename:<20} {result['期間']:<11} {result['サイズ(MB)']:>10.1f} "
+                  f"{result['読み込み(ms)']:>12.1f} {result['節気/年(ms)']:>12.1f} "
+                  f"{result['黄経365日/年(ms)']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
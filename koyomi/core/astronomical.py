@@ -1,21 +1,102 @@
-from skyfield.api import load
 from skyfield.framelib import ecliptic_frame
+import numpy as np
 import pytz
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from .ephemeris import EphemerisRegistry
+from .chebyshev import SolarLongitudeChebyshev
 
 class AstronomicalCalculator:
     """天文計算の基本機能を提供するクラス"""
-    def __init__(self, delta_t=None):
+    
+    # J2000.0（JD 2451545.0）における平均太陽の黄経（度）
+    MEAN_LONGITUDE_J2000 = 280.46646
+    # 平均太陽の運動（度/日）
+    MEAN_SOLAR_MOTION = 0.98564736
+    # 太陽年（日）
+    TROPICAL_YEAR = 365.242189
+    # 太陽の視黄経の変化率の下限・上限（度/日）。実際は約0.953〜1.019の範囲
+    MIN_SOLAR_RATE = 0.94
+    MAX_SOLAR_RATE = 1.03
+    # 平均朔望月（日）と、J2000.0以後最初の平均朔（TTユリウス日、Meeus 49.1）
+    SYNODIC_MONTH = 29.530588861
+    MEAN_NEW_MOON_J2000 = 2451550.09766
+    # 月と太陽の黄経差の平均変化率（度/日）
+    MEAN_ELONGATION_RATE = 360.0 / SYNODIC_MONTH
+    # 日本標準時（UTC+9、夏時刻なし）
+    JST = timezone(timedelta(hours=9), 'JST')
+    # 日本標準時とUTCの差（datetime64での計算用）
+    JST_OFFSET = np.timedelta64(9, 'h')
+    # 計算精度。'exact'は全てエフェメリスで、'date'は解析式で求め、JSTの0時に近い瞬間だけ
+    # エフェメリスで求め直す（日付は'exact'と一致し、時刻は数分ずれうる）
+    PRECISIONS = ('exact', 'date')
+    # 太陽の視黄経の解析式（Meeus 25章の低精度式）に加える補正項
+    # (振幅（秒角）, 位相（度）, 変化率（度/ユリウス世紀）)。
+    # 月・金星・火星・木星・土星による摂動と章動の2L項に相当し、1900〜2052年のDE421に当てはめたもの
+    SOLAR_PERTURBATIONS = np.array([
+        (6.468, 297.78, 445267.1115),
+        (7.169, 247.04, 32964.4672),
+        (2.730, 132.53, 65928.9344),
+        (2.591, 209.95, 3034.9057),
+        (5.513, 196.89, -45036.8856),
+        (4.850, 98.58, -22518.4428),
+        (2.456, 26.93, -9037.8353),
+        (2.041, 30.65, 33718.1471),
+        (1.587, 314.02, -31556.2782),
+        (1.310, 20.29, 72001.5397),
+        (0.800, 320.03, 4442.7721),
+        (0.678, 113.91, -67555.3285),
+        (0.483, 124.62, 62960.2652),
+        (0.460, 226.12, 34777.2590),
+    ])
+    # 補正の定数項（秒角）と1ユリウス世紀あたりの変化（秒角）
+    SOLAR_LONGITUDE_BIAS = (-7.842, -4.496)
+    # 解析式の瞬間とJSTの0時との差がこれ未満の場合はエフェメリスで求め直す（日）。
+    # 解析式の誤差は1900〜2052年で最大約7秒角（約3分）
+    DATE_PRECISION_MARGIN = 8.0 / 1440
+    # 補正項を当てはめた期間（TTユリウス日、1900年1月1日〜2053年1月1日）。
+    # この期間外の瞬間は解析式の誤差を検証していないため、常にエフェメリスで求め直す
+    SOLAR_PERTURBATIONS_RANGE = (2415020.5, 2470903.5)
+    
+    def __init__(self, delta_t=None, ephemeris_file=None):
         """
         Parameters:
-            delta_t (float, optional): ΔT値（秒）。設定しない場合はskyfieldのデフォルト値を使用。
+            delta_t (float | str | DeltaTModel, optional): ΔT値（秒）またはΔTモデル
+                （koyomi.core.delta_t参照）。設定しない場合はskyfieldのデフォルト値を使用。
+            ephemeris_file (str, optional): エフェメリスのファイル名、または名前
+                （'de421'・'de440s'・'de441'、EphemerisRegistry.resolve参照）。
+                設定しない場合はEphemerisRegistry.default_ephemeris（既定はde421.bsp）を使用。
+        
+        タイムスケールとエフェメリスはEphemerisRegistryを通じてプロセス内で共有される。
+        エフェメリスは初めて位置を計算するときに読み込む。
         """
-        self.ts = load.timescale() if delta_t is None else load.timescale(delta_t=delta_t)
-        self.eph = load('de421.bsp')
-        self.sun = self.eph['sun']
-        self.earth = self.eph['earth']
+        self.delta_t = delta_t
+        self.ephemeris_file = EphemerisRegistry.resolve(ephemeris_file)
+        self.ts = EphemerisRegistry.get_timescale(delta_t)
+        self._eph = None
         self.tz_jst = pytz.timezone('Asia/Tokyo')
-
+    
+    @property
+    def eph(self):
+        """エフェメリス（初めて参照したときにEphemerisRegistryから取得する）"""
+        if self._eph is None:
+            eph = EphemerisRegistry.get_ephemeris(self.ephemeris_file)
+            self._sun = eph['sun']
+            self._earth = eph['earth']
+            self._eph = eph
+        return self._eph
+    
+    @property
+    def sun(self):
+        """太陽"""
+        self.eph
+        return self._sun
+    
+    @property
+    def earth(self):
+        """地球"""
+        self.eph
+        return self._earth
+    
     def get_solar_longitude(self, time):
         """
         指定された時刻の太陽黄経を計算
@@ -30,20 +111,104 @@ class AstronomicalCalculator:
         sun_at_t = earth_at_t.observe(self.sun)
         _, lon, _ = sun_at_t.apparent().frame_latlon(ecliptic_frame)
         return lon.degrees
-
-    def find_solar_term_date(self, target_longitude, start_time, end_time, tolerance=0.001):
+    
+    def get_solar_longitude_analytic(self, time):
         """
-        指定された黄経になる日時を二分探索で特定
+        解析式で太陽の視黄経を計算（NumPyのみで評価し、エフェメリスを使わない）
+        
+        Meeusの低精度式（平均黄経・中心差・光行差・章動の主項）に、
+        SOLAR_PERTURBATIONS の補正項を加える。1900〜2052年の誤差は最大約7秒角。
+        
+        Parameters:
+            time: Skyfield Time object、またはTTユリウス日（スカラー・配列）
+        
+        Returns:
+            float or np.ndarray: 太陽黄経（度）
+        """
+        tt = np.asarray(time.tt if hasattr(time, 'tt') else time, dtype=float)
+        T = (tt - 2451545.0) / 36525.0
+        
+        mean_longitude = 280.46646 + 36000.76983 * T + 0.0003032 * T ** 2
+        M = np.radians(357.52911 + 35999.05029 * T - 0.0001537 * T ** 2)
+        center = (
+            (1.914602 - 0.004817 * T - 0.000014 * T ** 2) * np.sin(M)
+            + (0.019993 - 0.000101 * T) * np.sin(2 * M)
+            + 0.000289 * np.sin(3 * M)
+        )
+        omega = np.radians(125.04 - 1934.136 * T)
+        apparent = mean_longitude + center - 0.00569 - 0.00478 * np.sin(omega)
+        
+        amplitude, phase, rate = self.SOLAR_PERTURBATIONS.T
+        arguments = np.radians(phase + rate * T[..., np.newaxis])
+        correction = (
+            self.SOLAR_LONGITUDE_BIAS[0] + self.SOLAR_LONGITUDE_BIAS[1] * T
+            + np.sum(amplitude * np.sin(arguments), axis=-1)
+        )
+        return (apparent + correction / 3600.0) % 360.0
+    
+    def _solar_longitude_of(self, tt, model):
+        """TTユリウス日の配列について、指定されたモデルで太陽黄経を計算"""
+        if model == 'analytic':
+            return self.get_solar_longitude_analytic(tt)
+        return self.get_solar_longitude(self.ts.tt_jd(tt))
+    
+    @property
+    def solar_longitude_model(self):
+        """
+        エフェメリスから当てはめた太陽視黄経のチェビシェフ近似
+        
+        初回に当てはめる（SolarLongitudeChebyshev.set_cache_dirでディレクトリを設定した場合は、
+        そこに係数ファイル sun_longitude_<エフェメリス名>.npz を保存・再利用する）。
+        """
+        return SolarLongitudeChebyshev.for_calculator(self)
+    
+    def get_solar_longitude_fast(self, time):
+        """
+        チェビシェフ近似を使って太陽黄経を計算（NumPyのみで評価）
+        
+        Parameters:
+            time: Skyfield Time object、またはTTユリウス日（スカラー・配列）
+        
+        Returns:
+            float or np.ndarray: 太陽黄経（度）。最大誤差は solar_longitude_model.max_error
+        """
+        return self.solar_longitude_model.evaluate(time)
+    
+    def find_solar_term_date(self, target_longitude, start_time, end_time, tolerance=0.001,
+                             method='bisect', time_tolerance=None, angle_tolerance=None):
+        """
+        指定された黄経になる日時を特定
         
         Parameters:
             target_longitude (float): 目標の黄経（度）
             start_time: Skyfield Time object（探索開始時刻）
             end_time: Skyfield Time object（探索終了時刻）
-            tolerance (float): 許容誤差（度）
+            tolerance (float): 許容誤差（度）。method='bisect'の場合のみ使用
+            method (str): 'bisect'（二分探索）または 'secant'（割線法）
+            time_tolerance (float, optional): 時刻の許容誤差（日）。method='secant'の場合のみ使用
+            angle_tolerance (float, optional): 黄経の許容誤差（度）。method='secant'の場合のみ使用
         
         Returns:
             Skyfield Time object: 指定された黄経になる時刻
+            （method='secant'で探索終了時刻までに通過しない場合はNone）
+        
+        method='secant'では探索開始時刻以降で最初に目標の黄経を通過する時刻を求め、
+        反復回数と評価回数を self.last_solver_info に記録する。
         """
+        if method == 'secant':
+            options = {}
+            if time_tolerance is not None:
+                options['time_tolerance'] = time_tolerance
+            if angle_tolerance is not None:
+                options['angle_tolerance'] = angle_tolerance
+            times, info = self.solve_solar_longitudes(
+                [target_longitude], [start_time.tt], direction='forward', **options
+            )
+            self.last_solver_info = {key: int(value[0]) for key, value in info.items()}
+            return times[0] if times.tt[0] <= end_time.tt else None
+        if method != 'bisect':
+            raise ValueError(f"未対応の探索方法です: {method}")
+        
         while (end_time.tt - start_time.tt) > tolerance:
             mid_time = self.ts.tt_jd((start_time.tt + end_time.tt) / 2)
             mid_lon = self.get_solar_longitude(mid_time)
@@ -53,7 +218,7 @@ class AstronomicalCalculator:
                 mid_lon -= 360
             elif mid_lon < target_longitude - 180:
                 mid_lon += 360
-                
+            
             if abs(mid_lon - target_longitude) < tolerance:
                 return mid_time
             elif mid_lon < target_longitude:
@@ -62,7 +227,292 @@ class AstronomicalCalculator:
                 end_time = mid_time
         
         return start_time
-
+    
+    def solve_solar_longitudes(self, target_longitudes, seed_times, direction='nearest',
+                               time_tolerance=1e-6, angle_tolerance=1e-6, max_iterations=20,
+                               model='ephemeris'):
+        """
+        複数の目標黄経になる日時を割線法（ニュートン法の変化率を差分で近似）で一括して特定
+        
+        初回は平均太陽の運動（約0.9856度/日）で目標までの日数を見積もり、以降は直前2回の
+        評価から求めた太陽黄経の変化率で補正する。太陽の視黄経の変化率は
+        MIN_SOLAR_RATE〜MAX_SOLAR_RATE の範囲に収まるため、初回の評価だけで目標の通過を
+        確実に挟む区間が決まり、補正がその区間を外れた場合は二分法に切り替える。
+        通常は1根あたり3〜4回の評価で収束する。
+        
+        Parameters:
+            target_longitudes (array-like): 目標の黄経（度）の配列
+            seed_times: 探索の起点（Time配列、Time objectの列、またはTTユリウス日の配列）
+            direction (str): 'nearest'は起点に最も近い通過、'forward'は起点以降で最初の通過を求める
+            time_tolerance (float): 時刻の許容誤差（日）
+            angle_tolerance (float): 黄経の許容誤差（度）
+            max_iterations (int): 最大反復回数
+            model (str): 'ephemeris'（エフェメリス）または 'analytic'（get_solar_longitude_analytic）
+        
+        Returns:
+            tuple: (Time配列, 統計情報)
+            統計情報は {'反復回数': np.ndarray, '評価回数': np.ndarray} で、根ごとの値を持つ
+        """
+        if direction not in ('nearest', 'forward'):
+            raise ValueError(f"未対応の探索方向です: {direction}")
+        if model not in ('ephemeris', 'analytic'):
+            raise ValueError(f"未対応の黄経のモデルです: {model}")
+        
+        targets = np.atleast_1d(np.asarray(target_longitudes, dtype=float)) % 360.0
+        seeds = self._to_tt_array(seed_times)
+        targets, seeds = np.broadcast_arrays(targets, seeds)
+        targets = targets.copy()
+        seeds = seeds.copy()
+        
+        n = targets.size
+        iterations = np.zeros(n, dtype=int)
+        evaluations = np.zeros(n, dtype=int)
+        if n == 0:
+            return self.ts.tt_jd(seeds), {'反復回数': iterations, '評価回数': evaluations}
+        
+        # 起点での黄経から、目標の通過までの角距離を求める
+        lon = self._solar_longitude_of(seeds, model)
+        evaluations += 1
+        if direction == 'forward':
+            distance = (targets - lon) % 360.0
+        else:
+            distance = (targets - lon + 180.0) % 360.0 - 180.0
+        
+        # 変化率の上限・下限から、目標の通過を必ず含む区間を決める
+        lo = seeds + np.where(distance >= 0, distance / self.MAX_SOLAR_RATE, distance / self.MIN_SOLAR_RATE)
+        hi = seeds + np.where(distance >= 0, distance / self.MIN_SOLAR_RATE, distance / self.MAX_SOLAR_RATE)
+        
+        prev_t = seeds.copy()
+        prev_f = -distance
+        next_t = seeds + distance / self.MEAN_SOLAR_MOTION
+        active = np.abs(distance) >= angle_tolerance
+        
+        for _ in range(max_iterations):
+            idx = np.nonzero(active)[0]
+            if idx.size == 0:
+                break
+            
+            # 補正が区間を外れた場合は区間の中点を使う
+            t = next_t[idx]
+            outside = (t <= lo[idx]) | (t >= hi[idx])
+            t = np.where(outside, (lo[idx] + hi[idx]) / 2, t)
+            
+            lon = self._solar_longitude_of(t, model)
+            evaluations[idx] += 1
+            iterations[idx] += 1
+            f = (lon - targets[idx] + 180.0) % 360.0 - 180.0
+            
+            # 区間の更新
+            before = f < 0
+            lo[idx] = np.where(before, t, lo[idx])
+            hi[idx] = np.where(before, hi[idx], t)
+            
+            # 直前の評価との差分から変化率を求める
+            dt = t - prev_t[idx]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rate = (f - prev_f[idx]) / dt
+            rate = np.where(np.isfinite(rate), rate, self.MEAN_SOLAR_MOTION)
+            rate = np.clip(rate, self.MIN_SOLAR_RATE, self.MAX_SOLAR_RATE)
+            step = -f / rate
+            
+            prev_t[idx] = t
+            prev_f[idx] = f
+            next_t[idx] = t + step
+            
+            done = (
+                (np.abs(f) < angle_tolerance)
+                | (np.abs(step) < time_tolerance)
+                | ((hi[idx] - lo[idx]) < time_tolerance)
+            )
+            active[idx[done]] = False
+        
+        info = {'反復回数': iterations, '評価回数': evaluations}
+        return self.ts.tt_jd(next_t), info
+    
+    def get_lunar_elongation(self, time):
+        """
+        指定された時刻の月と太陽の視黄経の差を計算
+        
+        Parameters:
+            time: Skyfield Time object
+        
+        Returns:
+            float or np.ndarray: 月の黄経 − 太陽の黄経（度、0〜360）。朔で0
+        """
+        earth_at_t = self.earth.at(time)
+        _, moon_lon, _ = earth_at_t.observe(self.eph['moon']).apparent().frame_latlon(ecliptic_frame)
+        _, sun_lon, _ = earth_at_t.observe(self.sun).apparent().frame_latlon(ecliptic_frame)
+        return (moon_lon.degrees - sun_lon.degrees) % 360.0
+    
+    def find_new_moons(self, start_time, end_time, time_tolerance=1e-7, max_iterations=20):
+        """
+        指定された期間の朔（月と太陽の視黄経が等しくなる瞬間）を一括で求める
+        
+        平均朔（平均朔望月の等差数列）を初期値とし、全ての朔について割線法で
+        同時に反復する。真の朔は平均朔から最大で約0.6日ずれるため、初期値での
+        黄経差は±10度以内に収まる。
+        
+        Parameters:
+            start_time: Skyfield Time object（探索開始時刻、含む）
+            end_time: Skyfield Time object（探索終了時刻、含まない）
+            time_tolerance (float): 時刻の許容誤差（日）
+            max_iterations (int): 最大反復回数
+        
+        Returns:
+            Time: 朔の瞬間（時刻順）
+        """
+        k0 = np.floor((start_time.tt - self.MEAN_NEW_MOON_J2000) / self.SYNODIC_MONTH) - 1
+        k1 = np.ceil((end_time.tt - self.MEAN_NEW_MOON_J2000) / self.SYNODIC_MONTH) + 1
+        prev_t = self.MEAN_NEW_MOON_J2000 + self.SYNODIC_MONTH * np.arange(k0, k1 + 1)
+        
+        def elongation(tt):
+            return (self.get_lunar_elongation(self.ts.tt_jd(tt)) + 180.0) % 360.0 - 180.0
+        
+        prev_f = elongation(prev_t)
+        t = prev_t - prev_f / self.MEAN_ELONGATION_RATE
+        active = np.ones(t.size, dtype=bool)
+        
+        for _ in range(max_iterations):
+            idx = np.nonzero(active)[0]
+            if idx.size == 0:
+                break
+            f = elongation(t[idx])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rate = (f - prev_f[idx]) / (t[idx] - prev_t[idx])
+            rate = np.where(np.isfinite(rate) & (rate > 0), rate, self.MEAN_ELONGATION_RATE)
+            step = -f / rate
+            prev_t[idx] = t[idx]
+            prev_f[idx] = f
+            t[idx] += step
+            active[idx[np.abs(step) < time_tolerance]] = False
+        
+        t = t[(t >= start_time.tt) & (t < end_time.tt)]
+        return self.ts.tt_jd(t)
+    
+    def _to_tt_array(self, times) -> np.ndarray:
+        """Time object・Time objectの列・TTユリウス日の配列をTTユリウス日の配列に変換"""
+        if hasattr(times, 'tt'):
+            return np.atleast_1d(np.asarray(times.tt, dtype=float))
+        return np.array([t.tt if hasattr(t, 'tt') else t for t in np.atleast_1d(times)], dtype=float)
+    
+    def find_solar_longitude_dates(self, target_longitudes, start_times, end_times, tolerance=1e-5,
+                                   method='bisect', precision='exact'):
+        """
+        複数の目標黄経になる日時を一括の二分探索で特定
+        
+        全ての探索区間の中点をひとつのTime配列にまとめ、反復ごとにskyfieldを
+        一度だけ評価する。各区間には目標黄経の通過が一度だけ含まれている必要がある
+        （区間幅が1年未満であれば満たされる）。
+        
+        Parameters:
+            target_longitudes (array-like): 目標の黄経（度）の配列
+            start_times: 探索開始時刻（Time配列、Time objectの列、またはTTユリウス日の配列）
+            end_times: 探索終了時刻（start_timesと同じ形式）
+            tolerance (float): 時刻の許容誤差（日）
+            method (str): 'bisect'（二分探索）または 'secant'（区間の中点を起点とする割線法）
+            precision (str): 'exact' または 'date'（PRECISIONS参照）。'date'では常に割線法を使い、
+                             エフェメリスで求め直した件数を self.last_solver_info に記録する
+        
+        Returns:
+            Skyfield Time object: 各目標黄経になる時刻の配列（target_longitudesと同じ順序）
+        """
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"未対応の精度です: {precision}")
+        targets = np.atleast_1d(np.asarray(target_longitudes, dtype=float)) % 360.0
+        lo = self._to_tt_array(start_times)
+        hi = self._to_tt_array(end_times)
+        targets, lo, hi = np.broadcast_arrays(targets, lo, hi)
+        lo = lo.copy()
+        hi = hi.copy()
+        
+        if precision == 'date':
+            return self._solve_date_precision(targets, (lo + hi) / 2, tolerance)
+        if method == 'secant':
+            times, _ = self.solve_solar_longitudes(
+                targets, (lo + hi) / 2, time_tolerance=tolerance
+            )
+            return times
+        if method != 'bisect':
+            raise ValueError(f"未対応の探索方法です: {method}")
+        
+        if targets.size == 0:
+            return self.ts.tt_jd(np.array([], dtype=float))
+        
+        # 区間幅が許容誤差以下になるまでの反復回数は事前に決まる
+        width = float(np.max(hi - lo))
+        iterations = max(0, int(np.ceil(np.log2(width / tolerance)))) if width > tolerance else 0
+        
+        for _ in range(iterations):
+            mid = (lo + hi) / 2
+            lon = self.get_solar_longitude(self.ts.tt_jd(mid))
+            
+            # 目標との差を-180〜180度に正規化（360度の折り返し対策）
+            diff = (lon - targets + 180.0) % 360.0 - 180.0
+            before = diff < 0
+            lo = np.where(before, mid, lo)
+            hi = np.where(before, hi, mid)
+        
+        return self.ts.tt_jd((lo + hi) / 2)
+    
+    def _solve_date_precision(self, targets, seeds, tolerance):
+        """
+        解析式で目標黄経になる時刻を求め、JSTの0時に近いものと、補正項を当てはめた期間
+        （SOLAR_PERTURBATIONS_RANGE）外のものだけエフェメリスで求め直す
+        
+        Parameters:
+            targets (np.ndarray): 目標の黄経（度）
+            seeds (np.ndarray): 探索の起点（TTユリウス日）
+            tolerance (float): 時刻の許容誤差（日）
+        
+        Returns:
+            Skyfield Time object: 各目標黄経になる時刻の配列
+        """
+        times, _ = self.solve_solar_longitudes(
+            targets, seeds, time_tolerance=tolerance, model='analytic'
+        )
+        tt = np.array(times.tt, dtype=float)
+        
+        # JSTの0時からの経過（日）
+        jst = self.to_jst_datetime64(times)
+        elapsed = (jst - jst.astype('datetime64[D]')) / np.timedelta64(1, 'D')
+        near_midnight = np.minimum(elapsed, 1.0 - elapsed) < self.DATE_PRECISION_MARGIN
+        fit_start, fit_end = self.SOLAR_PERTURBATIONS_RANGE
+        refine = near_midnight | (tt < fit_start) | (tt >= fit_end)
+        
+        if np.any(refine):
+            refined, _ = self.solve_solar_longitudes(
+                targets[refine], tt[refine], time_tolerance=tolerance
+            )
+            tt[refine] = refined.tt
+        
+        self.last_solver_info = {'精密計算件数': int(np.count_nonzero(refine))}
+        return self.ts.tt_jd(tt)
+    
+    def solar_longitude_windows(self, years, longitudes, margin_days=10.0):
+        """
+        各年・各黄経について、平均太陽の運動から見積もった探索区間を作成
+        
+        Parameters:
+            years (array-like): 対象年の配列
+            longitudes (array-like): 目標の黄経（度）の配列
+            margin_days (float): 見積もり日時の前後に取る探索幅（日）
+        
+        Returns:
+            tuple: (目標黄経, 探索開始TT, 探索終了TT) のNumPy配列。
+                   年×黄経の順に平坦化されている
+        """
+        years = np.atleast_1d(np.asarray(years, dtype=float))
+        longitudes = np.atleast_1d(np.asarray(longitudes, dtype=float)) % 360.0
+        year_grid, lon_grid = np.meshgrid(years, longitudes, indexing='ij')
+        year_grid = year_grid.ravel()
+        lon_grid = lon_grid.ravel()
+        
+        # 平均太陽が目標黄経に達する日時（J2000.0の年初から1年以内に収まる）
+        offset = ((lon_grid - self.MEAN_LONGITUDE_J2000) % 360.0) / self.MEAN_SOLAR_MOTION
+        estimate = 2451545.0 + offset + (year_grid - 2000) * self.TROPICAL_YEAR
+        
+        return lon_grid, estimate - margin_days, estimate + margin_days
+    
     def to_jst_datetime(self, time):
         """
         Skyfield Time objectを日本時間のdatetimeに変換
@@ -74,4 +524,44 @@ class AstronomicalCalculator:
             datetime: 日本時間のdatetime（タイムゾーン付き）
         """
         dt_utc = time.utc_datetime()
-        return dt_utc.replace(tzinfo=timezone.utc).astimezone(self.tz_jst)
\ No newline at end of file
+        return dt_utc.replace(tzinfo=timezone.utc).astimezone(self.tz_jst)
+    
+    def to_jst_datetime64(self, time):
+        """
+        Skyfield Time object（配列可）を日本標準時のdatetime64に一括で変換
+        
+        UTCの暦日と時刻を配列のまま組み立て、+9時間を配列演算で加える。
+        秒はマイクロ秒に丸める（utc_datetime()と同じ精度）。
+        
+        Parameters:
+            time: Skyfield Time object（スカラーまたは配列）
+        
+        Returns:
+            np.datetime64 or np.ndarray: 日本標準時の日時（datetime64[us]、タイムゾーンなし）
+        """
+        year, month, day, hour, minute, second = np.asarray(time.utc).reshape(6, -1)
+        days = (
+            (year.astype(np.int64) - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+            + (month.astype(np.int64) - 1)
+        ).astype('datetime64[D]') + (day.astype(np.int64) - 1)
+        microseconds = (
+            (hour.astype(np.int64) * 60 + minute.astype(np.int64)) * 60_000_000
+            + np.floor(second * 1e6 + 0.5).astype(np.int64)
+        )
+        result = days.astype('datetime64[us]') + microseconds.astype('timedelta64[us]') + self.JST_OFFSET
+        return result.reshape(np.shape(time.tt))[()]
+    
+    def to_jst_datetimes(self, time):
+        """
+        Skyfield Time object（配列可）を日本標準時のdatetimeのリストに一括で変換
+        
+        Parameters:
+            time: Skyfield Time object（スカラーまたは配列）
+        
+        Returns:
+            List[datetime]: 日本標準時のdatetime（タイムゾーン JST=UTC+9 付き）。
+                            スカラーの場合はdatetimeひとつ
+        """
+        values = np.atleast_1d(self.to_jst_datetime64(time)).astype('datetime64[us]').tolist()
+        datetimes = [dt.replace(tzinfo=self.JST) for dt in values]
+        return datetimes if np.ndim(time.tt) else datetimes[0]
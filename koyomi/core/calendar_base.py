@@ -1,17 +1,56 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Union, Optional
-from .astronomical import AstronomicalCalculator
-from skyfield.api import utc  # 追加: UTCタイムゾーンのインポート
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Union, Optional, Tuple
+from .event_cache import EventCache
 
 class CalendarBase:
     """暦計算の基本機能を提供する基底クラス"""
     
-    def __init__(self, delta_t: Optional[float] = None):
+    def __init__(self, delta_t=None):
         """
         Parameters:
-            delta_t (float, optional): ΔT値（秒）
+            delta_t (float | str | DeltaTModel, optional): ΔT値（秒）、ΔTモデル名
+                （'skyfield'・'espenak-meeus'）またはDeltaTModel。Noneはskyfieldの表
         """
-        self.astronomical = AstronomicalCalculator(delta_t)
+        self.delta_t = delta_t
+        # エフェメリスの名前またはファイル名（Noneの場合はEphemerisRegistry.default_ephemeris）
+        self.ephemeris = None
+        self._ephemeris_file = None
+        self._astronomical = None
+    
+    @property
+    def astronomical(self):
+        """
+        天文計算クラス（AstronomicalCalculator）
+        
+        初めて参照したときにskyfieldとエフェメリスを読み込む。干支などの算術だけの
+        計算クラスは参照しないため、skyfieldを読み込まずに使える。
+        """
+        if self._astronomical is None:
+            from .astronomical import AstronomicalCalculator
+            self._astronomical = AstronomicalCalculator(
+                self.delta_t, self._ephemeris_file or self.ephemeris
+            )
+        return self._astronomical
+    
+    def _check_years(self, start_year: int, end_year: int) -> None:
+        """
+        対象期間（年）がエフェメリスの対応期間に含まれることを、計算を始める前に確認
+        
+        期間ごとにファイルが分かれたエフェメリス（de441）では、対象期間に対応する
+        ファイルを使うように天文計算クラスを切り替える。
+        
+        Parameters:
+            start_year (int): 最初の年
+            end_year (int): 最後の年（含む）
+        
+        Raises:
+            ValueError: 対応期間外の場合
+        """
+        from .ephemeris import EphemerisRegistry
+        ephemeris_file = EphemerisRegistry.resolve(self.ephemeris, start_year, end_year)
+        if self._astronomical is not None and self._astronomical.ephemeris_file != ephemeris_file:
+            self._astronomical = None
+        self._ephemeris_file = ephemeris_file
     
     def _create_result(
         self,
@@ -26,7 +65,7 @@ class CalendarBase:
             identifier (str): イベントの識別子
             dt (datetime): イベントの日時
             event_name (str, optional): イベントの名称
-            
+        
         Returns:
             Dict: 以下の形式の辞書
             {
@@ -58,12 +97,12 @@ class CalendarBase:
             year (int): 対象年
             months_before (int): 前年からの月数
             months_after (int): 翌年への月数
-            
+        
         Returns:
             tuple: (開始時刻のTime object, 終了時刻のTime object)
         """
         # 開始時刻（UTCでの1月1日）
-        start_date = datetime(year, 1, 1, tzinfo=utc)  # 修正: ts.utc → utc
+        start_date = datetime(year, 1, 1, tzinfo=timezone.utc)  # 修正: ts.utc → utc
         if months_before > 0:
             # monthsだけ前の月の1日に移動
             year_diff, month = divmod(months_before, 12)
@@ -72,27 +111,70 @@ class CalendarBase:
                 month = 12
             year_start = year - year_diff - 1
             month_start = 12 - month + 1
-            start_date = datetime(year_start, month_start, 1, tzinfo=utc)  # 修正: ts.utc → utc
+            start_date = datetime(year_start, month_start, 1, tzinfo=timezone.utc)  # 修正: ts.utc → utc
         
         # 終了時刻（翌年以降の1月1日）
-        end_date = datetime(year + 1, 1, 1, tzinfo=utc)  # 修正: ts.utc → utc
+        end_date = datetime(year + 1, 1, 1, tzinfo=timezone.utc)  # 修正: ts.utc → utc
         if months_after > 0:
             # monthsだけ後の月の1日に移動
             year_diff, month = divmod(months_after, 12)
-            end_date = datetime(year + year_diff + 1, month + 1, 1, tzinfo=utc)  # 修正: ts.utc → utc
+            end_date = datetime(year + year_diff + 1, month + 1, 1, tzinfo=timezone.utc)  # 修正: ts.utc → utc
         
         return (
             self.astronomical.ts.from_datetime(start_date),
             self.astronomical.ts.from_datetime(end_date)
         )
-
+    
+    def _load_cached_events(self, event_type: str, years: Iterable[int]) -> Dict[int, List[Tuple]]:
+        """
+        有効なキャッシュから複数年のイベントの瞬間を読み出す
+        
+        Parameters:
+            event_type (str): イベントの種類
+            years (Iterable[int]): 対象年
+        
+        Returns:
+            Dict[int, List[Tuple]]: 保存されていた年ごとの (ラベル, Time object) のリスト。
+                                    キャッシュが無効の場合は空の辞書
+        """
+        cache = EventCache.active()
+        if cache is None:
+            return {}
+        stored = cache.get_years(
+            event_type, years, self.astronomical.delta_t, self.astronomical.ephemeris_file
+        )
+        ts = self.astronomical.ts
+        return {
+            year: [(label, ts.tt_jd(whole, fraction)) for label, whole, fraction in events]
+            for year, events in stored.items()
+        }
+    
+    def _store_cached_events(self, event_type: str, events: Dict[int, List[Tuple]]) -> None:
+        """
+        有効なキャッシュに複数年のイベントの瞬間を保存（キャッシュが無効の場合は何もしない）
+        
+        Parameters:
+            event_type (str): イベントの種類
+            events (Dict[int, List[Tuple]]): 年ごとの (ラベル, Time object) のリスト
+        """
+        cache = EventCache.active()
+        if cache is None:
+            return
+        payload = {
+            year: [[label, float(time.whole), float(time.tt_fraction)] for label, time in items]
+            for year, items in events.items()
+        }
+        cache.put_years(
+            event_type, payload, self.astronomical.delta_t, self.astronomical.ephemeris_file
+        )
+    
     def calculate(self, year: int) -> Union[Dict, List[Dict]]:
         """
         暦イベントを計算する抽象メソッド
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Union[Dict, List[Dict]]: 計算結果
         """
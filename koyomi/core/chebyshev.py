@@ -0,0 +1,270 @@
+import argparse
+import os
+import threading
+from typing import Dict, Optional
+import numpy as np
+from numpy.polynomial import chebyshev
+
+
+class SolarLongitudeChebyshev:
+    """
+    太陽視黄経の区分チェビシェフ近似
+    
+    エフェメリスから求めた太陽の視黄経（真黄道・春分点基準）を一定日数ごとの区間に分け、
+    各区間をチェビシェフ多項式で近似する。評価はNumPyのみで行い、skyfieldは使用しない。
+    
+    既定の設定（32日区間・16次）でDE421の全期間に当てはめた場合、skyfieldとの差は
+    最大でおよそ0.005秒角（時刻に換算して約0.1秒）。実際の最大誤差は当てはめ時に
+    区間の節点以外の点で検証し、max_error に記録される。
+    """
+    
+    # 当てはめの既定値
+    SEGMENT_DAYS = 32.0
+    DEGREE = 16
+    # 最大誤差の検証に使う、区間あたりの点数
+    VALIDATION_POINTS = 16
+    
+    # 係数ファイルを保存・再利用するディレクトリ（Noneの場合はファイルを読み書きしない）
+    cache_dir: Optional[str] = None
+    
+    _cache: Dict[str, 'SolarLongitudeChebyshev'] = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, start_jd: float, segment_days: float, coefficients: np.ndarray,
+                 max_error: Optional[float] = None, ephemeris: str = ''):
+        """
+        Parameters:
+            start_jd (float): 最初の区間の開始時刻（TTユリウス日）
+            segment_days (float): 区間の長さ（日）
+            coefficients (np.ndarray): 区間ごとの係数（区間数×(次数+1)）
+            max_error (float, optional): skyfieldに対する最大誤差（度）
+            ephemeris (str): 当てはめに使ったエフェメリスの名前
+        """
+        self.start_jd = float(start_jd)
+        self.segment_days = float(segment_days)
+        self.coefficients = np.asarray(coefficients, dtype=float)
+        self.max_error = max_error
+        self.ephemeris = ephemeris
+    
+    @property
+    def end_jd(self) -> float:
+        """近似の有効期間の終了時刻（TTユリウス日）"""
+        return self.start_jd + self.segment_days * len(self.coefficients)
+    
+    @classmethod
+    def fit(cls, calculator, start_jd: Optional[float] = None, end_jd: Optional[float] = None,
+            segment_days: float = SEGMENT_DAYS, degree: int = DEGREE) -> 'SolarLongitudeChebyshev':
+        """
+        エフェメリスから太陽視黄経を評価し、区分チェビシェフ多項式を当てはめる
+        
+        Parameters:
+            calculator (AstronomicalCalculator): 黄経の評価に使う天文計算クラス
+            start_jd (float, optional): 開始時刻（TTユリウス日）。省略時はエフェメリスの収録開始
+            end_jd (float, optional): 終了時刻（TTユリウス日）。省略時はエフェメリスの収録終了
+            segment_days (float): 区間の長さ（日）
+            degree (int): 多項式の次数
+        
+        Returns:
+            SolarLongitudeChebyshev: 当てはめ結果
+        """
+        eph_start, eph_end = cls._ephemeris_range(calculator.eph)
+        # 光行時間の補正のため、収録範囲の両端から1日ずつ内側を使う
+        start_jd = eph_start + 1.0 if start_jd is None else start_jd
+        end_jd = eph_end - 1.0 if end_jd is None else end_jd
+        n_segments = int((end_jd - start_jd) // segment_days)
+        if n_segments < 1:
+            raise ValueError("当てはめ期間が区間の長さより短くなっています")
+        
+        segment_starts = start_jd + segment_days * np.arange(n_segments)
+        
+        # チェビシェフ節点（第1種）で黄経を評価し、区間内で連続になるよう360度の折り返しを戻す
+        n_nodes = degree + 1
+        nodes = np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes)
+        longitude = cls._evaluate_reference(calculator, segment_starts, segment_days, nodes)
+        longitude = np.unwrap(longitude, period=360.0, axis=1)
+        coefficients = chebyshev.chebfit(nodes, longitude.T, degree).T
+        
+        model = cls(start_jd, segment_days, coefficients, ephemeris=cls._ephemeris_name(calculator))
+        
+        # 節点以外の点でskyfieldと比較し、最大誤差を記録する
+        points = np.linspace(-1.0, 1.0, cls.VALIDATION_POINTS + 2)[1:-1]
+        reference = cls._evaluate_reference(calculator, segment_starts, segment_days, points)
+        tt = segment_starts[:, None] + segment_days * (points[None, :] + 1.0) / 2.0
+        diff = (model.evaluate(tt) - reference + 180.0) % 360.0 - 180.0
+        model.max_error = float(np.max(np.abs(diff)))
+        
+        return model
+    
+    @staticmethod
+    def _evaluate_reference(calculator, segment_starts: np.ndarray, segment_days: float,
+                            points: np.ndarray) -> np.ndarray:
+        """区間ごとの正規化座標 points における黄経をskyfieldで評価"""
+        tt = segment_starts[:, None] + segment_days * (points[None, :] + 1.0) / 2.0
+        longitude = calculator.get_solar_longitude(calculator.ts.tt_jd(tt.ravel()))
+        return np.asarray(longitude).reshape(tt.shape)
+    
+    @staticmethod
+    def _ephemeris_range(eph) -> tuple:
+        """エフェメリスの全セグメントに共通する収録期間（TTユリウス日）"""
+        starts = [segment.spk_segment.start_jd for segment in eph.segments]
+        ends = [segment.spk_segment.end_jd for segment in eph.segments]
+        return max(starts), min(ends)
+    
+    @staticmethod
+    def _ephemeris_name(calculator) -> str:
+        """エフェメリスのファイル名（拡張子なし）"""
+        filename = getattr(calculator, 'ephemeris_file', 'de421.bsp')
+        return os.path.splitext(os.path.basename(filename))[0]
+    
+    def evaluate(self, tt) -> np.ndarray:
+        """
+        太陽の視黄経を評価
+        
+        Parameters:
+            tt: TTユリウス日（スカラー・配列）またはSkyfield Time object
+        
+        Returns:
+            np.ndarray: 太陽の視黄経（度、0〜360）。入力と同じ形状
+        """
+        tt = np.asarray(getattr(tt, 'tt', tt), dtype=float)
+        position = (tt - self.start_jd) / self.segment_days
+        index = np.floor(position).astype(int)
+        if np.any((index < 0) | (index >= len(self.coefficients))):
+            # 終了時刻ちょうどは最後の区間に含める
+            index = np.where(tt == self.end_jd, len(self.coefficients) - 1, index)
+            if np.any((index < 0) | (index >= len(self.coefficients))):
+                raise ValueError("チェビシェフ近似の有効期間外の時刻が指定されています")
+        x = 2.0 * (position - index) - 1.0
+        
+        # Clenshawの漸化式を全ての時刻について同時に計算
+        coefficients = self.coefficients[index]
+        b1 = np.zeros_like(x)
+        b2 = np.zeros_like(x)
+        for k in range(coefficients.shape[-1] - 1, 0, -1):
+            b1, b2 = 2.0 * x * b1 - b2 + coefficients[..., k], b1
+        value = x * b1 - b2 + coefficients[..., 0]
+        
+        return value % 360.0
+    
+    def save(self, path: str) -> None:
+        """
+        係数をNumPyファイル（.npz）に保存
+        
+        Parameters:
+            path (str): 保存先のパス
+        """
+        np.savez_compressed(
+            path,
+            start_jd=self.start_jd,
+            segment_days=self.segment_days,
+            coefficients=self.coefficients,
+            max_error=np.nan if self.max_error is None else self.max_error,
+            ephemeris=self.ephemeris
+        )
+    
+    @classmethod
+    def load(cls, path: str) -> 'SolarLongitudeChebyshev':
+        """
+        保存された係数を読み込む
+        
+        Parameters:
+            path (str): .npzファイルのパス
+        
+        Returns:
+            SolarLongitudeChebyshev: 読み込んだ近似
+        """
+        with np.load(path) as data:
+            max_error = float(data['max_error'])
+            return cls(
+                float(data['start_jd']),
+                float(data['segment_days']),
+                data['coefficients'],
+                None if np.isnan(max_error) else max_error,
+                str(data['ephemeris'])
+            )
+    
+    @staticmethod
+    def default_path(ephemeris_file: str) -> str:
+        """エフェメリスに対応する係数ファイルの既定のパス"""
+        name = os.path.splitext(os.path.basename(ephemeris_file))[0]
+        return f"sun_longitude_{name}.npz"
+    
+    @classmethod
+    def set_cache_dir(cls, directory: Optional[str]) -> None:
+        """
+        for_calculatorが係数ファイルを保存・再利用するディレクトリを設定
+        
+        Parameters:
+            directory (str, optional): ディレクトリ（存在しない場合は作成する）。
+                                       Noneの場合はファイルを読み書きしない
+        """
+        cls.cache_dir = directory
+    
+    @classmethod
+    def for_calculator(cls, calculator, path: Optional[str] = None) -> 'SolarLongitudeChebyshev':
+        """
+        天文計算クラスのエフェメリスに対応する近似を取得
+        
+        pathを指定した場合、またはset_cache_dirでディレクトリを設定した場合は、
+        係数ファイルがあれば読み込み、なければ当てはめて保存する。どちらもない場合は
+        当てはめるだけでファイルは作らない。取得した近似はプロセス内で共有される。
+        
+        Parameters:
+            calculator (AstronomicalCalculator): 天文計算クラス
+            path (str, optional): 係数ファイルのパス
+        
+        Returns:
+            SolarLongitudeChebyshev: 太陽視黄経の近似
+        """
+        ephemeris_file = getattr(calculator, 'ephemeris_file', 'de421.bsp')
+        if path is None and cls.cache_dir is not None:
+            path = os.path.join(cls.cache_dir, cls.default_path(ephemeris_file))
+        key = path or ephemeris_file
+        model = cls._cache.get(key)
+        if model is not None:
+            return model
+        with cls._lock:
+            model = cls._cache.get(key)
+            if model is None:
+                if path is not None and os.path.exists(path):
+                    model = cls.load(path)
+                else:
+                    model = cls.fit(calculator)
+                    if path is not None:
+                        directory = os.path.dirname(path)
+                        if directory:
+                            os.makedirs(directory, exist_ok=True)
+                        model.save(path)
+                cls._cache[key] = model
+            return model
+
+
+def main(argv=None):
+    """係数ファイルを作成するコマンドラインツール"""
+    from .astronomical import AstronomicalCalculator
+    
+    parser = argparse.ArgumentParser(
+        description='エフェメリスから太陽視黄経のチェビシェフ近似を作成する'
+    )
+    parser.add_argument('--ephemeris', default='de421.bsp', help='エフェメリスのファイル名')
+    parser.add_argument('--output', help='出力ファイル（省略時は sun_longitude_<エフェメリス名>.npz）')
+    parser.add_argument('--segment-days', type=float, default=SolarLongitudeChebyshev.SEGMENT_DAYS,
+                        help='区間の長さ（日）')
+    parser.add_argument('--degree', type=int, default=SolarLongitudeChebyshev.DEGREE,
+                        help='多項式の次数')
+    args = parser.parse_args(argv)
+    
+    calculator = AstronomicalCalculator(ephemeris_file=args.ephemeris)
+    model = SolarLongitudeChebyshev.fit(
+        calculator, segment_days=args.segment_days, degree=args.degree
+    )
+    output = args.output or SolarLongitudeChebyshev.default_path(args.ephemeris)
+    model.save(output)
+    
+    print(f"{output} を保存しました")
+    print(f"区間数: {len(model.coefficients)}  次数: {model.coefficients.shape[1] - 1}")
+    print(f"最大誤差: {model.max_error * 3600:.4f}秒角")
+
+
+if __name__ == "__main__":
+    main()
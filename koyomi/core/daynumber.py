@@ -0,0 +1,251 @@
+"""
+通日（日の番号）による日付計算
+
+日付は date.toordinal() と同じ通日（西暦1年1月1日 = 1、先発グレゴリオ暦）の
+整数で表し、配列のまま変換・演算する。通日は0以下にも延長しており、ユリウス通日
+（JDN）とは JDN = 通日 + JDN_OFFSET の関係にある。年は天文学的な年の数え方
+（紀元前1年 = 0年、紀元前2年 = -1年）を使う。
+
+date・datetime64[D] への変換は date・datetime64 が表せる範囲（西暦1〜9999年）に限られる。
+それ以外の日付やユリウス暦の日付は、年・月・日の整数配列との相互変換を使う。
+"""
+from datetime import date
+from typing import List, Tuple, Union
+import numpy as np
+
+# 1970年1月1日（datetime64の起点）の通日
+UNIX_EPOCH_ORDINAL = 719163
+# ユリウス通日と通日の差（西暦1年1月1日のJDNは1721426）
+JDN_OFFSET = 1721425
+
+
+def to_ordinals(dates) -> np.ndarray:
+    """
+    日付の配列を通日（date.toordinal()）の配列に変換
+    
+    Parameters:
+        dates: date・datetime64[D]・通日のいずれか（スカラーまたは配列）
+    
+    Returns:
+        np.ndarray: 通日（int64）
+    """
+    if isinstance(dates, date):
+        return np.array(dates.toordinal(), dtype=np.int64)
+    values = np.asarray(dates)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[D]').astype(np.int64) + UNIX_EPOCH_ORDINAL
+    if values.dtype == object:
+        return np.array([d.toordinal() for d in values.ravel()], dtype=np.int64).reshape(values.shape)
+    return values.astype(np.int64)
+
+
+def to_datetime64(ordinals) -> np.ndarray:
+    """
+    通日の配列をdatetime64[D]の配列に変換
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは配列）
+    
+    Returns:
+        np.ndarray: datetime64[D]
+    """
+    return (np.asarray(ordinals, dtype=np.int64) - UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
+
+
+def to_dates(ordinals) -> Union[date, List[date]]:
+    """
+    通日の配列をdateのリストに変換
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは1次元配列）
+    
+    Returns:
+        date or List[date]: スカラーの場合はdate
+    """
+    return to_datetime64(ordinals).tolist()
+
+
+def weekdays(ordinals) -> np.ndarray:
+    """
+    曜日（date.weekday()と同じく月曜 = 0〜日曜 = 6）
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは配列）
+    """
+    return (np.asarray(ordinals, dtype=np.int64) - 1) % 7
+
+
+def to_jdn(ordinals) -> np.ndarray:
+    """通日をユリウス通日（正午起点の日の番号）に変換"""
+    return np.asarray(ordinals, dtype=np.int64) + JDN_OFFSET
+
+
+def from_jdn(jdn) -> np.ndarray:
+    """ユリウス通日を通日に変換"""
+    return np.asarray(jdn, dtype=np.int64) - JDN_OFFSET
+
+
+def _march_based(year, month) -> Tuple[np.ndarray, np.ndarray]:
+    """3月始まりの年・月（1月・2月を前年の13・14番目の月として扱う）"""
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    a = (14 - month) // 12
+    return year + 4800 - a, month + 12 * a - 3
+
+
+def gregorian_to_ordinals(year, month, day) -> np.ndarray:
+    """
+    先発グレゴリオ暦の年・月・日を通日に変換（0年以前も可）
+    
+    Parameters:
+        year: 年（天文学的な年の数え方）
+        month: 月（1〜12）
+        day: 日
+    
+    Returns:
+        np.ndarray: 通日（int64）
+    """
+    y, m = _march_based(year, month)
+    jdn = (
+        np.asarray(day, dtype=np.int64) + (153 * m + 2) // 5
+        + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    )
+    return from_jdn(jdn)
+
+
+def julian_to_ordinals(year, month, day) -> np.ndarray:
+    """
+    ユリウス暦の年・月・日を通日に変換（0年以前も可）
+    
+    Parameters:
+        year: 年（天文学的な年の数え方）
+        month: 月（1〜12）
+        day: 日
+    
+    Returns:
+        np.ndarray: 通日（int64）
+    """
+    y, m = _march_based(year, month)
+    jdn = np.asarray(day, dtype=np.int64) + (153 * m + 2) // 5 + 365 * y + y // 4 - 32083
+    return from_jdn(jdn)
+
+
+def _from_march_based(c, base_year) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """3月始まりの年の中の日数から年・月・日を求める"""
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = base_year + d - 4800 + m // 10
+    return year, month, day
+
+
+def ordinals_to_gregorian(ordinals) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    通日を先発グレゴリオ暦の年・月・日に変換（0年以前も可）
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは配列）
+    
+    Returns:
+        tuple: (年, 月, 日) のint64配列
+    """
+    a = to_jdn(ordinals) + 32044
+    b = (4 * a + 3) // 146097
+    c = a - 146097 * b // 4
+    return _from_march_based(c, 100 * b)
+
+
+def ordinals_to_julian(ordinals) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    通日をユリウス暦の年・月・日に変換（0年以前も可）
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは配列）
+    
+    Returns:
+        tuple: (年, 月, 日) のint64配列
+    """
+    return _from_march_based(to_jdn(ordinals) + 32082, 0)
+
+
+def year_ordinals(year: int) -> np.ndarray:
+    """指定された年（グレゴリオ暦）の全ての日の通日"""
+    return np.arange(gregorian_to_ordinals(year, 1, 1), gregorian_to_ordinals(year + 1, 1, 1))
+
+
+def month_ordinals(year: int, month: int) -> np.ndarray:
+    """指定された年月（グレゴリオ暦）の全ての日の通日"""
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return np.arange(
+        gregorian_to_ordinals(year, month, 1), gregorian_to_ordinals(next_year, next_month, 1)
+    )
+
+
+def iso_weeks(ordinals) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ISO 8601の年と週番号（date.isocalendar()と同じ）
+    
+    週番号は、その週の木曜日が属する年の第何週か。
+    
+    Parameters:
+        ordinals: 通日（スカラーまたは配列）
+    
+    Returns:
+        tuple: (ISO年, 週番号) のint64配列
+    """
+    thursdays = np.asarray(ordinals, dtype=np.int64) + 3 - weekdays(ordinals)
+    iso_years, _, _ = ordinals_to_gregorian(thursdays)
+    return iso_years, (thursdays - gregorian_to_ordinals(iso_years, 1, 1)) // 7 + 1
+
+
+def nth_weekday_ordinals(year, month, nth, weekday) -> np.ndarray:
+    """
+    指定された月の第n曜日の通日
+    
+    月の1日の曜日から最初の該当日を求め、7日ずつ進める。nが負の場合は月末から数える
+    （-1 = 最終）。その月に第n曜日がない場合は、翌月（前月）にはみ出した日を返す。
+    
+    Parameters:
+        year: 年
+        month: 月（1〜12）
+        nth: 第何週か（1〜5、または-1〜-5）
+        weekday: 曜日（月曜 = 0〜日曜 = 6）
+    
+    Returns:
+        np.ndarray: 通日（int64）
+    """
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    nth = np.asarray(nth, dtype=np.int64)
+    first = gregorian_to_ordinals(year, month, 1)
+    last = gregorian_to_ordinals(year + month // 12, month % 12 + 1, 1) - 1
+    from_first = first + (weekday - weekdays(first)) % 7 + 7 * (nth - 1)
+    from_last = last - (weekdays(last) - weekday) % 7 + 7 * (nth + 1)
+    return np.where(nth > 0, from_first, from_last)
+
+
+def weekdays_in_years(weekday: int, start_year: int, end_year: int) -> Tuple[np.ndarray, ...]:
+    """
+    指定された期間の全ての曜日（例えば全ての日曜日）
+    
+    期間の最初の該当日から7日おきに並べ、月・第n曜日・ISO週番号を配列のまま求める。
+    
+    Parameters:
+        weekday (int): 曜日（月曜 = 0〜日曜 = 6）
+        start_year (int): 開始年
+        end_year (int): 終了年（含む）
+    
+    Returns:
+        tuple: (通日, 月, 第n曜日, ISO週番号) のint64配列
+    """
+    first = int(gregorian_to_ordinals(start_year, 1, 1))
+    ordinals = np.arange(
+        first + (weekday - int(weekdays(first))) % 7,
+        int(gregorian_to_ordinals(end_year + 1, 1, 1)),
+        7
+    )
+    _, months, days = ordinals_to_gregorian(ordinals)
+    _, weeks = iso_weeks(ordinals)
+    return ordinals, months, (days - 1) // 7 + 1, weeks
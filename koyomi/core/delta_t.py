@@ -0,0 +1,203 @@
+import hashlib
+from typing import Callable, Dict, Sequence, Union
+import numpy as np
+
+# J2000.0（TTユリウス日）とユリウス年の日数（TTユリウス日から年への換算に使う）
+J2000 = 2451545.0
+JULIAN_YEAR = 365.25
+
+
+def tt_to_decimal_year(tt) -> np.ndarray:
+    """TTユリウス日を年（小数）に換算"""
+    return 2000.0 + (np.asarray(tt, dtype=float) - J2000) / JULIAN_YEAR
+
+
+class DeltaTModel:
+    """
+    ΔT（TT − UT1）のモデルの基底クラス
+    
+    モデルはTTユリウス日の配列を受け取り、ΔT（秒）の配列を返す呼び出し可能な
+    オブジェクトで、skyfieldのTimescaleにそのまま渡して一括で評価される。
+    key が同じモデルは同じタイムスケールを共有する（EphemerisRegistry参照）。
+    """
+    
+    # タイムスケールの共有やキャッシュの識別に使う文字列
+    key = ''
+    
+    def __call__(self, tt) -> np.ndarray:
+        """
+        ΔTを一括で評価
+        
+        Parameters:
+            tt: TTユリウス日（スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: ΔT（秒）
+        """
+        raise NotImplementedError("Subclasses must implement __call__()")
+    
+    def build_timescale(self):
+        """
+        このモデルを使うskyfieldのTimescaleを作成
+        
+        うるう秒の表はskyfield内蔵のものを使う。
+        """
+        from skyfield.api import load
+        from skyfield.timelib import Timescale
+        builtin = load.timescale()
+        return Timescale(self, builtin.leap_dates, builtin.leap_offsets)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.key!r})"
+
+
+class SkyfieldDeltaT(DeltaTModel):
+    """skyfield内蔵のΔTの表（IERSの観測値と長期の推定値）"""
+    
+    key = 'skyfield'
+    
+    def __init__(self):
+        self._function = None
+    
+    def __call__(self, tt) -> np.ndarray:
+        if self._function is None:
+            self._function = self.build_timescale().delta_t_function
+        return np.asarray(self._function(np.asarray(tt, dtype=float)))
+    
+    def build_timescale(self):
+        from skyfield.api import load
+        return load.timescale()
+
+
+class ConstantDeltaT(DeltaTModel):
+    """全ての時刻で一定のΔT"""
+    
+    def __init__(self, seconds: float):
+        """
+        Parameters:
+            seconds (float): ΔT（秒）
+        """
+        self.seconds = float(seconds)
+        self.key = repr(self.seconds)
+    
+    def __call__(self, tt) -> np.ndarray:
+        return np.full(np.shape(tt), self.seconds)
+    
+    def build_timescale(self):
+        from skyfield.api import load
+        return load.timescale(delta_t=self.seconds)
+
+
+class EspenakMeeusDeltaT(DeltaTModel):
+    """
+    Espenak・MeeusによるΔTの多項式近似（NASA Five Millennium Canon of Solar Eclipses）
+    
+    -1999年〜3000年の区間ごとの多項式で、1900年〜2050年の誤差は数秒以内。
+    月の永年加速の補正は行わない。
+    """
+    
+    key = 'espenak-meeus'
+    
+    # 区間の開始年と、その区間の多項式（年を引数とする）
+    SEGMENTS = (
+        (-np.inf, lambda y: -20 + 32 * ((y - 1820) / 100) ** 2),
+        (-500, lambda y: np.polyval(
+            [0.0090316521, 0.022174192, -0.1798452, -5.952053, 33.78311, -1014.41, 10583.6], y / 100)),
+        (500, lambda y: np.polyval(
+            [0.0083572073, -0.005050998, -0.8503463, 0.319781, 71.23472, -556.01, 1574.2], (y - 1000) / 100)),
+        (1600, lambda y: np.polyval([1 / 7129, -0.01532, -0.9808, 120], y - 1600)),
+        (1700, lambda y: np.polyval([-1 / 1174000, 0.00013336, -0.0059285, 0.1603, 8.83], y - 1700)),
+        (1800, lambda y: np.polyval(
+            [0.000000000875, -0.0000001699, 0.0000121272, -0.00037436, 0.0041116, 0.0068612, -0.332447, 13.72],
+            y - 1800)),
+        (1860, lambda y: np.polyval([1 / 233174, -0.0004473624, 0.01680668, -0.251754, 0.5737, 7.62], y - 1860)),
+        (1900, lambda y: np.polyval([-0.000197, 0.0061966, -0.0598939, 1.494119, -2.79], y - 1900)),
+        (1920, lambda y: np.polyval([0.0020936, -0.076100, 0.84493, 21.20], y - 1920)),
+        (1941, lambda y: np.polyval([1 / 2547, -1 / 233, 0.407, 29.07], y - 1950)),
+        (1961, lambda y: np.polyval([-1 / 718, -1 / 260, 1.067, 45.45], y - 1975)),
+        (1986, lambda y: np.polyval(
+            [0.00002373599, 0.000651814, 0.0017275, -0.060374, 0.3345, 63.86], y - 2000)),
+        (2005, lambda y: np.polyval([0.005589, 0.32217, 62.92], y - 2000)),
+        (2050, lambda y: -20 + 32 * ((y - 1820) / 100) ** 2 - 0.5628 * (2150 - y)),
+        (2150, lambda y: -20 + 32 * ((y - 1820) / 100) ** 2),
+    )
+    
+    def __call__(self, tt) -> np.ndarray:
+        return self.at_years(tt_to_decimal_year(tt))
+    
+    def at_years(self, years) -> np.ndarray:
+        """
+        年（小数）の配列についてΔTを一括で評価
+        
+        Parameters:
+            years: 年（小数、スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: ΔT（秒）
+        """
+        years = np.asarray(years, dtype=float)
+        starts = np.array([start for start, _ in self.SEGMENTS])
+        segment = np.searchsorted(starts, years, side='right') - 1
+        result = np.empty_like(years)
+        for i in np.unique(segment):
+            mask = segment == i
+            result[mask] = self.SEGMENTS[i][1](years[mask])
+        return result
+
+
+class SeriesDeltaT(DeltaTModel):
+    """
+    利用者が与えた (年, ΔT) の系列を線形補間するモデル
+    
+    系列の範囲外では両端の値をそのまま使う。
+    """
+    
+    def __init__(self, years: Sequence[float], values: Sequence[float]):
+        """
+        Parameters:
+            years (Sequence[float]): 年（小数、昇順）
+            values (Sequence[float]): 各年のΔT（秒）
+        """
+        self.years = np.asarray(years, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        if self.years.shape != self.values.shape or self.years.size == 0:
+            raise ValueError("年とΔTの系列は同じ長さで1件以上必要です")
+        if np.any(np.diff(self.years) <= 0):
+            raise ValueError("年は昇順に並べてください")
+        digest = hashlib.sha1(self.years.tobytes() + self.values.tobytes()).hexdigest()
+        self.key = f"series:{digest[:16]}"
+    
+    def __call__(self, tt) -> np.ndarray:
+        return np.interp(tt_to_decimal_year(tt), self.years, self.values)
+
+
+# 名前で指定できるΔTモデル
+DELTA_T_MODELS: Dict[str, Callable[[], DeltaTModel]] = {
+    'skyfield': SkyfieldDeltaT,
+    'espenak-meeus': EspenakMeeusDeltaT,
+}
+
+DeltaTLike = Union[None, float, str, DeltaTModel]
+
+
+def resolve_delta_t(delta_t: DeltaTLike) -> DeltaTModel:
+    """
+    ΔTの指定をモデルに変換
+    
+    Parameters:
+        delta_t: None（skyfieldの表）、数値（一定のΔT、秒）、モデル名、またはDeltaTModel
+    
+    Returns:
+        DeltaTModel: ΔTのモデル
+    """
+    if delta_t is None:
+        return SkyfieldDeltaT()
+    if isinstance(delta_t, DeltaTModel):
+        return delta_t
+    if isinstance(delta_t, str):
+        if delta_t not in DELTA_T_MODELS:
+            raise ValueError(
+                f"未知のΔTモデルです: {delta_t}（{', '.join(DELTA_T_MODELS)} から選択）"
+            )
+        return DELTA_T_MODELS[delta_t]()
+    return ConstantDeltaT(delta_t)
@@ -0,0 +1,328 @@
+import argparse
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+from skyfield.api import load, load_file
+from jplephem.calendar import compute_calendar_date, compute_julian_date
+from jplephem.excerpter import write_excerpt
+from jplephem.spk import SPK
+from .delta_t import DeltaTLike, resolve_delta_t
+
+# 太陽・地球・月の位置計算に必要なSPKセグメントの目標天体
+# （3: 地球・月系重心、10: 太陽、399: 地球、301: 月）
+# 視位置の計算では木星・土星による光の屈折も補正するため、5・6の重心も含める
+SUN_EARTH_MOON_TARGETS = (3, 5, 6, 10, 399, 301)
+
+
+class EphemerisSpec:
+    """
+    エフェメリスのファイルと、暦の計算に使える期間（年単位）
+    
+    Attributes:
+        name (str): エフェメリスの名前（例: 'de440s'）
+        filename (str): ファイル名
+        start_year (int): 対応する最初の年
+        end_year (int): 対応する最後の年（含む）
+    """
+    
+    def __init__(self, name: str, filename: str, start_year: int, end_year: int):
+        self.name = name
+        self.filename = filename
+        self.start_year = start_year
+        self.end_year = end_year
+    
+    def covers(self, start_year: int, end_year: int) -> bool:
+        """指定された期間の全ての年に対応しているか"""
+        return self.start_year <= start_year and end_year <= self.end_year
+    
+    def __repr__(self) -> str:
+        return f"EphemerisSpec({self.name!r}, {self.start_year}〜{self.end_year}年)"
+
+
+# 名前で指定できるエフェメリス。DE441は期間で2つのファイルに分かれており、
+# 対象期間に応じてどちらか一方だけを読み込む（1969年は境界をまたぐため、de440sを使う）
+# 期間はSPKのセグメントが全体を含む年（de421: 1899-07-29〜2053-10-08、
+# de440s: 1849-12-26〜2150-01-22、de441: -13200-08-15〜17191-03-15）
+EPHEMERIDES: Dict[str, Tuple[EphemerisSpec, ...]] = {
+    'de421': (EphemerisSpec('de421', 'de421.bsp', 1900, 2052),),
+    'de440s': (EphemerisSpec('de440s', 'de440s.bsp', 1850, 2149),),
+    'de441': (
+        EphemerisSpec('de441_part-1', 'de441_part-1.bsp', -13199, 1968),
+        EphemerisSpec('de441_part-2', 'de441_part-2.bsp', 1970, 17190),
+    ),
+}
+
+
+def _spec_from_file(ephemeris_file: str) -> Optional[EphemerisSpec]:
+    """
+    カタログにないファイル（抜粋ファイルなど）の対応期間をSPKのセグメント情報から求める
+    
+    セグメントのデータは読み込まず、ファイル先頭の要約だけを参照する。
+    ファイルが存在しない場合はNone。
+    """
+    if not os.path.exists(ephemeris_file):
+        return None
+    spk = SPK.open(ephemeris_file)
+    try:
+        segments = [s for s in spk.segments if s.target in SUN_EARTH_MOON_TARGETS] or spk.segments
+        start_jd = max(segment.start_jd for segment in segments)
+        end_jd = min(segment.end_jd for segment in segments)
+    finally:
+        spk.close()
+    
+    # 年の全体を含む期間だけを対応期間とする
+    start_year, start_month, start_day = compute_calendar_date(int(start_jd + 0.5))
+    end_year, end_month, end_day = compute_calendar_date(int(end_jd - 0.5))
+    if (start_month, start_day) != (1, 1):
+        start_year += 1
+    if (end_month, end_day) != (12, 31):
+        end_year -= 1
+    name = os.path.splitext(os.path.basename(ephemeris_file))[0]
+    return EphemerisSpec(name, ephemeris_file, int(start_year), int(end_year))
+
+
+class EphemerisRegistry:
+    """
+    エフェメリスとタイムスケールをプロセス全体で共有するレジストリ
+    
+    エフェメリスはファイル名ごと、タイムスケールはΔTモデルごとに一度だけ読み込み、
+    以降は同じオブジェクトを全ての計算クラスで共有する。
+    
+    エフェメリスのデータはjplephemによってメモリマップされ、各セグメント（天体ごとの
+    チェビシェフ係数の表）は初めて位置を計算するときに対応付けられる。太陽・地球・月の
+    計算で使わない惑星のセグメントや、対象期間外のページは読み込まれない。
+    ワーカープロセスをforkする前に読み込んでおけば、各プロセスは同じページを共有する。
+    
+    エフェメリスはファイル名のほか、EPHEMERIDESの名前（'de421'・'de440s'・'de441'）でも
+    指定できる。resolveで対象期間に対応するファイルを選び、対応期間外なら計算を始める前に
+    ValueErrorを送出する。
+    """
+    
+    # ファイル名を指定しない場合に使うエフェメリス
+    default_ephemeris = 'de421.bsp'
+    
+    _lock = threading.Lock()
+    _ephemerides: Dict[str, object] = {}
+    _timescales: Dict[str, object] = {}
+    _load_counts = {'ephemeris': 0, 'timescale': 0}
+    
+    @classmethod
+    def set_default_ephemeris(cls, ephemeris_file: str) -> None:
+        """
+        ファイル名を指定しない計算クラスが使うエフェメリスを変更
+        
+        Parameters:
+            ephemeris_file (str): エフェメリスのファイル名またはパス
+                                  （extract_ephemeris_subsetで作成した抜粋ファイルなど）
+        """
+        cls.default_ephemeris = ephemeris_file
+    
+    @classmethod
+    def specs(cls, ephemeris: Optional[str] = None) -> Tuple[EphemerisSpec, ...]:
+        """
+        エフェメリスの名前またはファイル名に対応するファイルと対応期間の一覧を取得
+        
+        Parameters:
+            ephemeris (str, optional): 名前またはファイル名。Noneの場合は default_ephemeris
+        
+        Returns:
+            Tuple[EphemerisSpec, ...]: 対応期間の一覧。期間が分からないファイルは空
+        """
+        ephemeris = ephemeris or cls.default_ephemeris
+        if ephemeris in EPHEMERIDES:
+            return EPHEMERIDES[ephemeris]
+        for specs in EPHEMERIDES.values():
+            for spec in specs:
+                if ephemeris in (spec.name, spec.filename):
+                    return (spec,)
+        spec = _spec_from_file(ephemeris)
+        return (spec,) if spec is not None else ()
+    
+    @classmethod
+    def resolve(cls, ephemeris: Optional[str] = None, start_year: Optional[int] = None,
+                end_year: Optional[int] = None) -> str:
+        """
+        指定された期間の計算に使うエフェメリスのファイルを選ぶ
+        
+        Parameters:
+            ephemeris (str, optional): 名前またはファイル名。Noneの場合は default_ephemeris
+            start_year (int, optional): 対象期間の最初の年。Noneの場合は期間を確認しない
+            end_year (int, optional): 対象期間の最後の年（含む）。省略時はstart_yearと同じ
+        
+        Returns:
+            str: エフェメリスのファイル名。期間を指定しない場合、複数ファイルに分かれた
+                 エフェメリスは最も新しい期間のファイル
+        
+        Raises:
+            ValueError: 対象期間に対応するファイルがない場合
+        """
+        ephemeris = ephemeris or cls.default_ephemeris
+        specs = cls.specs(ephemeris)
+        if not specs:
+            return ephemeris
+        if start_year is None:
+            return specs[-1].filename
+        if end_year is None:
+            end_year = start_year
+        for spec in specs:
+            if spec.covers(start_year, end_year):
+                return spec.filename
+        ranges = '、'.join(f"{spec.name}: {spec.start_year}〜{spec.end_year}年" for spec in specs)
+        raise ValueError(
+            f"{start_year}〜{end_year}年はエフェメリス {ephemeris} の対応期間外です（{ranges}）"
+        )
+    
+    @classmethod
+    def get(cls, ephemeris_file: Optional[str] = None, delta_t: DeltaTLike = None) -> Tuple:
+        """
+        (エフェメリスファイル, ΔT) に対応するタイムスケールとエフェメリスを取得
+        
+        Parameters:
+            ephemeris_file (str, optional): エフェメリスのファイル名。Noneの場合は default_ephemeris
+            delta_t (float | str | DeltaTModel, optional): ΔT値（秒）またはΔTモデル。
+                Noneの場合はskyfieldのデフォルト値
+        
+        Returns:
+            tuple: (Timescale, エフェメリス)
+        """
+        return cls.get_timescale(delta_t), cls.get_ephemeris(ephemeris_file)
+    
+    @classmethod
+    def get_ephemeris(cls, ephemeris_file: Optional[str] = None):
+        """
+        エフェメリスを取得（未読み込みの場合のみファイルを読み込む）
+        
+        Parameters:
+            ephemeris_file (str, optional): エフェメリスのファイル名または名前。
+                Noneの場合は default_ephemeris
+        
+        Returns:
+            SpiceKernel: 共有されるエフェメリス
+        """
+        ephemeris_file = ephemeris_file or cls.default_ephemeris
+        if ephemeris_file in EPHEMERIDES:
+            ephemeris_file = cls.resolve(ephemeris_file)
+        eph = cls._ephemerides.get(ephemeris_file)
+        if eph is not None:
+            return eph
+        with cls._lock:
+            # ロック待ちの間に他のスレッドが読み込んでいる場合がある
+            eph = cls._ephemerides.get(ephemeris_file)
+            if eph is None:
+                # 既存のファイルはそのまま開き（メモリマップ）、なければskyfieldに取得させる
+                if os.path.exists(ephemeris_file):
+                    eph = load_file(ephemeris_file)
+                else:
+                    eph = load(ephemeris_file)
+                cls._ephemerides[ephemeris_file] = eph
+                cls._load_counts['ephemeris'] += 1
+            return eph
+    
+    @classmethod
+    def get_timescale(cls, delta_t: DeltaTLike = None):
+        """
+        タイムスケールを取得（ΔTモデルごとに一度だけ生成する）
+        
+        Parameters:
+            delta_t (float | str | DeltaTModel, optional): ΔT値（秒）またはΔTモデル
+        
+        Returns:
+            Timescale: 共有されるタイムスケール
+        """
+        model = resolve_delta_t(delta_t)
+        ts = cls._timescales.get(model.key)
+        if ts is not None:
+            return ts
+        with cls._lock:
+            ts = cls._timescales.get(model.key)
+            if ts is None:
+                ts = model.build_timescale()
+                cls._timescales[model.key] = ts
+                cls._load_counts['timescale'] += 1
+            return ts
+    
+    @classmethod
+    def load_counts(cls) -> Dict[str, int]:
+        """
+        これまでに発生した読み込み回数を取得
+        
+        Returns:
+            Dict[str, int]: {'ephemeris': int, 'timescale': int}
+        """
+        with cls._lock:
+            return dict(cls._load_counts)
+    
+    @classmethod
+    def clear(cls) -> None:
+        """共有しているオブジェクトと読み込み回数をリセット（主にテスト用）"""
+        with cls._lock:
+            cls._ephemerides.clear()
+            cls._timescales.clear()
+            cls._load_counts = {'ephemeris': 0, 'timescale': 0}
+
+
+def extract_ephemeris_subset(source: str = 'de421.bsp', output: Optional[str] = None,
+                             start_year: int = 1900, end_year: int = 2050,
+                             targets: Iterable[int] = SUN_EARTH_MOON_TARGETS) -> str:
+    """
+    エフェメリスから必要な天体・期間のSPKセグメントだけを抜き出した小さなファイルを作成
+    
+    Parameters:
+        source (str): 元のエフェメリスファイル
+        output (str, optional): 出力ファイル。省略時は <元の名前>_sun_earth_moon_<開始年>_<終了年>.bsp
+        start_year (int): 開始年
+        end_year (int): 終了年（含む）
+        targets (Iterable[int]): 抜き出すセグメントの目標天体のNAIF ID
+    
+    Returns:
+        str: 出力ファイルのパス
+    """
+    if end_year < start_year:
+        raise ValueError("終了年は開始年以降を指定してください")
+    
+    if output is None:
+        name = os.path.splitext(os.path.basename(source))[0]
+        output = f"{name}_sun_earth_moon_{start_year}_{end_year}.bsp"
+    
+    # 年の境界付近の探索や光行時間の補正のため、前後に余裕を持たせる
+    start_jd = compute_julian_date(start_year, 1, 1) - 60
+    end_jd = compute_julian_date(end_year + 1, 1, 1) + 60
+    
+    targets = set(targets)
+    spk = SPK.open(source)
+    try:
+        summaries = [
+            summary for summary, segment in zip(spk.daf.summaries(), spk.segments)
+            if segment.target in targets
+        ]
+        if not summaries:
+            raise ValueError(f"{source} に指定された天体のセグメントがありません")
+        with open(output, 'w+b') as output_file:
+            write_excerpt(spk, output_file, start_jd, end_jd, summaries)
+    finally:
+        spk.close()
+    
+    return output
+
+
+def main(argv=None):
+    """エフェメリスの抜粋ファイルを作成するコマンドラインツール"""
+    parser = argparse.ArgumentParser(
+        description='太陽・地球・月のSPKセグメントだけを抜き出したエフェメリスを作成する'
+    )
+    parser.add_argument('--source', default='de421.bsp', help='元のエフェメリスファイル')
+    parser.add_argument('--output', help='出力ファイル')
+    parser.add_argument('--start-year', type=int, default=1900, help='開始年')
+    parser.add_argument('--end-year', type=int, default=2050, help='終了年（含む）')
+    args = parser.parse_args(argv)
+    
+    output = extract_ephemeris_subset(args.source, args.output, args.start_year, args.end_year)
+    
+    print(f"{output} を保存しました（{os.path.getsize(output) / 1024 / 1024:.1f}MB）")
+    subset = SPK.open(output)
+    print(subset)
+    subset.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+
+
+class EventCache:
+    """
+    暦イベントの瞬間を保存するSQLiteキャッシュ
+    
+    イベントの種類・年・ΔT・エフェメリスの組ごとに、その年のイベントの瞬間
+    （TTユリウス日の整数部と小数部）を保存する。保存した瞬間からTime objectを
+    作り直すだけで結果を返せるため、エフェメリスの評価は発生しない。
+    
+    各行にはCACHE_VERSIONを記録し、現在の版と異なる行は読み出さない。
+    計算方法や保存形式を変えた場合はCACHE_VERSIONを上げること。
+    
+    有効にするには EventCache.enable(path) を呼ぶ。有効なキャッシュがない場合、
+    計算クラスは従来どおり毎回計算する。
+    """
+    
+    # 保存形式・計算方法の版
+    CACHE_VERSION = 3
+    
+    # 既定のデータベースファイル
+    DEFAULT_PATH = 'koyomi_cache.sqlite3'
+    
+    _active: Optional['EventCache'] = None
+    
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Parameters:
+            path (str): SQLiteデータベースのパス（':memory:'も可）
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS events (
+                    version INTEGER NOT NULL,
+                    event_type TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    delta_t TEXT NOT NULL,
+                    ephemeris TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (version, event_type, year, delta_t, ephemeris)
+                )
+                """
+            )
+            # 古い版の行は二度と使われないため削除しておく
+            self._connection.execute(
+                "DELETE FROM events WHERE version != ?", (self.CACHE_VERSION,)
+            )
+    
+    @classmethod
+    def enable(cls, path: str = DEFAULT_PATH) -> 'EventCache':
+        """
+        プロセス全体で使うキャッシュを有効にする
+        
+        Parameters:
+            path (str): SQLiteデータベースのパス
+        
+        Returns:
+            EventCache: 有効になったキャッシュ
+        """
+        cls.disable()
+        cls._active = cls(path)
+        return cls._active
+    
+    @classmethod
+    def disable(cls) -> None:
+        """プロセス全体で使うキャッシュを無効にする"""
+        if cls._active is not None:
+            cls._active.close()
+            cls._active = None
+    
+    @classmethod
+    def active(cls) -> Optional['EventCache']:
+        """
+        有効なキャッシュを取得
+        
+        Returns:
+            Optional[EventCache]: 有効なキャッシュ。無効の場合はNone
+        """
+        return cls._active
+    
+    @staticmethod
+    def delta_t_key(delta_t) -> str:
+        """ΔT値またはΔTモデルをキーの文字列に変換（Noneはskyfieldのデフォルト値）"""
+        from .delta_t import resolve_delta_t
+        return resolve_delta_t(delta_t).key
+    
+    @staticmethod
+    def ephemeris_key(ephemeris_file: str) -> str:
+        """
+        エフェメリスを識別するキー（ファイル名とサイズ）
+        
+        同じ名前でも内容の異なるファイル（抜粋ファイルなど）を区別するため、
+        ファイルが存在する場合はサイズも含める。
+        """
+        name = os.path.basename(ephemeris_file)
+        if os.path.exists(ephemeris_file):
+            return f"{name}:{os.path.getsize(ephemeris_file)}"
+        return name
+    
+    def get_years(self, event_type: str, years: Iterable[int], delta_t,
+                  ephemeris_file: str) -> Dict[int, List[list]]:
+        """
+        複数年のイベントを読み出す
+        
+        Parameters:
+            event_type (str): イベントの種類
+            years (Iterable[int]): 対象年
+            delta_t: ΔT値（秒）またはΔTモデル（Noneはskyfieldのデフォルト値）
+            ephemeris_file (str): エフェメリスのファイル名
+        
+        Returns:
+            Dict[int, List[list]]: 保存されていた年ごとのイベント
+                                   （[ラベル, TTの整数部, TTの小数部] のリスト）
+        """
+        years = list(years)
+        if not years:
+            return {}
+        with self._lock:
+            rows = self._connection.execute(
+                """
+                SELECT year, payload FROM events
+                WHERE version = ? AND event_type = ? AND delta_t = ? AND ephemeris = ?
+                  AND year BETWEEN ? AND ?
+                """,
+                (self.CACHE_VERSION, event_type, self.delta_t_key(delta_t),
+                 self.ephemeris_key(ephemeris_file), min(years), max(years))
+            ).fetchall()
+        wanted = set(years)
+        return {year: json.loads(payload) for year, payload in rows if year in wanted}
+    
+    def put_years(self, event_type: str, events: Dict[int, List[list]], delta_t,
+                  ephemeris_file: str) -> None:
+        """
+        複数年のイベントを保存
+        
+        Parameters:
+            event_type (str): イベントの種類
+            events (Dict[int, List[list]]): 年ごとのイベント
+                                            （[ラベル, TTの整数部, TTの小数部] のリスト）
+            delta_t: ΔT値（秒）またはΔTモデル（Noneはskyfieldのデフォルト値）
+            ephemeris_file (str): エフェメリスのファイル名
+        """
+        delta_t = self.delta_t_key(delta_t)
+        ephemeris = self.ephemeris_key(ephemeris_file)
+        rows = [
+            (self.CACHE_VERSION, event_type, int(year), delta_t, ephemeris, json.dumps(payload))
+            for year, payload in events.items()
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+    
+    def clear(self) -> None:
+        """保存されている全てのイベントを削除"""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM events")
+    
+    def close(self) -> None:
+        """データベースを閉じる"""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,153 @@
+from typing import Optional, Sequence, Union
+from datetime import date
+import numpy as np
+from ..core import daynumber
+from ..core.delta_t import DeltaTLike
+from .holiday import Holiday, HolidayBitset
+
+class BusinessCalendar:
+    """
+    営業日を計算するクラス
+    
+    対象期間の全ての日について営業日（週末と祝日・休日以外の日）かどうかを求め、
+    その累積数の配列と営業日の通日の配列を作っておく。営業日の数え上げや
+    n営業日後の計算は配列の参照だけで行い、日付の配列もそのまま扱える。
+    
+    日付は date・datetime64[D]・通日のいずれでも渡せ、結果は渡した形式で返す
+    （日付の配列はdatetime64[D]、通日の配列は通日）。
+    
+    Attributes:
+        first_ordinal (int): 対象期間の最初の日の通日
+        last_ordinal (int): 対象期間の最後の日の通日
+        business_days (np.ndarray): 営業日かどうか（bool、対象期間の日数）
+        cumulative (np.ndarray): 対象期間の最初の日からi日目の前日までの営業日数（日数+1）
+        business_ordinals (np.ndarray): 営業日の通日（昇順）
+    """
+    
+    def __init__(
+        self,
+        start_year: int = 1950,
+        end_year: int = 2050,
+        weekend: Sequence[int] = (5, 6),
+        holiday: Optional[Union[Holiday, HolidayBitset]] = None,
+        delta_t: DeltaTLike = 69.0
+    ):
+        """
+        Parameters:
+            start_year (int): 対象期間の開始年
+            end_year (int): 対象期間の終了年（含む）
+            weekend (Sequence[int]): 休業とする曜日（月曜 = 0〜日曜 = 6）。デフォルトは土日
+            holiday (Holiday | HolidayBitset): 休日の判定に使うHoliday（独自の休日の定義を含めてよい）
+                                               またはビット列。省略時はdelta_tで作成する
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル
+        """
+        if end_year < start_year:
+            raise ValueError("終了年は開始年以降を指定してください")
+        self.holiday = holiday if holiday is not None else Holiday(delta_t)
+        self.weekend = tuple(weekend)
+        self.first_ordinal = date(start_year, 1, 1).toordinal()
+        self.last_ordinal = date(end_year, 12, 31).toordinal()
+        
+        ordinals = np.arange(self.first_ordinal, self.last_ordinal + 1)
+        self.business_days = (
+            ~np.isin(daynumber.weekdays(ordinals), self.weekend)
+            & ~self.holiday.is_holiday(ordinals)
+        )
+        self.cumulative = np.concatenate(([0], np.cumsum(self.business_days))).astype(np.int32)
+        self.business_ordinals = ordinals[self.business_days]
+    
+    def _index(self, dates) -> np.ndarray:
+        """日付を対象期間の最初の日からの日数に変換（範囲外ならValueError）"""
+        index = daynumber.to_ordinals(dates) - self.first_ordinal
+        if np.any((index < 0) | (index > self.last_ordinal - self.first_ordinal)):
+            raise ValueError("営業日カレンダーの対象期間外の日付が指定されています")
+        return index
+    
+    def _business_ordinal(self, positions: np.ndarray) -> np.ndarray:
+        """営業日の番号（0始まり）から通日を求める（範囲外ならValueError）"""
+        if np.any((positions < 0) | (positions >= len(self.business_ordinals))):
+            raise ValueError("結果が営業日カレンダーの対象期間外になります")
+        return self.business_ordinals[positions]
+    
+    @staticmethod
+    def _like(ordinals: np.ndarray, dates):
+        """通日の結果を入力と同じ形式に変換"""
+        if isinstance(dates, date):
+            return date.fromordinal(int(ordinals))
+        values = np.asarray(dates)
+        if np.issubdtype(values.dtype, np.datetime64) or values.dtype == object:
+            return daynumber.to_datetime64(ordinals)
+        return ordinals
+    
+    def is_business_day(self, dates) -> np.ndarray:
+        """
+        営業日かどうかを判定
+        
+        Parameters:
+            dates: date・datetime64[D]・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 営業日ならTrue（スカラーの場合はbool）
+        """
+        result = self.business_days[self._index(dates)]
+        return result if np.ndim(result) else bool(result)
+    
+    def business_days_between(self, start, end) -> np.ndarray:
+        """
+        startからendの前日までの営業日数を計算（numpy.busday_countと同じ数え方）
+        
+        Parameters:
+            start: 開始日（含む）
+            end: 終了日（含まない）。startより前の場合は、endの翌日からstartまでの
+                 営業日数を負の数で返す
+        
+        Returns:
+            np.ndarray: 営業日数（スカラーの場合はint）
+        """
+        start, end = self._index(start), self._index(end)
+        reverse = end < start
+        result = self.cumulative[end + reverse] - self.cumulative[start + reverse]
+        return result if np.ndim(result) else int(result)
+    
+    def add_business_days(self, dates, days):
+        """
+        n営業日後（負の場合はn営業日前）の日を計算
+        
+        営業日でない日は次の営業日に繰り越してから数える（numpy.busday_offsetの
+        roll='forward'と同じ）。
+        
+        Parameters:
+            dates: 基準日（スカラーまたは配列）
+            days: 営業日数（スカラーまたは配列）
+        
+        Returns:
+            基準日と同じ形式の日付
+        """
+        positions = self.cumulative[self._index(dates)] + np.asarray(days, dtype=np.int64)
+        return self._like(self._business_ordinal(positions), dates)
+    
+    def next_business_day(self, dates):
+        """
+        指定された日より後の最初の営業日を計算
+        
+        Parameters:
+            dates: 基準日（スカラーまたは配列）
+        
+        Returns:
+            基準日と同じ形式の日付
+        """
+        positions = self.cumulative[self._index(dates) + 1]
+        return self._like(self._business_ordinal(positions), dates)
+    
+    def previous_business_day(self, dates):
+        """
+        指定された日より前の最後の営業日を計算
+        
+        Parameters:
+            dates: 基準日（スカラーまたは配列）
+        
+        Returns:
+            基準日と同じ形式の日付
+        """
+        positions = self.cumulative[self._index(dates)] - 1
+        return self._like(self._business_ordinal(positions), dates)
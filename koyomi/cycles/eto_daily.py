@@ -1,27 +1,71 @@
-from typing import Dict, List
-from datetime import date, datetime, timedelta
+from typing import Iterator, List, Union
+from datetime import date
+import numpy as np
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
+from . import kanshi
+from .kanshi import DayKanshi
+
+class DailyEtoTable:
+    """
+    日ごとの干支の表
+    
+    日ごとに1行を持ち、干支は番号の列で保持する。辞書形式の結果は
+    行を参照したとき（添字・反復・to_dicts）に初めて作る。
+    
+    Attributes:
+        ordinals (np.ndarray): 日付の通日（int32）
+        kanshi (np.ndarray): 60日周期の番号（int8、0-59）
+        jikkan (np.ndarray): 十干の番号（int8、0-9）
+        junishi (np.ndarray): 十二支の番号（int8、0-11）
+    """
+    
+    def __init__(self, calculator: 'DailyEto', ordinals: np.ndarray, kanshi: np.ndarray):
+        self.calculator = calculator
+        self.ordinals = np.asarray(ordinals, dtype=np.int32)
+        self.kanshi = np.asarray(kanshi, dtype=np.int8)
+        self.jikkan = self.kanshi % 10
+        self.junishi = self.kanshi % 12
+    
+    def __len__(self) -> int:
+        return len(self.ordinals)
+    
+    def __getitem__(self, index: int) -> DayKanshi:
+        """index行目の干支を calculate_single_day と同じ形式で返す"""
+        return self.calculator._create_day_result(
+            date.fromordinal(int(self.ordinals[index])), int(self.kanshi[index])
+        )
+    
+    def __iter__(self) -> Iterator[DayKanshi]:
+        for target_date, index in zip(daynumber.to_dates(self.ordinals), self.kanshi.tolist()):
+            yield self.calculator._create_day_result(target_date, index)
+    
+    @property
+    def dates(self) -> np.ndarray:
+        """日付（datetime64[D]）"""
+        return daynumber.to_datetime64(self.ordinals)
+    
+    @property
+    def names(self) -> np.ndarray:
+        """干支の文字列（例: "甲子"）"""
+        return np.asarray(self.calculator.KANSHI_NAMES)[self.kanshi]
+    
+    def to_dicts(self) -> List[DayKanshi]:
+        """全ての行を calculate_single_day と同じ形式の結果のリストに変換"""
+        return list(self)
+
 
 class DailyEto(CalendarBase):
     """日ごとの干支（えと）を計算するクラス"""
     
-    # 十干(じっかん)
-    JIKKAN = [
-        "甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"
-    ]
-    JIKKAN_YOMI = [
-        "きのえ", "きのと", "ひのえ", "ひのと", "つちのえ",
-        "つちのと", "かのえ", "かのと", "みずのえ", "みずのと"
-    ]
-    
-    # 十二支(じゅうにし)
-    JUNISHI = [
-        "子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"
-    ]
-    JUNISHI_YOMI = [
-        "ね", "うし", "とら", "う", "たつ", "み",
-        "うま", "ひつじ", "さる", "とり", "いぬ", "い"
-    ]
+    # 十干(じっかん)・十二支(じゅうにし)
+    JIKKAN = kanshi.JIKKAN
+    JIKKAN_YOMI = kanshi.JIKKAN_YOMI
+    JUNISHI = kanshi.JUNISHI
+    JUNISHI_YOMI = kanshi.JUNISHI_YOMI
+    
+    # 60日周期の番号ごとの干支
+    KANSHI_NAMES = [k.kanji for k in kanshi.KANSHI_TABLE]
     
     def __init__(self, base_date: date = date(2024, 1, 1)):
         """
@@ -30,16 +74,32 @@ class DailyEto(CalendarBase):
         """
         super().__init__()
         self.base_date = base_date
+        self.base_ordinal = base_date.toordinal()
+    
+    def kanshi_indices(self, ordinals) -> np.ndarray:
+        """
+        通日の配列から日の干支の番号を一括で計算
+        
+        通日は0以下（西暦1年より前）でもよく、ユリウス暦の日付は
+        daynumber.julian_to_ordinals で通日に変換して渡す。
+        
+        Parameters:
+            ordinals: 通日（date.toordinal()、スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 基準日を0とする60日周期の番号（0-59）
+        """
+        return (np.asarray(ordinals, dtype=np.int64) - self.base_ordinal) % 60
     
-    def calculate_single_day(self, target_date: date) -> Dict:
+    def calculate_single_day(self, target_date: date) -> DayKanshi:
         """
         指定された日の干支を計算
         
         Parameters:
             target_date (date): 干支を計算したい日付
-            
+        
         Returns:
-            Dict: 計算結果
+            DayKanshi: 日付と六十干支の表の要素の組。従来の辞書と同じキーで参照できる
             {
                 '日付': date,
                 '干支': str（例: "甲子"）,
@@ -57,73 +117,56 @@ class DailyEto(CalendarBase):
                 '通日': int（1-60）
             }
         """
-        # 基準日からの経過日数を計算
-        days_diff = (target_date - self.base_date).days
-        
-        # 60日周期での日数を計算
-        cycle_days = days_diff % 60
-        
-        # 十干と十二支のインデックスを計算
-        jikkan_index = cycle_days % 10
-        junishi_index = cycle_days % 12
-        
-        return {
-            '日付': target_date,
-            '干支': f"{self.JIKKAN[jikkan_index]}{self.JUNISHI[junishi_index]}",
-            '読み': f"{self.JIKKAN_YOMI[jikkan_index]}{self.JUNISHI_YOMI[junishi_index]}",
-            '十干': {
-                '漢字': self.JIKKAN[jikkan_index],
-                '読み': self.JIKKAN_YOMI[jikkan_index],
-                '番号': jikkan_index
-            },
-            '十二支': {
-                '漢字': self.JUNISHI[junishi_index],
-                '読み': self.JUNISHI_YOMI[junishi_index],
-                '番号': junishi_index
-            },
-            '通日': cycle_days + 1  # 1から60までの日番号
-        }
-    
-    def calculate_month(self, year: int, month: int) -> List[Dict]:
+        # 基準日からの経過日数の60日周期での番号
+        cycle_days = (target_date.toordinal() - self.base_ordinal) % 60
+        return self._create_day_result(target_date, cycle_days)
+    
+    def _create_day_result(self, target_date: date, cycle_days: int) -> DayKanshi:
+        """日付と60日周期の番号から計算結果を作成"""
+        return DayKanshi(target_date, kanshi.KANSHI_TABLE[cycle_days])
+    
+    def calculate_month(self, year: int, month: int) -> List[DayKanshi]:
         """
         指定された年月の全日の干支を計算
         
         Parameters:
             year (int): 年
             month (int): 月
-            
+        
         Returns:
-            List[Dict]: その月の全日の干支情報
+            List[DayKanshi]: その月の全日の干支情報
         """
-        results = []
-        target_date = date(year, month, 1)
-        
-        # 月末まで繰り返し
-        while target_date.month == month:
-            results.append(self.calculate_single_day(target_date))
-            target_date += timedelta(days=1)
-            
-        return results
+        return self._calculate_ordinals(daynumber.month_ordinals(year, month))
     
-    def calculate_year(self, year: int) -> List[Dict]:
+    def calculate_year(self, year: int) -> List[DayKanshi]:
         """
         指定された年の全日の干支を計算
         
         Parameters:
             year (int): 年
-            
+        
         Returns:
-            List[Dict]: その年の全日の干支情報
+            List[DayKanshi]: その年の全日の干支情報
         """
-        results = []
-        target_date = date(year, 1, 1)
+        return self._calculate_ordinals(daynumber.year_ordinals(year))
+    
+    def calculate_range(self, start: Union[date, int], end: Union[date, int]) -> DailyEtoTable:
+        """
+        指定された期間の全日の干支を一括で計算
+        
+        Parameters:
+            start (date | int): 開始日（dateまたは通日）
+            end (date | int): 終了日（dateまたは通日、この日を含む）
         
-        # 年末まで繰り返し
-        while target_date.year == year:
-            results.append(self.calculate_single_day(target_date))
-            target_date += timedelta(days=1)
-            
-        return results
+        Returns:
+            DailyEtoTable: 日ごとの干支の番号の表
+        """
+        ordinals = np.arange(int(daynumber.to_ordinals(start)), int(daynumber.to_ordinals(end)) + 1)
+        return DailyEtoTable(self, ordinals, self.kanshi_indices(ordinals))
+    
+    def _calculate_ordinals(self, ordinals: np.ndarray) -> List[DayKanshi]:
+        """通日の配列の各日の干支を計算"""
+        return DailyEtoTable(self, ordinals, self.kanshi_indices(ordinals)).to_dicts()
     
     def format_month_calendar(self, year: int, month: int) -> str:
         """
@@ -132,7 +175,7 @@ class DailyEto(CalendarBase):
         Parameters:
             year (int): 年
             month (int): 月
-            
+        
         Returns:
             str: 整形されたカレンダー文字列
         """
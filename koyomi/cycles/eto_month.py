@@ -1,9 +1,65 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
+from ..core.delta_t import DeltaTLike
+from ..seasonal.sekki import SolarTerms
 from .eto_year import YearEto
+from .kanshi import KANSHI_TABLE
+
+JST = timezone(timedelta(hours=9))
+
+
+def to_jst_datetime64(times) -> Tuple[np.ndarray, bool]:
+    """
+    日時・日付をJSTのdatetime64に変換
+    
+    タイムゾーン付きの日時はJSTに変換し、タイムゾーンのない日時とdatetime64はJSTとみなす。
+    
+    Parameters:
+        times: datetime・date・datetime64・通日のいずれか（スカラーまたは配列）
+    
+    Returns:
+        tuple: (datetime64の配列, 日付だけか)
+    """
+    if isinstance(times, datetime):
+        times = np.array([times], dtype=object).reshape(())
+    elif isinstance(times, date):
+        return daynumber.to_datetime64(daynumber.to_ordinals(times)), True
+    values = np.asarray(times)
+    if values.dtype == object:
+        if not all(isinstance(value, datetime) for value in values.ravel()):
+            return daynumber.to_datetime64(daynumber.to_ordinals(values)), True
+        jst = np.array(
+            [
+                (value.astimezone(JST) if value.tzinfo else value).replace(tzinfo=None)
+                for value in values.ravel()
+            ],
+            dtype='datetime64[us]'
+        )
+        return jst.reshape(values.shape), False
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values, np.datetime_data(values.dtype)[0] in ('D', 'W', 'M', 'Y')
+    return daynumber.to_datetime64(values), True
 
 class MonthEto(CalendarBase):
-    """月の干支を計算するクラス"""
+    """
+    月の干支を計算するクラス
+    
+    '暦月' では暦の月（1月 = 寅月）ごとに、'節月' では節（立春・啓蟄・…・小寒）から
+    次の節の前までを一月として月の干支を求める。節月の年（節年）は立春で変わり、
+    1月の小寒から立春の前までは前年の十二月（丑月）になる。
+    
+    月の干支は 12 × 年 + (月 - 1) + 14 を60で割った余りの六十干支番号になる。
+    節月の境界は二十四節気の計算から求めた節の瞬間の配列で、日時の配列の月の干支は
+    この配列をsearchsortedで引いて一括して求める。
+    """
+    
+    # 節の節気番号（SolarTermTable.indices、0が春分）と節月（1 = 立春〜啓蟄の前）
+    SETSU_FIRST_INDEX = 21
+    SHOKAN_INDEX = 19
+    MODES = ('暦月', '節月')
     
     # 年の十干のグループ分け
     STEM_GROUPS = {
@@ -30,9 +86,127 @@ class MonthEto(CalendarBase):
         12: ["丁丑", "己丑", "辛丑", "癸丑", "乙丑"]    # 十二月
     }
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, mode: str = '暦月', delta_t: DeltaTLike = 69.0):
+        """
+        Parameters:
+            mode (str): '暦月'（暦の月）または '節月'（節で区切った月）
+            delta_t (float | str | DeltaTModel): 節の計算に使うΔT値（秒）またはΔTモデル
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"未対応の月の区切りです: {mode}")
+        super().__init__(delta_t)
+        self.mode = mode
         self.year_eto_calculator = YearEto()
+        self.sekki_calculator = SolarTerms(delta_t)
+        # 節の瞬間（JSTのdatetime64[us]、昇順）とその節月の節年・六十干支番号、その対象期間
+        self._setsu_starts = np.array([], dtype='datetime64[us]')
+        self._setsu_nen = np.array([], dtype=np.int32)
+        self._setsu_kanshi = np.array([], dtype=np.int8)
+        self._setsu_years: Optional[Tuple[int, int]] = None
+    
+    @staticmethod
+    def month_kanshi_index(year, month) -> np.ndarray:
+        """
+        年（節月では節年）と月（1 = 寅月）から月の六十干支番号を求める
+        
+        Parameters:
+            year: 年（スカラーまたは配列）
+            month: 月（1〜12、スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 六十干支番号（0 = 甲子）
+        """
+        return (12 * np.asarray(year, dtype=np.int64) + np.asarray(month, dtype=np.int64) + 13) % 60
+    
+    def _ensure_setsu(self, start_year: int, end_year: int) -> None:
+        """指定された期間（JSTでの年）の節の配列を用意する（計算済みの期間は広げて再利用する）"""
+        if self._setsu_years is not None:
+            cached_start, cached_end = self._setsu_years
+            if start_year >= cached_start and end_year <= cached_end:
+                return
+            start_year, end_year = min(start_year, cached_start), max(end_year, cached_end)
+        
+        table = self.sekki_calculator.calculate_range(start_year, end_year)
+        setsu = table.indices % 2 == 1
+        indices = table.indices[setsu]
+        # 小寒は前年の節年の十二月
+        years = table.years[setsu] - (indices == self.SHOKAN_INDEX)
+        months = (indices - self.SETSU_FIRST_INDEX) % 24 // 2 + 1
+        
+        self._setsu_starts = np.array(
+            [dt.replace(tzinfo=None) for dt, keep in zip(table.datetimes, setsu) if keep],
+            dtype='datetime64[us]'
+        )
+        self._setsu_nen = years.astype(np.int32)
+        self._setsu_kanshi = self.month_kanshi_index(years, months).astype(np.int8)
+        self._setsu_years = (start_year, end_year)
+    
+    def kanshi_indices(self, times) -> np.ndarray:
+        """
+        日時・日付の月の六十干支番号を一括して求める
+        
+        節月では、日時はその瞬間が属する節月、日付は節入りの日を新しい月として求める。
+        タイムゾーンのない日時とdatetime64はJSTとみなす。
+        
+        Parameters:
+            times: datetime・date・datetime64・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 六十干支番号（0 = 甲子、int8）
+        """
+        if self.mode == '暦月':
+            months = to_jst_datetime64(times)[0].astype('datetime64[M]').astype(np.int64)
+            return self.month_kanshi_index(1970 + months // 12, months % 12 + 1).astype(np.int8)
+        return self.setsu_months(times)[1]
+    
+    def _setsu_positions(self, values: np.ndarray, days: np.ndarray, dates_only: bool) -> np.ndarray:
+        """各日時・日付が属する節月の、節の配列での位置（最初の節より前なら-1）"""
+        if dates_only:
+            return np.searchsorted(self._setsu_starts.astype('datetime64[D]'), days, side='right') - 1
+        return np.searchsorted(self._setsu_starts, values.astype('datetime64[us]'), side='right') - 1
+    
+    def setsu_months(self, times) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        日時・日付の節年と節月の六十干支番号を一括して求める（modeによらず節月）
+        
+        日時はその瞬間が属する節月、日付は節入りの日を新しい月として求める。
+        
+        Parameters:
+            times: datetime・date・datetime64・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            tuple: (節年（int32）, 月の六十干支番号（0 = 甲子、int8）)
+        """
+        values, dates_only = to_jst_datetime64(times)
+        days = values.astype('datetime64[D]')
+        if days.size == 0:
+            return np.zeros(days.shape, dtype=np.int32), np.zeros(days.shape, dtype=np.int8)
+        first, last = days.min().astype(object), days.max().astype(object)
+        self._ensure_setsu(first.year, last.year)
+        positions = self._setsu_positions(values, days, dates_only)
+        if np.any(positions < 0):
+            # 1月の小寒より前は前年の大雪から始まる月（必要な場合だけ前年の節を求める）
+            self._ensure_setsu(first.year - 1, last.year)
+            positions = self._setsu_positions(values, days, dates_only)
+        return self._setsu_nen[positions], self._setsu_kanshi[positions]
+    
+    def calculate_datetime(self, dt) -> Dict:
+        """
+        指定された日時（または日付）の月の干支を計算
+        
+        Parameters:
+            dt (datetime | date): 日時（タイムゾーンのない日時はJST）または日付
+        
+        Returns:
+            Dict: {'日時': 入力, '月干支': str, '読み': str, '六十干支番号': int}
+        """
+        kanshi = KANSHI_TABLE[int(self.kanshi_indices(dt))]
+        return {
+            '日時': dt,
+            '月干支': kanshi.kanji,
+            '読み': kanshi.yomi,
+            '六十干支番号': kanshi.index + 1
+        }
     
     def _get_month_zodiac(self, month: int, year_stem: str) -> str:
         """
@@ -41,7 +215,7 @@ class MonthEto(CalendarBase):
         Parameters:
             month (int): 月 (1-12)
             year_stem (str): 年の干
-            
+        
         Returns:
             str: 月の干支
         """
@@ -61,16 +235,20 @@ class MonthEto(CalendarBase):
         指定された年月の干支を計算
         
         Parameters:
-            year (int): 年
-            month (int): 月
-            
+            year (int): 年（節月では節年）
+            month (int): 月（節月では1 = 立春から啓蟄の前まで）
+        
         Returns:
             Dict: 計算結果
             {
                 '年': int,
                 '月': int,
                 '年干支': str,
-                '月干支': str
+                '月干支': str,
+                # 節月のみ
+                '節': str,  # その月の始まりの節
+                '節入り': datetime,
+                '次の節入り': datetime
             }
         """
         # 年の干支を取得
@@ -80,12 +258,26 @@ class MonthEto(CalendarBase):
         # 月の干支を計算
         month_zodiac = self._get_month_zodiac(month, year_stem)
         
-        return {
+        result = {
             '年': year,
             '月': month,
             '年干支': year_result['干支'],
             '月干支': month_zodiac
         }
+        if self.mode == '節月':
+            result.update(self._setsu_month(year, month))
+        return result
+    
+    def _setsu_month(self, year: int, month: int) -> Dict:
+        """節年・節月の節入りと次の節入りの日時"""
+        table = self.sekki_calculator.calculate_range(year, year + 1)
+        setsu = [
+            (name, dt) for name, dt, index in zip(table.names, table.datetimes, table.indices)
+            if index % 2 == 1
+        ]
+        # 節年の最初の節は立春（その年の2番目の節）
+        start = setsu[month]
+        return {'節': start[0], '節入り': start[1], '次の節入り': setsu[month + 1][1]}
     
     def calculate_year(self, year: int) -> List[Dict]:
         """
@@ -93,7 +285,7 @@ class MonthEto(CalendarBase):
         
         Parameters:
             year (int): 年
-            
+        
         Returns:
             List[Dict]: その年の全月の干支情報
         """
@@ -105,7 +297,7 @@ class MonthEto(CalendarBase):
         
         Parameters:
             year (int): 年
-            
+        
         Returns:
             str: 整形された月干支情報
         """
@@ -1,36 +1,26 @@
-from typing import Dict, List
+from typing import List
 from ..core.calendar_base import CalendarBase
+from . import kanshi
+from .kanshi import YearKanshi
 
 class YearEto(CalendarBase):
     """年の干支を計算するクラス"""
     
-    # 十干(じっかん)
-    JIKKAN = [
-        "甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"
-    ]
-    JIKKAN_YOMI = [
-        "きのえ", "きのと", "ひのえ", "ひのと", "つちのえ",
-        "つちのと", "かのえ", "かのと", "みずのえ", "みずのと"
-    ]
+    # 十干(じっかん)・十二支(じゅうにし)
+    JIKKAN = kanshi.JIKKAN
+    JIKKAN_YOMI = kanshi.JIKKAN_YOMI
+    JUNISHI = kanshi.JUNISHI
+    JUNISHI_YOMI = kanshi.JUNISHI_YOMI
     
-    # 十二支(じゅうにし)
-    JUNISHI = [
-        "子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"
-    ]
-    JUNISHI_YOMI = [
-        "ね", "うし", "とら", "う", "たつ", "み",
-        "うま", "ひつじ", "さる", "とり", "いぬ", "い"
-    ]
-    
-    def calculate(self, year: int) -> Dict:
+    def calculate(self, year: int) -> YearKanshi:
         """
         指定された年の干支を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
-            Dict: 計算結果
+            YearKanshi: 年と六十干支の表の要素の組。従来の辞書と同じキーで参照できる
             {
                 '年': int,
                 '干支': str（例: "甲子"）,
@@ -38,50 +28,29 @@ class YearEto(CalendarBase):
                 '十干': {
                     '漢字': str,
                     '読み': str,
-                    '番号': int（0-9）
+                    '番号': int（1-10）
                 },
                 '十二支': {
                     '漢字': str,
                     '読み': str,
-                    '番号': int（0-11）
+                    '番号': int（1-12）
                 }
                 '六十干支番号': int（1-60）
             }
         """
-        # 十干と十二支のインデックスを計算
-        jikkan_idx = (year + 6) % 10  # 甲（きのえ）を基準に計算
-        junishi_idx = (year + 8) % 12  # 子（ね）を基準に計算
-        
-        # 六十干支の通し番号を計算（1〜60）
-        cycle_number = (jikkan_idx * 12 + junishi_idx) % 60 + 1
-        
-        return {
-            '年': year,
-            '干支': f"{self.JIKKAN[jikkan_idx]}{self.JUNISHI[junishi_idx]}",
-            '読み': f"{self.JIKKAN_YOMI[jikkan_idx]}{self.JUNISHI_YOMI[junishi_idx]}",
-            '十干': {
-                '漢字': self.JIKKAN[jikkan_idx],
-                '読み': self.JIKKAN_YOMI[jikkan_idx],
-                '番号': jikkan_idx + 1  # 1から始まる番号
-            },
-            '十二支': {
-                '漢字': self.JUNISHI[junishi_idx],
-                '読み': self.JUNISHI_YOMI[junishi_idx],
-                '番号': junishi_idx + 1  # 1から始まる番号
-            },
-            '六十干支番号': cycle_number
-        }
+        # 西暦4年が甲子の年
+        return YearKanshi(year, kanshi.kanshi_of(year - 4))
     
-    def calculate_range(self, start_year: int, end_year: int) -> List[Dict]:
+    def calculate_range(self, start_year: int, end_year: int) -> List[YearKanshi]:
         """
         指定された範囲の年の干支を計算
         
         Parameters:
             start_year (int): 開始年
             end_year (int): 終了年（含む）
-            
+        
         Returns:
-            List[Dict]: 各年の干支情報
+            List[YearKanshi]: 各年の干支情報
         """
         results = []
         for year in range(start_year, end_year + 1):
@@ -96,7 +65,7 @@ class YearEto(CalendarBase):
             start_year (int): 開始年
             end_year (int): 終了年（含む）
             include_wareki (bool): 和暦（令和）を含めるかどうか
-            
+        
         Returns:
             str: 整形された干支情報
         """
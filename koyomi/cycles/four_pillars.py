@@ -0,0 +1,96 @@
+from typing import Dict
+from datetime import datetime
+import numpy as np
+from ..core.calendar_base import CalendarBase
+from ..core import daynumber
+from ..core.delta_t import DeltaTLike
+from .eto_daily import DailyEto
+from .eto_month import MonthEto, to_jst_datetime64
+from .kanshi import KANSHI_TABLE, kanshi_index
+
+class FourPillars(CalendarBase):
+    """
+    四柱（年柱・月柱・日柱・時柱）を計算するクラス
+    
+    年柱と月柱は節で区切り、年は立春で変わる（MonthEtoの節月と同じ節の瞬間の配列を
+    searchsortedで引く）。日柱は通日の60日周期、時柱は2時間ごとの十二支と日の十干から
+    求めるため、日時の配列のまま一括して計算できる。
+    
+    23時からの子の刻は翌日の子の刻とみなし、日柱・時柱とも翌日として求める
+    （late_rat_next_day=Falseの場合は、日柱はその日のまま時柱だけ子の刻にする）。
+    """
+    
+    PILLARS = ('年柱', '月柱', '日柱', '時柱')
+    
+    def __init__(self, delta_t: DeltaTLike = 69.0, late_rat_next_day: bool = True):
+        """
+        Parameters:
+            delta_t (float | str | DeltaTModel): 節の計算に使うΔT値（秒）またはΔTモデル
+            late_rat_next_day (bool): 23時からを翌日の日柱とするかどうか
+        """
+        super().__init__(delta_t)
+        self.late_rat_next_day = late_rat_next_day
+        self.month_calculator = MonthEto('節月', delta_t)
+        self.day_calculator = DailyEto()
+    
+    def calculate_arrays(self, times) -> Dict[str, np.ndarray]:
+        """
+        日時の配列の四柱を一括して計算
+        
+        Parameters:
+            times: datetime・datetime64のいずれか（スカラーまたは配列）。
+                   タイムゾーンのない日時とdatetime64はJSTとみなす
+        
+        Returns:
+            Dict[str, np.ndarray]: '年柱'・'月柱'・'日柱'・'時柱' の六十干支番号（0 = 甲子、int8）
+        """
+        values, dates_only = to_jst_datetime64(times)
+        if dates_only:
+            raise ValueError("時柱の計算には時刻が必要です")
+        values = values.astype('datetime64[us]')
+        
+        setsu_years, month_pillars = self.month_calculator.setsu_months(values)
+        year_pillars = (setsu_years - 4) % 60
+        
+        # 1時間進めると、23時からの子の刻が翌日の0時台になり、十二支は時 // 2 になる
+        shifted = (values + np.timedelta64(1, 'h')).astype('datetime64[h]').astype(np.int64)
+        branches = shifted % 24 // 2
+        if self.late_rat_next_day:
+            days = shifted // 24
+        else:
+            days = values.astype('datetime64[D]').astype(np.int64)
+        day_pillars = self.day_calculator.kanshi_indices(days + daynumber.UNIX_EPOCH_ORDINAL)
+        
+        stems = (day_pillars % 5 * 2 + branches) % 10
+        return {
+            '年柱': year_pillars.astype(np.int8),
+            '月柱': month_pillars,
+            '日柱': day_pillars.astype(np.int8),
+            '時柱': kanshi_index(stems, branches).astype(np.int8)
+        }
+    
+    def calculate(self, dt: datetime) -> Dict:
+        """
+        指定された日時の四柱を計算
+        
+        Parameters:
+            dt (datetime): 日時（タイムゾーンのない日時はJST）
+        
+        Returns:
+            Dict: {'日時': datetime, '年柱': str, '月柱': str, '日柱': str, '時柱': str}
+        """
+        pillars = self.calculate_arrays(dt)
+        result = {'日時': dt}
+        for name in self.PILLARS:
+            result[name] = KANSHI_TABLE[int(pillars[name])].kanji
+        return result
+    
+    def format_pillars(self, dt: datetime) -> str:
+        """
+        指定された日時の四柱を整形して文字列で返す
+        """
+        result = self.calculate(dt)
+        return "\n".join(
+            [f"\n{dt.strftime('%Y/%m/%d %H:%M')}の四柱"] +
+            [f"{name}: {result[name]}" for name in self.PILLARS]
+        )
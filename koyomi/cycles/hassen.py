@@ -1,7 +1,69 @@
-from typing import Dict, List
-from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Union
+from datetime import date
+import numpy as np
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
 from .eto_daily import DailyEto
+from .kanshi import HASSEN_MABI, HASSEN_START, KANSHI_TABLE
+
+class HassenPeriods:
+    """
+    八専の期間の表
+    
+    期間（壬子〜癸亥の12日間）ごとに1行を持ち、初日と最終日を通日で保持する。
+    間日は期間の初日からの日数（MABI_OFFSETS）で表し、日ごとのオブジェクトは作らない。
+    
+    Attributes:
+        start (np.ndarray): 期間の初日（壬子の日）の通日（int64）
+        end (np.ndarray): 期間の最終日（癸亥の日）の通日（int64）
+        first_ordinal (int): 計算を指定された範囲の最初の日の通日
+        last_ordinal (int): 計算を指定された範囲の最後の日の通日
+    """
+    
+    # 期間の日数と、初日から間日までの日数（癸丑・丙辰・戊午・壬戌）
+    LENGTH = 60 - HASSEN_START
+    MABI_OFFSETS = tuple(index - HASSEN_START for index in HASSEN_MABI)
+    
+    def __init__(self, start: np.ndarray, first_ordinal: int, last_ordinal: int):
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = self.start + self.LENGTH - 1
+        self.first_ordinal = first_ordinal
+        self.last_ordinal = last_ordinal
+    
+    def __len__(self) -> int:
+        return len(self.start)
+    
+    def __repr__(self) -> str:
+        return (f"HassenPeriods({date.fromordinal(self.first_ordinal)}〜"
+                f"{date.fromordinal(self.last_ordinal)}, {len(self)}期間)")
+    
+    @property
+    def clipped_start(self) -> np.ndarray:
+        """範囲の最初の日で切り詰めた各期間の初日の通日"""
+        return np.maximum(self.start, self.first_ordinal)
+    
+    @property
+    def clipped_end(self) -> np.ndarray:
+        """範囲の最後の日で切り詰めた各期間の最終日の通日"""
+        return np.minimum(self.end, self.last_ordinal)
+    
+    @property
+    def mabi(self) -> np.ndarray:
+        """各期間の間日の通日（期間数×4）"""
+        return self.start[:, np.newaxis] + np.array(self.MABI_OFFSETS)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for start in self.start.tolist():
+            yield {
+                '開始日': date.fromordinal(start),
+                '終了日': date.fromordinal(start + self.LENGTH - 1),
+                '間日': [date.fromordinal(start + offset) for offset in self.MABI_OFFSETS]
+            }
+    
+    def to_dicts(self) -> List[Dict]:
+        """全ての期間を {'開始日', '終了日', '間日'} の辞書のリストに変換"""
+        return list(self)
+
 
 class Hassen(CalendarBase):
     """八専を計算するクラス"""
@@ -37,7 +99,7 @@ class Hassen(CalendarBase):
         
         Parameters:
             target_date (date): 対象日
-            
+        
         Returns:
             Dict: 計算結果
             {
@@ -68,18 +130,44 @@ class Hassen(CalendarBase):
         
         return result
     
+    def calculate_periods(self, start: Union[date, int], end: Union[date, int]) -> HassenPeriods:
+        """
+        指定された期間に重なる八専の期間を計算
+        
+        八専は60日周期の壬子（甲子から数えて49番目）から12日間なので、
+        範囲の前後にはみ出す期間も含めて初日を60日おきに並べる。
+        
+        Parameters:
+            start (date | int): 開始日（dateまたは通日）
+            end (date | int): 終了日（dateまたは通日、この日を含む）
+        
+        Returns:
+            HassenPeriods: 八専の期間の表
+        """
+        start = int(daynumber.to_ordinals(start))
+        end = int(daynumber.to_ordinals(end))
+        # startを含む期間の初日はstartの(LENGTH - 1)日前以降
+        earliest = start - HassenPeriods.LENGTH + 1
+        first = earliest + (HASSEN_START - int(self.eto_calculator.kanshi_indices(earliest))) % 60
+        return HassenPeriods(np.arange(first, end + 1, 60, dtype=np.int64), start, end)
+    
     def calculate_year(self, year: int) -> List[Dict]:
         """指定された年の全日の八専情報を計算"""
-        results = []
-        current_date = date(year, 1, 1)
-        
-        # 年末まで繰り返し
-        while current_date.year == year:
-            result = self.calculate_single_day(current_date)
-            if result['八専期間']:  # 八専期間の日のみを追加
-                results.append(result)
-            current_date += timedelta(days=1)
+        periods = self.calculate_periods(date(year, 1, 1), date(year, 12, 31))
         
+        # 八専期間の日のみを対象とする
+        days = (periods.start[:, np.newaxis] + np.arange(HassenPeriods.LENGTH)).ravel()
+        days = days[(days >= periods.first_ordinal) & (days <= periods.last_ordinal)]
+        results = []
+        for current_date, index in zip(daynumber.to_dates(days), self.eto_calculator.kanshi_indices(days).tolist()):
+            kanshi = KANSHI_TABLE[index]
+            results.append({
+                '日付': current_date,
+                '干支': kanshi.kanji,
+                '八専期間': True,
+                '五行': kanshi.gogyo,
+                '種類': kanshi.hassen
+            })
         return results
     
     def format_year(self, year: int) -> str:
@@ -102,7 +190,7 @@ class Hassen(CalendarBase):
                 current_month = result['日付'].month
                 if current_month > 1:  # 最初の月以外で区切り線を追加
                     output.append("─" * 70)
-        
+            
             date_str = result['日付'].strftime('%Y/%m/%d')
             output.append(
                 f"{date_str}  {result['干支']:<8}  "
@@ -1,154 +1,357 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 import unicodedata
-from datetime import date, datetime, timedelta
-import calendar
+from datetime import date
+import numpy as np
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
+from ..core.delta_t import DeltaTLike
 from ..seasonal.sekki import SolarTerms
+from .holiday_overlay import HolidayOverlay
 
-class Holiday(CalendarBase):
-    """日本の祝日を計算するクラス"""
-    
-    # 固定日の祝日定義
-    FIXED_HOLIDAYS = {
-        1: {
-            1: "元日"
-        },
-        2: {
-            11: "建国記念の日",
-            23: "天皇誕生日"
-        },
-        4: {
-            29: "昭和の日"
-        },
-        5: {
-            3: "憲法記念日",
-            4: "みどりの日",
-            5: "こどもの日"
-        },
-        8: {
-            11: "山の日"
-        },
-        11: {
-            3: "文化の日",
-            23: "勤労感謝の日"
-        }
-    }
-    
-    # ハッピーマンデー制度による祝日
-    HAPPY_MONDAY = {
-        1: (2, "成人の日"),      # 1月第2月曜日
-        7: (3, "海の日"),       # 7月第3月曜日
-        9: (3, "敬老の日"),     # 9月第3月曜日
-        10: (2, "スポーツの日")  # 10月第2月曜日
-    }
-
-    def __init__(self):
-        """初期化"""
-        super().__init__()
-        self.sekki_calculator = SolarTerms()
+class HolidayBitset:
+    """
+    休日のビット列
+    
+    連続した期間の各日を1ビット（bitorder='little'）で表す。和・積・差は
+    共通の期間に揃えてビットごとに計算する。
+    
+    Attributes:
+        first_ordinal (int): 期間の最初の日の通日
+        last_ordinal (int): 期間の最後の日の通日
+        bits (np.ndarray): 1日1ビットに詰めたビット列（uint8）
+    """
+    
+    def __init__(self, first_ordinal: int, last_ordinal: int, bits: np.ndarray):
+        self.first_ordinal = first_ordinal
+        self.last_ordinal = last_ordinal
+        self.bits = bits
+    
+    @classmethod
+    def from_ordinals(cls, first_ordinal: int, last_ordinal: int, ordinals) -> 'HolidayBitset':
+        """期間と休日の通日から作成（期間外の通日は無視する）"""
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        ordinals = ordinals[(ordinals >= first_ordinal) & (ordinals <= last_ordinal)]
+        flags = np.zeros(last_ordinal - first_ordinal + 1, dtype=bool)
+        flags[ordinals - first_ordinal] = True
+        return cls(first_ordinal, last_ordinal, np.packbits(flags, bitorder='little'))
+    
+    def __len__(self) -> int:
+        return self.last_ordinal - self.first_ordinal + 1
+    
+    @property
+    def flags(self) -> np.ndarray:
+        """各日が休日かどうか（bool、期間の日数）"""
+        return np.unpackbits(self.bits, count=len(self), bitorder='little').astype(bool)
+    
+    @property
+    def ordinals(self) -> np.ndarray:
+        """休日の通日（昇順）"""
+        return np.flatnonzero(self.flags) + self.first_ordinal
+    
+    def is_holiday(self, dates) -> np.ndarray:
+        """
+        休日かどうかを一括で判定（期間外の日付はFalse）
+        
+        Parameters:
+            dates: date・datetime64[D]・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 休日ならTrue（スカラーの場合はbool）
+        """
+        index = daynumber.to_ordinals(dates) - self.first_ordinal
+        inside = (index >= 0) & (index < len(self))
+        index = np.where(inside, index, 0)
+        result = inside & (((self.bits[index >> 3] >> (index & 7)) & 1) == 1)
+        return result if result.ndim else bool(result)
+    
+    def _combine(self, other: 'HolidayBitset', operation) -> 'HolidayBitset':
+        """両方の期間を含む期間に揃えてビットごとの演算を行う"""
+        first = min(self.first_ordinal, other.first_ordinal)
+        last = max(self.last_ordinal, other.last_ordinal)
+        flags = []
+        for bitset in (self, other):
+            aligned = np.zeros(last - first + 1, dtype=bool)
+            aligned[bitset.first_ordinal - first:bitset.last_ordinal - first + 1] = bitset.flags
+            flags.append(aligned)
+        return HolidayBitset(first, last, np.packbits(operation(*flags), bitorder='little'))
+    
+    def __or__(self, other: 'HolidayBitset') -> 'HolidayBitset':
+        """どちらかの休日"""
+        return self._combine(other, np.logical_or)
+    
+    def __and__(self, other: 'HolidayBitset') -> 'HolidayBitset':
+        """両方の休日"""
+        return self._combine(other, np.logical_and)
+    
+    def __sub__(self, other: 'HolidayBitset') -> 'HolidayBitset':
+        """otherの休日を除いた休日"""
+        return self._combine(other, lambda a, b: a & ~b)
 
-    def _find_monday_date(self, year: int, month: int, week: int) -> date:
-        """指定された月の第n月曜日を求める"""
-        c = calendar.monthcalendar(year, month)
-        for week_days in c:
-            monday = week_days[0]  # 月曜日
-            if monday != 0:
-                week -= 1
-                if week == 0:
-                    return date(year, month, monday)
-    
-    def _get_equinox_holiday(self, year: int, sekki_name: str, holiday_name: str) -> Dict:
-        """春分の日・秋分の日を計算"""
-        terms = self.sekki_calculator.calculate(year)
-        for term in terms:
-            if term['イベント名'] == sekki_name:
-                dt = term['datetime_jst']
-                return {
-                    '日付': dt.date(),
-                    '名称': holiday_name,
-                    '種類': '祝日',
-                    'オリジナル祝日': None
-                }
-        return None
 
-    def calculate(self, year: int, **kwargs) -> List[Dict]:
+class Holiday(CalendarBase):
+    """
+    日本の祝日を計算するクラス
+    
+    祝日法の改正ごとの規則（施行日から廃止日までの期間を持つ）をその年に有効なものだけ
+    適用して祝日・休日の表を作り、年ごとにキャッシュする。is_holiday は対象期間の
+    全ての日を1ビットずつで表したビット列を一括で引いて判定する。
+    
+    独自の休日の定義（HolidayOverlay）を渡すと、その休業日・出勤日も同じ表と
+    ビット列に反映されるため、一括判定の手間は定義の有無で変わらない。
+    """
+    
+    # 国民の祝日に関する法律の施行日（これより前の祝日はない）
+    LAW_START = date(1948, 7, 20)
+    
+    # 祝日の規則: (名称, 施行日, 廃止日（この日を含まない。Noneは現行）, 月, 日)
+    # 日は日付（int）、(n, 曜日) は第n週の曜日（月曜 = 0）、'春分'・'秋分' は節気の日
+    HOLIDAY_RULES = (
+        ('元日', LAW_START, None, 1, 1),
+        ('成人の日', LAW_START, date(2000, 1, 1), 1, 15),
+        ('成人の日', date(2000, 1, 1), None, 1, (2, 0)),
+        ('建国記念の日', date(1966, 6, 25), None, 2, 11),
+        ('天皇誕生日', date(2020, 1, 1), None, 2, 23),
+        ('春分の日', LAW_START, None, 3, '春分'),
+        ('天皇誕生日', LAW_START, date(1989, 2, 17), 4, 29),
+        ('みどりの日', date(1989, 2, 17), date(2007, 1, 1), 4, 29),
+        ('昭和の日', date(2007, 1, 1), None, 4, 29),
+        ('憲法記念日', LAW_START, None, 5, 3),
+        ('みどりの日', date(2007, 1, 1), None, 5, 4),
+        ('こどもの日', LAW_START, None, 5, 5),
+        ('海の日', date(1996, 1, 1), date(2003, 1, 1), 7, 20),
+        ('海の日', date(2003, 1, 1), date(2020, 1, 1), 7, (3, 0)),
+        ('海の日', date(2020, 1, 1), date(2021, 1, 1), 7, 23),
+        ('海の日', date(2021, 1, 1), date(2022, 1, 1), 7, 22),
+        ('海の日', date(2022, 1, 1), None, 7, (3, 0)),
+        ('スポーツの日', date(2020, 1, 1), date(2021, 1, 1), 7, 24),
+        ('スポーツの日', date(2021, 1, 1), date(2022, 1, 1), 7, 23),
+        ('山の日', date(2021, 1, 1), date(2022, 1, 1), 8, 8),
+        ('山の日', date(2020, 1, 1), date(2021, 1, 1), 8, 10),
+        ('山の日', date(2016, 1, 1), date(2020, 1, 1), 8, 11),
+        ('山の日', date(2022, 1, 1), None, 8, 11),
+        ('敬老の日', date(1966, 6, 25), date(2003, 1, 1), 9, 15),
+        ('敬老の日', date(2003, 1, 1), None, 9, (3, 0)),
+        ('秋分の日', LAW_START, None, 9, '秋分'),
+        ('体育の日', date(1966, 6, 25), date(2000, 1, 1), 10, 10),
+        ('体育の日', date(2000, 1, 1), date(2020, 1, 1), 10, (2, 0)),
+        ('スポーツの日', date(2022, 1, 1), None, 10, (2, 0)),
+        ('文化の日', LAW_START, None, 11, 3),
+        ('勤労感謝の日', LAW_START, None, 11, 23),
+        ('天皇誕生日', date(1989, 2, 17), date(2019, 1, 1), 12, 23),
+    )
+    
+    # 特別の法律による休日: (日付, 名称, 種類)
+    # 2019年の2日は国民の祝日とみなされ、国民の休日の判定にも使う
+    SPECIAL_HOLIDAYS = (
+        (date(1959, 4, 10), '皇太子明仁親王の結婚の儀', '休日'),
+        (date(1989, 2, 24), '昭和天皇の大喪の礼', '休日'),
+        (date(1990, 11, 12), '即位礼正殿の儀', '休日'),
+        (date(1993, 6, 9), '皇太子徳仁親王の結婚の儀', '休日'),
+        (date(2019, 5, 1), '天皇の即位の日', '祝日'),
+        (date(2019, 10, 22), '即位礼正殿の儀', '祝日'),
+    )
+    
+    # 振替休日（祝日が日曜日なら翌日を休日とする）の施行日
+    SUBSTITUTE_HOLIDAY_START = date(1973, 4, 12)
+    # 翌日も祝日なら、その次の祝日でない日を振替休日とする改正の施行日
+    SUBSTITUTE_NEXT_WEEKDAY_START = date(2007, 1, 1)
+    # 国民の休日（祝日に挟まれた日）の施行日
+    NATIONAL_HOLIDAY_START = date(1985, 12, 27)
+    
+    def __init__(self, delta_t: DeltaTLike = 69.0, overlays: Iterable[HolidayOverlay] = ()):
         """
-        指定された年の祝日と休日を計算
-        
         Parameters:
-            year (int): 年
-            **kwargs: 追加のオプション
-                include_substitute (bool): 振替休日を含めるかどうか。デフォルトはTrue
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。春分・秋分の計算に使う
+            overlays (Iterable[HolidayOverlay]): 国民の祝日に重ねる独自の休日の定義（順に適用する）
         """
-        include_substitute = kwargs.get('include_substitute', True)
-        results = {}
+        super().__init__(delta_t)
+        self.overlays = tuple(overlays)
+        # 春分・秋分は日付だけを使うため日付精度で求める
+        self.sekki_calculator = SolarTerms(delta_t, precision='date')
+        # 年ごとの祝日・休日の表（年 → 日付順の結果のリスト）
+        self._year_tables: Dict[int, List[Dict]] = {}
+        # 祝日・休日のビット列とその対象期間
+        self._bitset: Optional[HolidayBitset] = None
+        self._bitset_years: Optional[Tuple[int, int]] = None
+    
+    def _find_equinoxes(self, start_year: int, end_year: int) -> Dict[Tuple[int, str], date]:
+        """春分・秋分の日付を求める（1年だけなら2つの節気だけを探索する）"""
+        if start_year == end_year:
+            terms = self.sekki_calculator.calculate_terms(start_year, ['春分', '秋分'])
+            return {(start_year, term['イベント名']): term['datetime_jst'].date() for term in terms}
         
-        # 1. 固定日の祝日
-        for month, days in self.FIXED_HOLIDAYS.items():
-            for day, name in days.items():
+        table = self.sekki_calculator.calculate_range(start_year, end_year)
+        return {
+            (int(year), name): dt.date()
+            for name, dt, year in zip(table.names, table.datetimes, table.years)
+            if name in ('春分', '秋分')
+        }
+    
+    def _compile_year(self, year: int, equinoxes: Dict[Tuple[int, str], date]) -> List[Dict]:
+        """指定された年に有効な規則から祝日・休日の表を作成"""
+        results = {}
+        for name, start, end, month, day in self.HOLIDAY_RULES:
+            if isinstance(day, str):
+                holiday_date = equinoxes.get((year, day))
+            elif isinstance(day, tuple):
+                holiday_date = date.fromordinal(int(daynumber.nth_weekday_ordinals(year, month, *day)))
+            else:
                 holiday_date = date(year, month, day)
-                results[holiday_date] = {
-                    '日付': holiday_date,
-                    '名称': name,
-                    '種類': '祝日',
-                    'オリジナル祝日': None
-                }
-        
-        # 2. ハッピーマンデー
-        for month, (week, name) in self.HAPPY_MONDAY.items():
-            holiday_date = self._find_monday_date(year, month, week)
-            results[holiday_date] = {
+            if holiday_date is None or holiday_date < start or (end is not None and holiday_date >= end):
+                continue
+            results[holiday_date.toordinal()] = {
                 '日付': holiday_date,
                 '名称': name,
                 '種類': '祝日',
                 'オリジナル祝日': None
             }
         
-        # 3. 春分・秋分
-        spring = self._get_equinox_holiday(year, '春分', '春分の日')
-        if spring:
-            results[spring['日付']] = spring
+        for holiday_date, name, kind in self.SPECIAL_HOLIDAYS:
+            if holiday_date.year == year:
+                results[holiday_date.toordinal()] = {
+                    '日付': holiday_date,
+                    '名称': name,
+                    '種類': kind,
+                    'オリジナル祝日': None
+                }
         
-        autumn = self._get_equinox_holiday(year, '秋分', '秋分の日')
-        if autumn:
-            results[autumn['日付']] = autumn
+        # 振替休日と国民の休日（日付は通日で扱う）
+        holidays = sorted(ordinal for ordinal, holiday in results.items() if holiday['種類'] == '祝日')
+        additional_holidays = {}
         
-        if include_substitute:
-            # 4. 振替休日と国民の休日を追加
-            holiday_dates = sorted(results.keys())
-            additional_holidays = {}
+        for ordinal, weekday in zip(holidays, daynumber.weekdays(holidays).tolist()):
+            holiday_date = results[ordinal]['日付']
             
-            for holiday_date in holiday_dates:
-                # 祝日が日曜の場合
-                if holiday_date.weekday() == 6:
-                    original_name = results[holiday_date]['名称']
-                    next_day = holiday_date + timedelta(days=1)
+            # 祝日が日曜の場合
+            if weekday == 6 and holiday_date >= self.SUBSTITUTE_HOLIDAY_START:
+                next_day = ordinal + 1
+                if holiday_date >= self.SUBSTITUTE_NEXT_WEEKDAY_START:
                     while next_day in results or next_day in additional_holidays:
-                        next_day += timedelta(days=1)
+                        next_day += 1
+                if next_day not in results and next_day not in additional_holidays:
+                    original_name = results[ordinal]['名称']
                     additional_holidays[next_day] = {
-                        '日付': next_day,
                         '名称': '休日',
                         '種類': f'{original_name}の振替休日',
                         'オリジナル祝日': original_name
                     }
-                
-                # 祝日に挟まれた平日を探す
-                if holiday_date + timedelta(days=2) in results:
-                    between_date = holiday_date + timedelta(days=1)
-                    if between_date not in results and between_date.weekday() < 6:
-                        additional_holidays[between_date] = {
-                            '日付': between_date,
-                            '名称': '休日',
-                            '種類': '国民の休日',
-                            'オリジナル祝日': None
-                        }
             
-            results.update(additional_holidays)
+            # 祝日に挟まれた平日を探す
+            between = ordinal + 1
+            if (
+                ordinal + 2 in holidays
+                and between >= self.NATIONAL_HOLIDAY_START.toordinal()
+                and between not in results
+                and between not in additional_holidays
+                and daynumber.weekdays(between) < 6
+            ):
+                additional_holidays[between] = {
+                    '名称': '休日',
+                    '種類': '国民の休日',
+                    'オリジナル祝日': None
+                }
         
-        # 日付順にソート
-        sorted_results = [results[k] for k in sorted(results.keys())]
-        return sorted_results
-
+        for ordinal, holiday in additional_holidays.items():
+            holiday_date = date.fromordinal(ordinal)
+            results[ordinal] = {'日付': holiday_date, **holiday}
+        
+        # 独自の休業日を加え、出勤日を除く（振替休日・国民の休日の判定には使わない）
+        for overlay in self.overlays:
+            for ordinal, name in overlay.closure_dates(year).items():
+                if ordinal not in results:
+                    results[ordinal] = {
+                        '日付': date.fromordinal(ordinal),
+                        '名称': name,
+                        '種類': overlay.name,
+                        'オリジナル祝日': None
+                    }
+            for ordinal in overlay.opening_dates(year):
+                results.pop(ordinal, None)
+        
+        return [results[ordinal] for ordinal in sorted(results)]
+    
+    def _compile_years(self, start_year: int, end_year: int) -> None:
+        """指定された期間のうち未計算の年の祝日・休日の表を作成"""
+        missing = [year for year in range(start_year, end_year + 1) if year not in self._year_tables]
+        if not missing:
+            return
+        
+        # 祝日法の施行前の年は祝日がない（独自の休日だけを適用する）
+        law_years = [year for year in missing if year >= self.LAW_START.year]
+        equinoxes = self._find_equinoxes(law_years[0], law_years[-1]) if law_years else {}
+        for year in missing:
+            self._year_tables[year] = self._compile_year(year, equinoxes)
+    
+    def bitset(self, start_year: int, end_year: int) -> HolidayBitset:
+        """
+        指定された期間（年）の祝日・休日のビット列を取得
+        
+        作成済みのビット列が期間を含んでいればそれを返し、含まなければ
+        作成済みの期間と合わせた期間で作り直す。
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        
+        Returns:
+            HolidayBitset: 少なくとも指定された期間を含むビット列
+        """
+        if self._bitset_years is not None:
+            cached_start, cached_end = self._bitset_years
+            if start_year >= cached_start and end_year <= cached_end:
+                return self._bitset
+            start_year, end_year = min(start_year, cached_start), max(end_year, cached_end)
+        
+        self._compile_years(start_year, end_year)
+        ordinals = [
+            holiday['日付'].toordinal()
+            for year in range(start_year, end_year + 1)
+            for holiday in self._year_tables[year]
+        ]
+        self._bitset = HolidayBitset.from_ordinals(
+            date(start_year, 1, 1).toordinal(), date(end_year, 12, 31).toordinal(), ordinals
+        )
+        self._bitset_years = (start_year, end_year)
+        return self._bitset
+    
+    def is_holiday(self, dates) -> np.ndarray:
+        """
+        祝日・休日（振替休日・国民の休日・独自の休業日を含む）かどうかを一括で判定
+        
+        対象の年の祝日・休日をビット列にしておき、日付の配列をそのまま引く。
+        祝日法の施行前の日付は、独自の休日の定義がなければ常にFalseとなる。
+        
+        Parameters:
+            dates: date・datetime64[D]・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            np.ndarray: 祝日・休日ならTrue（スカラーの場合はbool）
+        """
+        ordinals = daynumber.to_ordinals(dates)
+        # ビット列の対象期間外の日付はFalseとなる
+        targets = ordinals if self.overlays else ordinals[ordinals >= self.LAW_START.toordinal()]
+        if targets.size == 0:
+            result = np.zeros(ordinals.shape, dtype=bool)
+            return result if result.ndim else False
+        years, _, _ = daynumber.ordinals_to_gregorian(np.array([targets.min(), targets.max()]))
+        return self.bitset(int(years[0]), int(years[1])).is_holiday(ordinals)
+    
+    def calculate(self, year: int, **kwargs) -> List[Dict]:
+        """
+        指定された年の祝日と休日を計算
+        
+        Parameters:
+            year (int): 年
+            **kwargs: 追加のオプション
+                include_substitute (bool): 振替休日を含めるかどうか。デフォルトはTrue
+        """
+        include_substitute = kwargs.get('include_substitute', True)
+        self._compile_years(year, year)
+        return [
+            dict(holiday) for holiday in self._year_tables[year]
+            if include_substitute or holiday['名称'] != '休日'
+        ]
+    
     def _get_text_width(self, text: str) -> int:
         """文字列の表示幅を計算（全角文字は2、半角文字は1として計算）"""
         width = 0
@@ -163,7 +366,7 @@ class Holiday(CalendarBase):
         if padding > 0:
             return text + " " * padding
         return text
-
+    
     def format_year(self, year: int, include_substitute: bool = True) -> str:
         """指定された年の祝日・休日を整形して文字列で返す"""
         results = self.calculate(year, include_substitute=include_substitute)
@@ -187,7 +390,7 @@ class Holiday(CalendarBase):
             )
         
         return "\n".join(output)
-
+    
     def print_substitute_details(self, year: int) -> None:
         """振替休日の詳細情報を表示"""
         results = self.calculate(year, include_substitute=True)
@@ -0,0 +1,139 @@
+"""
+独自の休日（会社の休業日など）の定義
+
+国民の祝日に重ねる休業日・出勤日を、次の形式の規則で宣言的に定義する。
+JSONファイルからも読み込める。
+    
+    {
+        "名称": "会社休日",
+        "休業日": [
+            {"名称": "年末年始", "開始": "12-29", "終了": "01-03"},
+            {"名称": "お盆休み", "開始": "08-13", "終了": "08-16"},
+            {"名称": "創立記念日", "月": 6, "日": 1, "開始年": 1990},
+            {"名称": "秋の休業日", "月": 11, "週": 3, "曜日": 4},
+            {"名称": "臨時休業", "日付": "2025-05-02"}
+        ],
+        "出勤日": [
+            {"名称": "棚卸し", "月": 4, "週": 4, "曜日": 5}
+        ]
+    }
+
+規則は次のいずれか。期間は終了日を含み、終了が開始より前なら翌年の終了日までとなる。
+    - 月・日: 毎年の固定日
+    - 月・週・曜日: 毎年の第n週の曜日（月曜 = 0〜日曜 = 6、週が負なら月末から数える）
+    - 開始・終了（"MM-DD"）: 毎年の期間（"02-29" は閏年以外では2月28日とする）
+    - 日付（"YYYY-MM-DD"）: 一度だけの日
+「開始年」「終了年」（含む）で規則を適用する年を限定できる。期間の規則では、
+期間の始まる年で判定する（年をまたぐ期間は、終了年に始まる期間の翌年分まで含む）。
+"""
+import calendar
+import json
+from datetime import date
+from typing import Dict, Iterable, List
+from ..core import daynumber
+
+
+class HolidayOverlay:
+    """
+    独自の休日の定義
+    
+    Holidayに渡すと、休業日は国民の祝日・休日と同じ年ごとの表とビット列に加わり、
+    出勤日は表から除かれる。
+    
+    Attributes:
+        name (str): 定義の名称（休業日の '種類' になる）
+        closures (List[Dict]): 休業日の規則
+        openings (List[Dict]): 出勤日（祝日・休日でも休まない日）の規則
+    """
+    
+    def __init__(self, name: str, closures: Iterable[Dict] = (), openings: Iterable[Dict] = ()):
+        """
+        Parameters:
+            name (str): 定義の名称
+            closures (Iterable[Dict]): 休業日の規則
+            openings (Iterable[Dict]): 出勤日の規則
+        """
+        self.name = name
+        self.closures = [self._validate(rule) for rule in closures]
+        self.openings = [self._validate(rule) for rule in openings]
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HolidayOverlay':
+        """辞書（JSONの内容）から作成"""
+        return cls(data.get('名称', '独自休日'), data.get('休業日', []), data.get('出勤日', []))
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'HolidayOverlay':
+        """JSONファイルから読み込む"""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    @staticmethod
+    def _validate(rule: Dict) -> Dict:
+        """規則の形式を確認"""
+        if '名称' not in rule:
+            raise ValueError(f"規則に名称がありません: {rule}")
+        kinds = [
+            {'日付'} <= rule.keys(),
+            {'開始', '終了'} <= rule.keys(),
+            {'月', '週', '曜日'} <= rule.keys(),
+            {'月', '日'} <= rule.keys() and '週' not in rule,
+        ]
+        if sum(kinds) != 1:
+            raise ValueError(f"規則の形式が不正です: {rule}")
+        return dict(rule)
+    
+    @staticmethod
+    def _month_day(text: str, year: int) -> int:
+        """"MM-DD" を指定された年の通日に変換（閏年以外の "02-29" は2月28日）"""
+        month, day = (int(part) for part in text.split('-'))
+        if (month, day) == (2, 29) and not calendar.isleap(year):
+            day = 28
+        return date(year, month, day).toordinal()
+    
+    def _rule_ordinals(self, rule: Dict, year: int) -> List[int]:
+        """規則に当てはまる、指定された年の日の通日"""
+        if '日付' in rule:
+            target = date.fromisoformat(rule['日付'])
+            return [target.toordinal()] if target.year == year else []
+        if '開始' in rule:
+            first, last = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+            ordinals = []
+            # 前年から続く期間と、その年に始まる期間（開始年・終了年は期間の始まる年で判定）
+            for start_year in (year - 1, year):
+                if not rule.get('開始年', start_year) <= start_year <= rule.get('終了年', start_year):
+                    continue
+                start = self._month_day(rule['開始'], start_year)
+                end = self._month_day(rule['終了'], start_year)
+                if end < start:
+                    end = self._month_day(rule['終了'], start_year + 1)
+                ordinals.extend(range(max(start, first), min(end, last) + 1))
+            return ordinals
+        if not rule.get('開始年', year) <= year <= rule.get('終了年', year):
+            return []
+        if '週' in rule:
+            target = date.fromordinal(
+                int(daynumber.nth_weekday_ordinals(year, rule['月'], rule['週'], rule['曜日']))
+            )
+            return [target.toordinal()] if target.month == rule['月'] else []
+        try:
+            return [date(year, rule['月'], rule['日']).toordinal()]
+        except ValueError:
+            # 閏年以外の2月29日など
+            return []
+    
+    def closure_dates(self, year: int) -> Dict[int, str]:
+        """指定された年の休業日（通日 → 名称）"""
+        return {
+            ordinal: rule['名称']
+            for rule in self.closures
+            for ordinal in self._rule_ordinals(rule, year)
+        }
+    
+    def opening_dates(self, year: int) -> Dict[int, str]:
+        """指定された年の出勤日（通日 → 名称）"""
+        return {
+            ordinal: rule['名称']
+            for rule in self.openings
+            for ordinal in self._rule_ordinals(rule, year)
+        }
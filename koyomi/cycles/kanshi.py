@@ -0,0 +1,242 @@
+"""
+六十干支の表
+
+60通りの干支を、漢字・読み・十干・十二支・納音・五行・八専の情報を持つ
+変更不可のオブジェクト（Kanshi）として一度だけ作る。日・年の干支の計算結果は
+この表への参照と日付（年）だけを持ち、従来の辞書と同じキーで参照できる。
+"""
+from collections.abc import Mapping
+from datetime import date
+from types import MappingProxyType
+from typing import Iterator
+
+# 十干(じっかん)
+JIKKAN = (
+    "甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"
+)
+JIKKAN_YOMI = (
+    "きのえ", "きのと", "ひのえ", "ひのと", "つちのえ",
+    "つちのと", "かのえ", "かのと", "みずのえ", "みずのと"
+)
+
+# 十二支(じゅうにし)
+JUNISHI = (
+    "子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"
+)
+JUNISHI_YOMI = (
+    "ね", "うし", "とら", "う", "たつ", "み",
+    "うま", "ひつじ", "さる", "とり", "いぬ", "い"
+)
+
+# 十干・十二支の五行
+JIKKAN_GOGYO = ("木", "木", "火", "火", "土", "土", "金", "金", "水", "水")
+JUNISHI_GOGYO = ("水", "土", "木", "木", "土", "火", "火", "土", "金", "金", "土", "水")
+
+# 納音の定義（甲子から順に2つずつの干支に対応）
+NATTOIN_DEFINITIONS = (
+    ('海中金', 'かいちゅうきん'), ('爐中火', 'ろちゅうか'), ('大林木', 'たいりんぼく'),
+    ('路傍土', 'ろぼうど'), ('釼鋒金', 'じんぼうきん'), ('山頭火', 'さんとうか'),
+    ('澗下水', 'かんかすい'), ('城頭土', 'じょうとうど'), ('白鑞金', 'はくろうきん'),
+    ('楊柳木', 'ようりゅうぼく'), ('井泉水', 'せいせんすい'), ('屋上土', 'おくじょうど'),
+    ('霹靂火', 'へきれきか'), ('松柏木', 'しょうはくぼく'), ('長流水', 'ちょうりゅうすい'),
+    ('沙中金', 'さちゅうきん'), ('山下火', 'さんげか'), ('平地木', 'へいちぼく'),
+    ('壁上土', 'へきじょうど'), ('金箔金', 'きんぱくきん'), ('覆燈火', 'ふくとうか'),
+    ('天河水', 'てんがすい'), ('大駅土', 'たいえきど'), ('釵釧金', 'さいせんきん'),
+    ('桑柘木', 'そうしゃくもく'), ('大溪水', 'だいけいすい'), ('沙中土', 'さちゅうど'),
+    ('天上火', 'てんじょうか'), ('柘榴木', 'ざくろぼく'), ('大海水', 'たいかいすい')
+)
+
+# 八専の期間（壬子〜癸亥、甲子を0とする48〜59番）と、そのうち間日となる番号
+HASSEN_START = 48
+HASSEN_MABI = (49, 52, 54, 58)
+
+
+def kanshi_index(jikkan: int, junishi: int) -> int:
+    """十干・十二支の番号（0始まり）から六十干支の番号（甲子 = 0）を求める"""
+    return (6 * jikkan - 5 * junishi) % 60
+
+
+def _stem(index: int, offset: int = 0) -> Mapping:
+    return MappingProxyType({'漢字': JIKKAN[index], '読み': JIKKAN_YOMI[index], '番号': index + offset})
+
+
+def _branch(index: int, offset: int = 0) -> Mapping:
+    return MappingProxyType({'漢字': JUNISHI[index], '読み': JUNISHI_YOMI[index], '番号': index + offset})
+
+
+# 十干・十二支の情報（番号は0始まり。年の干支は1始まりの番号を使う）
+STEMS = tuple(_stem(i) for i in range(10))
+BRANCHES = tuple(_branch(i) for i in range(12))
+YEAR_STEMS = tuple(_stem(i, 1) for i in range(10))
+YEAR_BRANCHES = tuple(_branch(i, 1) for i in range(12))
+
+
+class Kanshi(Mapping):
+    """
+    六十干支の1つ
+    
+    KANSHI_TABLE の要素として60個だけ作られ、変更できない。
+    辞書と同じように '干支'・'読み'・'十干'・'十二支'・'納音'・'五行'・'八専' の
+    キーで参照できる。
+    
+    Attributes:
+        index (int): 六十干支の番号（甲子 = 0〜癸亥 = 59）
+        kanji (str): 干支（例: "甲子"）
+        yomi (str): 読み（例: "きのえね"）
+        jikkan (Mapping): 十干の {'漢字', '読み', '番号'}（番号は0始まり）
+        junishi (Mapping): 十二支の {'漢字', '読み', '番号'}（番号は0始まり）
+        nattoin (Mapping): 納音の {'漢字', '読み', '対応干支'}
+        gogyo (str): 十干・十二支の五行（例: "水土"）
+        hassen (str | None): 八専の期間なら '八専' または '間日'、それ以外はNone
+    """
+    
+    __slots__ = ('index', 'kanji', 'yomi', 'jikkan', 'junishi', 'nattoin', 'gogyo', 'hassen')
+    
+    KEYS = ('干支', '読み', '十干', '十二支', '納音', '五行', '八専')
+    
+    def __init__(self, index: int, nattoin: Mapping):
+        stem, branch = index % 10, index % 12
+        values = {
+            'index': index,
+            'kanji': JIKKAN[stem] + JUNISHI[branch],
+            'yomi': JIKKAN_YOMI[stem] + JUNISHI_YOMI[branch],
+            'jikkan': STEMS[stem],
+            'junishi': BRANCHES[branch],
+            'nattoin': nattoin,
+            'gogyo': JIKKAN_GOGYO[stem] + JUNISHI_GOGYO[branch],
+            'hassen': None if index < HASSEN_START else ('間日' if index in HASSEN_MABI else '八専'),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Kanshiは変更できません")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Kanshiは変更できません")
+    
+    def __reduce__(self):
+        return (kanshi_of, (self.index,))
+    
+    def __getitem__(self, key: str):
+        if key == '干支':
+            return self.kanji
+        if key == '読み':
+            return self.yomi
+        if key == '十干':
+            return self.jikkan
+        if key == '十二支':
+            return self.junishi
+        if key == '納音':
+            return self.nattoin
+        if key == '五行':
+            return self.gogyo
+        if key == '八専':
+            return self.hassen
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __hash__(self) -> int:
+        return self.index
+    
+    def __repr__(self) -> str:
+        return f"Kanshi({self.index}, '{self.kanji}')"
+
+
+def _build_table():
+    table = []
+    for number, (kanji, yomi) in enumerate(NATTOIN_DEFINITIONS):
+        pair = tuple(JIKKAN[i % 10] + JUNISHI[i % 12] for i in (2 * number, 2 * number + 1))
+        nattoin = MappingProxyType({'漢字': kanji, '読み': yomi, '対応干支': pair})
+        table.extend(Kanshi(i, nattoin) for i in (2 * number, 2 * number + 1))
+    return tuple(table)
+
+
+# 六十干支の表（甲子 = 0〜癸亥 = 59）
+KANSHI_TABLE = _build_table()
+# 干支の文字列から表の要素への対応
+KANSHI_BY_NAME = MappingProxyType({kanshi.kanji: kanshi for kanshi in KANSHI_TABLE})
+
+
+def kanshi_of(index: int) -> Kanshi:
+    """六十干支の番号（60で割った余りを使う）から表の要素を取得"""
+    return KANSHI_TABLE[index % 60]
+
+
+class DayKanshi(Mapping):
+    """
+    日の干支（日付と六十干支の表の要素の組）
+    
+    DailyEto.calculate_single_day の従来の辞書と同じキー
+    （'日付'・'干支'・'読み'・'十干'・'十二支'・'通日'）で参照できる。
+    """
+    
+    __slots__ = ('date', 'kanshi')
+    
+    KEYS = ('日付', '干支', '読み', '十干', '十二支', '通日')
+    
+    def __init__(self, target_date: date, kanshi: Kanshi):
+        self.date = target_date
+        self.kanshi = kanshi
+    
+    def __getitem__(self, key: str):
+        if key == '日付':
+            return self.date
+        if key == '通日':
+            return self.kanshi.index + 1  # 1から60までの日番号
+        if key in ('干支', '読み', '十干', '十二支'):
+            return self.kanshi[key]
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __repr__(self) -> str:
+        return f"DayKanshi({self.date!r}, '{self.kanshi.kanji}')"
+
+
+class YearKanshi(Mapping):
+    """
+    年の干支（年と六十干支の表の要素の組）
+    
+    YearEto.calculate の従来の辞書と同じキー（'年'・'干支'・'読み'・'十干'・
+    '十二支'・'六十干支番号'）で参照できる。十干・十二支の番号は1始まり。
+    """
+    
+    __slots__ = ('year', 'kanshi')
+    
+    KEYS = ('年', '干支', '読み', '十干', '十二支', '六十干支番号')
+    
+    def __init__(self, year: int, kanshi: Kanshi):
+        self.year = year
+        self.kanshi = kanshi
+    
+    def __getitem__(self, key: str):
+        if key == '年':
+            return self.year
+        if key == '十干':
+            return YEAR_STEMS[self.kanshi.index % 10]
+        if key == '十二支':
+            return YEAR_BRANCHES[self.kanshi.index % 12]
+        if key == '六十干支番号':
+            return self.kanshi.index + 1
+        if key in ('干支', '読み'):
+            return self.kanshi[key]
+        raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __repr__(self) -> str:
+        return f"YearKanshi({self.year}, '{self.kanshi.kanji}')"
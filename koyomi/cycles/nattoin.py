@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from .eto_year import YearEto
+from .kanshi import KANSHI_TABLE
 from ..core.calendar_base import CalendarBase
 
 class Nattoin(CalendarBase):
@@ -7,65 +8,25 @@ class Nattoin(CalendarBase):
     
     # 納音の定義（60干支との対応）
     NATTOIN_DEFINITIONS = [
-        # 1-6
-        ('海中金', 'かいちゅうきん', ['甲子', '乙丑']),
-        ('爐中火', 'ろちゅうか', ['丙寅', '丁卯']),
-        ('大林木', 'たいりんぼく', ['戊辰', '己巳']),
-        ('路傍土', 'ろぼうど', ['庚午', '辛未']),
-        ('釼鋒金', 'じんぼうきん', ['壬申', '癸酉']),
-        ('山頭火', 'さんとうか', ['甲戌', '乙亥']),
-        # 7-12
-        ('澗下水', 'かんかすい', ['丙子', '丁丑']),
-        ('城頭土', 'じょうとうど', ['戊寅', '己卯']),
-        ('白鑞金', 'はくろうきん', ['庚辰', '辛巳']),
-        ('楊柳木', 'ようりゅうぼく', ['壬午', '癸未']),
-        ('井泉水', 'せいせんすい', ['甲申', '乙酉']),
-        ('屋上土', 'おくじょうど', ['丙戌', '丁亥']),
-        # 13-18
-        ('霹靂火', 'へきれきか', ['戊子', '己丑']),
-        ('松柏木', 'しょうはくぼく', ['庚寅', '辛卯']),
-        ('長流水', 'ちょうりゅうすい', ['壬辰', '癸巳']),
-        ('沙中金', 'さちゅうきん', ['甲午', '乙未']),
-        ('山下火', 'さんげか', ['丙申', '丁酉']),
-        ('平地木', 'へいちぼく', ['戊戌', '己亥']),
-        # 19-24
-        ('壁上土', 'へきじょうど', ['庚子', '辛丑']),
-        ('金箔金', 'きんぱくきん', ['壬寅', '癸卯']),
-        ('覆燈火', 'ふくとうか', ['甲辰', '乙巳']),
-        ('天河水', 'てんがすい', ['丙午', '丁未']),
-        ('大駅土', 'たいえきど', ['戊申', '己酉']),
-        ('釵釧金', 'さいせんきん', ['庚戌', '辛亥']),
-        # 25-30
-        ('桑柘木', 'そうしゃくもく', ['壬子', '癸丑']),
-        ('大溪水', 'だいけいすい', ['甲寅', '乙卯']),
-        ('沙中土', 'さちゅうど', ['丙辰', '丁巳']),
-        ('天上火', 'てんじょうか', ['戊午', '己未']),
-        ('柘榴木', 'ざくろぼく', ['庚申', '辛酉']),
-        ('大海水', 'たいかいすい', ['壬戌', '癸亥'])
+        (k.nattoin['漢字'], k.nattoin['読み'], k.nattoin['対応干支'])
+        for k in KANSHI_TABLE[::2]
     ]
-
+    
     def __init__(self):
         """初期化"""
         super().__init__()
         self.eto_calculator = YearEto()
         
-        # 干支から納音へのマッピングを作成
-        self.eto_to_nattoin = {}
-        for kanji, yomi, eto_list in self.NATTOIN_DEFINITIONS:
-            for eto in eto_list:
-                self.eto_to_nattoin[eto] = {
-                    '漢字': kanji,
-                    '読み': yomi,
-                    '対応干支': eto_list
-                }
-
+        # 干支から納音へのマッピング（六十干支の表の納音を参照する）
+        self.eto_to_nattoin = {k.kanji: k.nattoin for k in KANSHI_TABLE}
+    
     def calculate(self, year: int) -> Dict:
         """
         指定された年の納音を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Dict: 計算結果
             {
@@ -74,21 +35,17 @@ class Nattoin(CalendarBase):
                 '納音': {
                     '漢字': str,
                     '読み': str,
-                    '対応干支': List[str]
+                    '対応干支': Tuple[str, str]
                 }
             }
         """
-        # まず干支を計算
-        eto_result = self.eto_calculator.calculate(year)
-        kanshi = eto_result['干支']
-        
-        # 干支から納音を取得
-        nattoin_info = self.eto_to_nattoin.get(kanshi)
+        # 年の干支（六十干支の表の要素）が納音を持つ
+        kanshi = self.eto_calculator.calculate(year).kanshi
         
         return {
             '年': year,
-            '干支': kanshi,
-            '納音': nattoin_info
+            '干支': kanshi.kanji,
+            '納音': kanshi.nattoin
         }
     
     def calculate_range(self, start_year: int, end_year: int) -> List[Dict]:
@@ -1,7 +1,10 @@
-from typing import Dict, List
-from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Union
+from datetime import date
+import numpy as np
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
 from .eto_daily import DailyEto
+from .kanshi import KANSHI_BY_NAME
 
 class SpecificEto(CalendarBase):
     """特定の干支（甲子、庚申、己巳）の日を計算するクラス"""
@@ -14,27 +17,53 @@ class SpecificEto(CalendarBase):
         super().__init__()
         self.eto_calculator = DailyEto()
     
+    def calculate_range(
+        self,
+        start: Union[date, int],
+        end: Union[date, int],
+        targets: Optional[Iterable[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        指定された期間の特定干支の日を計算
+        
+        干支は60日ごとに巡るため、期間の最初の該当日を剰余で求め、
+        そこから60日おきの通日を並べる。
+        
+        Parameters:
+            start (date | int): 開始日（dateまたは通日）
+            end (date | int): 終了日（dateまたは通日、この日を含む）
+            targets (Iterable[str]): 対象の干支（六十干支のいずれか）。デフォルトはTARGET_ETO
+        
+        Returns:
+            Dict[str, np.ndarray]: 干支ごとの該当日の通日（昇順、int64）
+        """
+        targets = self.TARGET_ETO if targets is None else list(targets)
+        unknown = [eto for eto in targets if eto not in KANSHI_BY_NAME]
+        if unknown:
+            raise ValueError(f"六十干支ではありません: {', '.join(unknown)}")
+        
+        start = int(daynumber.to_ordinals(start))
+        end = int(daynumber.to_ordinals(end))
+        start_index = int(self.eto_calculator.kanshi_indices(start))
+        
+        results = {}
+        for eto in targets:
+            first = start + (KANSHI_BY_NAME[eto].index - start_index) % 60
+            results[eto] = np.arange(first, end + 1, 60, dtype=np.int64)
+        return results
+    
     def calculate_year(self, year: int) -> Dict[str, List[date]]:
         """
         指定された年の特定干支の日を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Dict[str, List[date]]: 干支ごとの日付リスト
         """
-        results = {eto: [] for eto in self.TARGET_ETO}
-        current_date = date(year, 1, 1)
-        
-        # 年末まで繰り返し
-        while current_date.year == year:
-            eto = self.eto_calculator.calculate_single_day(current_date)
-            if eto['干支'] in self.TARGET_ETO:
-                results[eto['干支']].append(current_date)
-            current_date += timedelta(days=1)
-        
-        return results
+        ordinals = self.calculate_range(date(year, 1, 1), date(year, 12, 31))
+        return {eto: daynumber.to_dates(days) for eto, days in ordinals.items()}
     
     def format_year(self, year: int) -> str:
         """
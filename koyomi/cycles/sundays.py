@@ -1,7 +1,6 @@
 from typing import Dict, List
-from datetime import date, timedelta
-import calendar
 from ..core.calendar_base import CalendarBase
+from ..core import daynumber
 
 class Sundays(CalendarBase):
     """日曜日を計算するクラス"""
@@ -12,16 +11,6 @@ class Sundays(CalendarBase):
     def __init__(self):
         """初期化"""
         super().__init__()
-        # 日本のカレンダー設定（月曜始まり）
-        self.calendar = calendar.Calendar(firstweekday=calendar.MONDAY)
-    
-    def _get_month_sundays(self, year: int, month: int) -> List[date]:
-        """指定された年月の日曜日を取得"""
-        return [
-            date(year, month, day)
-            for day in self.calendar.itermonthdays(year, month)
-            if day != 0 and date(year, month, day).weekday() == 6
-        ]
     
     def calculate(self, year: int) -> List[Dict]:
         """
@@ -29,7 +18,7 @@ class Sundays(CalendarBase):
         
         Parameters:
             year (int): 年
-            
+        
         Returns:
             List[Dict]: その年の全ての日曜日
             各要素は {
@@ -40,24 +29,20 @@ class Sundays(CalendarBase):
                 'ISO週番号': int  # ISO 8601の週番号
             }
         """
-        results = []
+        sundays, months, nths, weeks = daynumber.weekdays_in_years(6, year, year)
         
-        # 1月から12月まで処理
-        for month in range(1, 13):
-            sundays = self._get_month_sundays(year, month)
-            
-            # その月の日曜日を順番に処理
-            for i, sunday in enumerate(sundays, start=1):
-                year, week, _ = sunday.isocalendar()
-                results.append({
-                    '日付': sunday,
-                    '月': month,
-                    '日': sunday.day,
-                    '第n日曜': i,
-                    'ISO週番号': week
-                })
-        
-        return results
+        return [
+            {
+                '日付': sunday,
+                '月': month,
+                '日': sunday.day,
+                '第n日曜': nth,
+                'ISO週番号': week
+            }
+            for sunday, month, nth, week in zip(
+                daynumber.to_dates(sundays), months.tolist(), nths.tolist(), weeks.tolist()
+            )
+        ]
     
     def format_year(self, year: int, include_week_number: bool = False) -> str:
         """
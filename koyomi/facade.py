@@ -1,5 +1,6 @@
 from typing import Dict, List, Optional
 from datetime import date, datetime
+from .core.delta_t import DeltaTLike
 from .cycles.eto_year import YearEto
 from .cycles.eto_daily import DailyEto
 from .cycles.eto_month import MonthEto
@@ -13,20 +14,27 @@ from .seasonal.sekki import SolarTerms
 from .seasonal.zassetsu import Zassetsu
 from .seasonal.tanabata import Tanabata
 from .seasonal.doyo import Doyo
-from .utils.export import CalendarFileExporter
 from .seasonal.tsuyu import Tsuyuiri
 from .seasonal.hange import Hangesho
-from .seasonal.tanabata import Tanabata
 
 class KoyomiFacade:
     """暦計算機能のファサードクラス"""
     
-    def __init__(self):
-        """各計算機能のインスタンスを初期化"""
+    def __init__(self, delta_t: DeltaTLike = 69.0):
+        """
+        各計算機能のインスタンスを初期化
+        
+        Parameters:
+            delta_t (float | str | DeltaTModel): 天文計算に使うΔT値（秒）またはΔTモデル。
+                全ての計算クラスに同じ値を渡し、タイムスケールを共有する。
+                数世紀にわたる計算では 'espenak-meeus' などのモデルを指定する
+        """
+        self.delta_t = delta_t
+        
         # 干支関連
         self.year_eto = YearEto()
         self.daily_eto = DailyEto()
-        self.month_eto = MonthEto()
+        self.month_eto = MonthEto(delta_t=delta_t)
         self.specific_eto = SpecificEto()
         
         # 暦注関連
@@ -35,16 +43,20 @@ class KoyomiFacade:
         self.hassen = Hassen()
         
         # 季節関連
-        self.sekki = SolarTerms()
-        self.zassetsu = Zassetsu()
-        self.tanabata = Tanabata()
+        self.sekki = SolarTerms(delta_t)
+        self.zassetsu = Zassetsu(delta_t)
+        self.tanabata = Tanabata(delta_t)
         
         # その他
-        self.holiday = Holiday()
+        self.holiday = Holiday(delta_t)
         self.sundays = Sundays()
         
         # 土用計算機の初期化を追加
-        self.doyo_calculator = Doyo()
+        self.doyo_calculator = Doyo(delta_t)
+        
+        # 入梅・半夏生（呼び出しごとに生成しないよう保持する）
+        self.tsuyuiri = Tsuyuiri(delta_t)
+        self.hangesho = Hangesho(delta_t)
     
     def get_year_info(self, year: int) -> Dict:
         """年の基本情報を取得"""
@@ -95,6 +107,7 @@ class KoyomiFacade:
         hassen_events = self.hassen.calculate_year(year)
         if hassen_events:
             events['八専'] = hassen_events
+            events['八専期間'] = self.hassen.calculate_periods(date(year, 1, 1), date(year, 12, 31))
             # 八専と間日の日数を計算
             hassen_count = len([e for e in hassen_events if e['種類'] == '八専'])
             mabi_count = len([e for e in hassen_events if e['種類'] == '間日'])
@@ -118,16 +131,13 @@ class KoyomiFacade:
         })
         
         # 入梅
-        tsuyuiri = Tsuyuiri()
-        events['入梅'] = [tsuyuiri.calculate(year)]
+        events['入梅'] = [self.tsuyuiri.calculate(year)]
         
         # 半夏生
-        hangesho = Hangesho()
-        events['半夏生'] = [hangesho.calculate(year)]
+        events['半夏生'] = [self.hangesho.calculate(year)]
         
         # 七夕（新暦・伝統的）
-        tanabata = Tanabata()
-        events['七夕'] = tanabata.calculate(year)
+        events['七夕'] = self.tanabata.calculate(year)
         
         return events  # 土用を含む全てのイベントを返す
     
@@ -141,7 +151,7 @@ class KoyomiFacade:
         """
         year_info = self.get_year_info(year)
         daily_events = self.get_daily_events(year) if include_stats else None
-
+        
         output = [
             f"\n{year}年の暦情報",
             "=" * 50,
@@ -214,7 +224,8 @@ class KoyomiFacade:
         daily_events = self.get_daily_events(year)
         monthly_info = [self.get_month_info(year, month) for month in range(1, 13)]
         
-        # エクスポート実行
+        # エクスポート実行（pandasはエクスポート時にのみ読み込む）
+        from .utils.export import CalendarFileExporter
         exporter = CalendarFileExporter(output_dir)
         exporter.export_year_data(
             year_info,
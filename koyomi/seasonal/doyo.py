@@ -1,11 +1,14 @@
 from typing import Dict, List
+import numpy as np
 from .longitude_base import SolarLongitudeEvent
-from datetime import datetime
-from skyfield.api import utc
+from ..core.delta_t import DeltaTLike
 
 class Doyo(SolarLongitudeEvent):
     """土用の日付を計算するクラス"""
     
+    # イベントキャッシュでの種類名
+    CACHE_EVENT_TYPE = '土用'
+    
     # 土用の定義
     DOYO_DEFINITIONS = {
         '冬土用': 297.0,
@@ -14,12 +17,18 @@ class Doyo(SolarLongitudeEvent):
         '秋土用': 207.0
     }
     
-    def __init__(self, delta_t: float = 69.0):
+    def __init__(self, delta_t: DeltaTLike = 69.0, precision: str = 'exact'):
         """
         Parameters:
-            delta_t (float): ΔT値（秒）。デフォルトは2024年の概算値
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
+            precision (str): 'exact' または 'date'（SolarLongitudeEvent参照）
         """
-        super().__init__(0.0, delta_t)
+        super().__init__(0.0, delta_t, precision)
+    
+    @property
+    def cache_event_type(self) -> str:
+        """イベントキャッシュでの種類名"""
+        return self._precision_event_type(self.CACHE_EVENT_TYPE)
     
     def calculate(self, year: int) -> List[Dict]:
         """
@@ -27,39 +36,66 @@ class Doyo(SolarLongitudeEvent):
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             List[Dict]: 土用の日付リスト
         """
-        results = []
+        return self.calculate_range(year, year)
+    
+    def calculate_range(self, start_year: int, end_year: int) -> List[Dict]:
+        """
+        指定された期間の全ての土用の日付を一括で計算
         
-        # 探索期間を1年の前後に設定
-        t0 = self.astronomical.ts.from_datetime(
-            datetime(year - 1, 7, 1, tzinfo=utc)
-        )
-        t1 = self.astronomical.ts.from_datetime(
-            datetime(year + 1, 6, 30, tzinfo=utc)
-        )
+        全ての年・季節の探索を一度の一括探索にまとめて行う。
         
-        for season, longitude in self.DOYO_DEFINITIONS.items():
-            self.target_longitude = longitude
-            
-            # 目標の黄経となる時刻を探索
-            time = self.astronomical.find_solar_term_date(
-                longitude, t0, t1
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        
+        Returns:
+            List[Dict]: 土用の日付リスト（日付順）
+        """
+        self._check_years(start_year, end_year)
+        years = list(range(start_year, end_year + 1))
+        seasons = list(self.DOYO_DEFINITIONS.keys())
+        
+        # キャッシュにない年だけを探索する
+        events = self._load_cached_events(self.cache_event_type, years)
+        missing = [year for year in years if year not in events]
+        if missing:
+            # 年×季節の全ての探索区間をまとめて探索
+            targets, t0, t1 = self.astronomical.solar_longitude_windows(
+                missing, list(self.DOYO_DEFINITIONS.values())
+            )
+            times = self.astronomical.find_solar_longitude_dates(
+                targets, t0, t1, method='secant', precision=self.precision
             )
             
-            dt = self.astronomical.to_jst_datetime(time)
-            
-            # 指定された年のデータのみを使用
-            if dt.year == year:
-                results.append(self._create_result(
-                    f"{year}{season}",
-                    dt,
-                    season
-                ))
+            found = {year: [] for year in missing}
+            jst_years = self.astronomical.to_jst_datetime64(times).astype('datetime64[Y]').astype(int) + 1970
+            for i, time in enumerate(times):
+                year = missing[i // len(seasons)]
+                season = seasons[i % len(seasons)]
+                
+                # 指定された年のデータのみを使用
+                if jst_years[i] == year:
+                    found[year].append((season, time))
+            self._store_cached_events(self.cache_event_type, found)
+            events.update(found)
+        
+        labels = [(year, season) for year in years for season, _ in events[year]]
+        if not labels:
+            return []
+        times = self.astronomical.ts.tt_jd(
+            np.array([time.whole for year in years for _, time in events[year]]),
+            np.array([time.tt_fraction for year in years for _, time in events[year]])
+        )
+        results = [
+            self._create_result(f"{year}{season}", dt_jst, season)
+            for (year, season), dt_jst in zip(labels, self.astronomical.to_jst_datetimes(times))
+        ]
         
         # 日付順にソート
         results.sort(key=lambda x: x['datetime_jst'])
         
-        return results
\ No newline at end of file
+        return results
@@ -1,16 +1,18 @@
 from typing import Dict
 from .longitude_base import SolarLongitudeEvent
+from ..core.delta_t import DeltaTLike
 
 class Hangesho(SolarLongitudeEvent):
     """半夏生の日付を計算するクラス"""
     
-    def __init__(self, delta_t: float = 69.0):
+    def __init__(self, delta_t: DeltaTLike = 69.0, precision: str = 'exact'):
         """
         Parameters:
-            delta_t (float): ΔT値（秒）。デフォルトは2024年の概算値
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
+            precision (str): 'exact' または 'date'（SolarLongitudeEvent参照）
         """
         # 半夏生の黄経は100度
-        super().__init__(100.0, delta_t)
+        super().__init__(100.0, delta_t, precision)
     
     def calculate(self, year: int) -> Dict:
         """
@@ -18,7 +20,7 @@ class Hangesho(SolarLongitudeEvent):
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Dict: 計算結果
             {
@@ -29,7 +31,7 @@ class Hangesho(SolarLongitudeEvent):
             }
         """
         # 半夏生は7月頃
-        dt = self._find_longitude_date(year, 7, 1)
+        dt = self._find_longitude_date(year)
         
         return self._create_result(
             f"{year}半夏生",
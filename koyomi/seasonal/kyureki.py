@@ -0,0 +1,463 @@
+import numpy as np
+from datetime import date, datetime, timedelta, timezone
+from ..core.calendar_base import CalendarBase
+from ..core.delta_t import DeltaTLike
+from ..core.daynumber import UNIX_EPOCH_ORDINAL, to_ordinals
+from .sekki import SolarTerms
+from typing import Dict, List, Optional, Tuple
+
+# 冬至の節気番号（SOLAR_TERMS_JPの添字、黄経270度）
+WINTER_SOLSTICE_INDEX = 18
+
+
+class KyurekiTable:
+    """
+    旧暦の月の表
+    
+    月ごとに1行を持ち、各列は時刻順に並んでいる。月の初日（朔日）は
+    date.toordinal() の通日で保持し、最後の月の翌月の初日を番兵として末尾に持つ。
+    
+    Attributes:
+        month_start (np.ndarray): 月の初日の通日（int32、月数+1）
+        year (np.ndarray): 旧暦の年（int16）
+        month (np.ndarray): 旧暦の月（int8、1〜12）
+        leap (np.ndarray): 閏月かどうか（bool）
+        new_moon_tt (np.ndarray): 朔の瞬間（TTユリウス日、月数+1）
+    """
+    
+    def __init__(
+        self,
+        month_start: np.ndarray,
+        year: np.ndarray,
+        month: np.ndarray,
+        leap: np.ndarray,
+        new_moon_tt: np.ndarray
+    ):
+        self.month_start = np.asarray(month_start, dtype=np.int32)
+        self.year = np.asarray(year, dtype=np.int16)
+        self.month = np.asarray(month, dtype=np.int8)
+        self.leap = np.asarray(leap, dtype=bool)
+        self.new_moon_tt = np.asarray(new_moon_tt, dtype=float)
+        # (年, 月, 閏) を並び順どおりの整数にしたもの（旧暦→新暦の二分探索用）
+        self.month_key = self.encode_month(self.year, self.month, self.leap)
+    
+    @staticmethod
+    def encode_month(year, month, leap) -> np.ndarray:
+        """(年, 月, 閏) を並び順どおりの整数に変換（閏月は同じ番号の月の直後）"""
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        leap = np.asarray(leap, dtype=np.int64)
+        return (year * 13 + month) * 2 + leap
+    
+    @classmethod
+    def concatenate(cls, tables: List['KyurekiTable']) -> 'KyurekiTable':
+        """
+        時刻順に並んだ複数の表を連結
+        
+        隣り合う表は重なっていてもよく（次の表の最初の月が前の表の範囲内か番兵の位置にある）、
+        重なった月は後の表のものを使う。
+        """
+        parts = []
+        for table, following in zip(tables, tables[1:]):
+            cut = np.searchsorted(table.month_start, following.first_ordinal)
+            parts.append((table, cut))
+        parts.append((tables[-1], len(tables[-1]) + 1))
+        return cls(
+            np.concatenate([table.month_start[:cut] for table, cut in parts]),
+            np.concatenate([table.year[:cut] for table, cut in parts]),
+            np.concatenate([table.month[:cut] for table, cut in parts]),
+            np.concatenate([table.leap[:cut] for table, cut in parts]),
+            np.concatenate([table.new_moon_tt[:cut] for table, cut in parts])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.year)
+    
+    @property
+    def first_ordinal(self) -> int:
+        """表が扱う最初の日の通日"""
+        return int(self.month_start[0])
+    
+    @property
+    def last_ordinal(self) -> int:
+        """表が扱う最後の日の通日"""
+        return int(self.month_start[-1]) - 1
+    
+    @property
+    def month_length(self) -> np.ndarray:
+        """各月の日数（29または30）"""
+        return np.diff(self.month_start)
+    
+    def to_kyureki(self, ordinals: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        通日の配列を旧暦に変換
+        
+        Parameters:
+            ordinals (np.ndarray): 通日（date.toordinal()）
+        
+        Returns:
+            Dict[str, np.ndarray]: {'年', '月', '日', '閏月'} の各列
+        """
+        ordinals = np.asarray(ordinals, dtype=np.int64)
+        if ordinals.size and (ordinals.min() < self.first_ordinal or ordinals.max() > self.last_ordinal):
+            raise ValueError("旧暦の表の範囲外の日付が指定されています")
+        index = np.searchsorted(self.month_start, ordinals, side='right') - 1
+        return {
+            '年': self.year[index],
+            '月': self.month[index],
+            '日': (ordinals - self.month_start[index] + 1).astype(np.int8),
+            '閏月': self.leap[index]
+        }
+    
+    def from_kyureki(self, year, month, day, leap=False) -> np.ndarray:
+        """
+        旧暦の年月日の配列を通日に変換
+        
+        Parameters:
+            year: 旧暦の年
+            month: 旧暦の月（1〜12）
+            day: 旧暦の日（1〜30）
+            leap: 閏月かどうか
+        
+        Returns:
+            np.ndarray: 通日（int64）
+        """
+        key, day = np.broadcast_arrays(
+            self.encode_month(year, month, leap), np.asarray(day, dtype=np.int64)
+        )
+        index = np.minimum(np.searchsorted(self.month_key, key), len(self.month_key) - 1)
+        if np.any(self.month_key[index] != key):
+            raise ValueError("旧暦の表にない月（または存在しない閏月）が指定されています")
+        if np.any((day < 1) | (day > self.month_length[index])):
+            raise ValueError("旧暦の月の日数を超える日が指定されています")
+        return self.month_start[index].astype(np.int64) + day - 1
+
+
+class Kyureki(CalendarBase):
+    """
+    旧暦（太陰太陽暦）を計算するクラス
+    
+    複数年分の朔と中気を一度に求めて月の表を作り、新暦と旧暦の変換は
+    表の二分探索で行う。月の番号は次の規則で決める。
+    
+    - 朔を含む日（JST）を月の初日とする
+    - 冬至を含む月を11月とする
+    - 冬至から次の冬至までに13か月ある場合は、11月の後で最初の中気を含まない月を閏月とする
+    
+    この規則では、2033年（旧暦2033年問題）は閏11月となる。
+    """
+    
+    # 計算済みの表を広げるときに、まとめて作る年数
+    GROWTH_YEARS = 10
+    
+    def __init__(self, delta_t: DeltaTLike = 69.0):
+        """
+        Parameters:
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
+        """
+        super().__init__(delta_t)
+        self.sekki_calculator = SolarTerms(delta_t)
+        # 月の表と、その対象期間（新暦の年）
+        self._table: Optional[KyurekiTable] = None
+        self._table_years: Optional[Tuple[int, int]] = None
+    
+    def _jst_midnight(self, year: int, month: int, day: int):
+        """JSTでの指定日0時のTime objectを取得"""
+        dt = datetime(year, month, day, tzinfo=timezone.utc) - timedelta(hours=9)
+        return self.astronomical.ts.from_datetime(dt)
+    
+    def _find_new_moons(self, start_year: int, end_year: int):
+        """
+        開始年の前年10月から終了年の翌々年2月までの朔を一括で求める
+        
+        Returns:
+            Time: 朔の瞬間
+        """
+        t0 = self._jst_midnight(start_year - 1, 10, 1)
+        t1 = self._jst_midnight(end_year + 2, 2, 1)
+        return self.astronomical.find_new_moons(t0, t1)
+    
+    def _build(self, start_year: int, end_year: int) -> KyurekiTable:
+        """
+        指定された期間（新暦の年）の全ての日を含む旧暦の月の表を作成
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        """
+        # 前年と翌年の冬至まで含めて中気を求める
+        terms = self.sekki_calculator.calculate_range(start_year - 1, end_year + 1)
+        term_ordinals = np.array([dt.toordinal() for dt in terms.datetimes], dtype=np.int64)
+        chuki = term_ordinals[terms.indices % 2 == 0]
+        winter = term_ordinals[terms.indices == WINTER_SOLSTICE_INDEX]
+        
+        new_moons = self._find_new_moons(start_year, end_year)
+        starts = (
+            self.astronomical.to_jst_datetime64(new_moons).astype('datetime64[D]').astype(np.int64)
+            + UNIX_EPOCH_ORDINAL
+        )
+        
+        # 各月（starts[i]〜starts[i+1]の前日）が中気を含むか
+        chuki_count = np.diff(np.searchsorted(chuki, starts))
+        has_chuki = chuki_count > 0
+        # 冬至を含む月の番号
+        winter_months = np.searchsorted(starts, winter, side='right') - 1
+        
+        first, last = winter_months[0], winter_months[-1]
+        n_months = last - first
+        year = np.zeros(n_months, dtype=np.int64)
+        month = np.zeros(n_months, dtype=np.int64)
+        leap = np.zeros(n_months, dtype=bool)
+        
+        # 冬至から次の冬至までの月に番号を付ける
+        for winter_year, (a, b) in enumerate(zip(winter_months[:-1], winter_months[1:]), start_year - 1):
+            leap_month = None
+            if b - a == 13:
+                without_chuki = [i for i in range(a + 1, b) if not has_chuki[i]]
+                if without_chuki:
+                    leap_month = without_chuki[0]
+            
+            number, kyureki_year = 11, winter_year
+            for i in range(a, b):
+                if i == leap_month:
+                    leap[i - first] = True
+                elif i > a:
+                    number = number % 12 + 1
+                    if number == 1:
+                        kyureki_year += 1
+                year[i - first] = kyureki_year
+                month[i - first] = number
+        
+        return KyurekiTable(
+            starts[first:last + 1], year, month, leap, new_moons.tt[first:last + 1]
+        )
+    
+    def _year_limits(self, start_year: int, end_year: int) -> Optional[Tuple[int, int]]:
+        """
+        表を作れる年の範囲（前年・翌年の冬至と朔がエフェメリスの対応期間に収まる年）
+        
+        Returns:
+            tuple: (最初の年, 最後の年)。期間がエフェメリスの対応期間外の場合や、
+                   対応期間が分からないファイルの場合はNone
+        """
+        from ..core.ephemeris import EphemerisRegistry
+        for spec in EphemerisRegistry.specs(self.ephemeris):
+            if spec.covers(start_year, end_year):
+                return spec.start_year + 1, spec.end_year - 1
+        return None
+    
+    def _ensure_years(self, start_year: int, end_year: int) -> KyurekiTable:
+        """
+        指定された期間（新暦の年）を含む月の表を取得（必要な場合のみ作る）
+        
+        計算済みの期間と重なるか隣接する場合は、不足する年だけの表を作って連結する。
+        1年ずつ広げる呼び出しが続いても作り直しが増えないよう、広げるときは
+        GROWTH_YEARS年分をまとめて作る。
+        
+        エフェメリスの対応期間の最初と最後の年は、表をその年の中に収まる月までに狭めるため、
+        表がその年の全ての日を含むとは限らない。
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        """
+        limits = self._year_limits(start_year, end_year)
+        if limits is not None:
+            start_year = min(max(start_year, limits[0]), limits[1])
+            end_year = max(min(end_year, limits[1]), start_year)
+        # 前年と翌年の冬至・朔も使うため、その年まで対応している必要がある
+        self._check_years(start_year - 1, end_year + 1)
+        if self._table_years is None:
+            self._table = self._build(start_year, end_year)
+            self._table_years = (start_year, end_year)
+            return self._table
+        
+        cached_start, cached_end = self._table_years
+        if cached_start <= start_year and end_year <= cached_end:
+            return self._table
+        
+        if start_year > cached_end + 1 or end_year < cached_start - 1:
+            # 離れた期間は作り直す
+            self._table = self._build(start_year, end_year)
+            self._table_years = (start_year, end_year)
+            return self._table
+        
+        if limits is not None:
+            if start_year < cached_start:
+                start_year = max(min(start_year, cached_start - self.GROWTH_YEARS), limits[0])
+            if end_year > cached_end:
+                end_year = min(max(end_year, cached_end + self.GROWTH_YEARS), limits[1])
+        
+        tables = []
+        if start_year < cached_start:
+            tables.append(self._build(start_year, cached_start - 1))
+        tables.append(self._table)
+        if end_year > cached_end:
+            tables.append(self._build(cached_end + 1, end_year))
+        
+        self._table = KyurekiTable.concatenate(tables)
+        self._table_years = (min(start_year, cached_start), max(end_year, cached_end))
+        return self._table
+    
+    def calculate_table(self, start_year: int, end_year: int) -> KyurekiTable:
+        """
+        指定された期間の全ての日を含む旧暦の月の表を取得
+        
+        Parameters:
+            start_year (int): 開始年（新暦）
+            end_year (int): 終了年（新暦、含む）
+        
+        Returns:
+            KyurekiTable: 月の表
+        """
+        return self._ensure_years(start_year, end_year)
+    
+    def to_kyureki(self, dates) -> Dict[str, np.ndarray]:
+        """
+        新暦の日付を一括で旧暦に変換
+        
+        Parameters:
+            dates: date・datetime64[D]・通日のいずれか（スカラーまたは配列）
+        
+        Returns:
+            Dict[str, np.ndarray]: {'年', '月', '日', '閏月'} の各列
+        """
+        ordinals = to_ordinals(dates)
+        if ordinals.size == 0:
+            return self._ensure_years(2000, 2000).to_kyureki(ordinals)
+        start_year = date.fromordinal(int(ordinals.min())).year
+        end_year = date.fromordinal(int(ordinals.max())).year
+        return self._ensure_years(start_year, end_year).to_kyureki(ordinals)
+    
+    def from_kyureki(self, year, month, day, leap=False) -> np.ndarray:
+        """
+        旧暦の年月日を一括で新暦の日付に変換
+        
+        Parameters:
+            year: 旧暦の年（スカラーまたは配列）
+            month: 旧暦の月（1〜12）
+            day: 旧暦の日（1〜30）
+            leap: 閏月かどうか
+        
+        Returns:
+            np.ndarray: 新暦の日付（datetime64[D]）
+        """
+        year = np.asarray(year, dtype=np.int64)
+        key = KyurekiTable.encode_month(year, month, leap)
+        table = self._table
+        if table is None or key.min() < table.month_key[0] or key.max() > table.month_key[-1]:
+            # 旧暦の年の月は新暦の同年1月〜翌年2月頃に含まれる
+            table = self._ensure_years(int(year.min()), int(year.max()) + 1)
+        ordinals = table.from_kyureki(year, month, day, leap)
+        return (ordinals - UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
+    
+    def convert(self, target_date: date) -> Dict:
+        """
+        新暦の日付を旧暦に変換
+        
+        Parameters:
+            target_date (date): 新暦の日付
+        
+        Returns:
+            Dict: 変換結果
+            {
+                '日付': date,
+                '旧暦年': int,
+                '旧暦月': int,
+                '旧暦日': int,
+                '閏月': bool,
+                '表記': "閏MM月DD日" または "MM月DD日"
+            }
+        """
+        result = self.to_kyureki(target_date)
+        kyureki_month = int(result['月'])
+        kyureki_day = int(result['日'])
+        leap = bool(result['閏月'])
+        return {
+            '日付': target_date,
+            '旧暦年': int(result['年']),
+            '旧暦月': kyureki_month,
+            '旧暦日': kyureki_day,
+            '閏月': leap,
+            '表記': f"{'閏' if leap else ''}{kyureki_month}月{kyureki_day}日"
+        }
+    
+    def to_date(self, year: int, month: int, day: int, leap: bool = False) -> date:
+        """
+        旧暦の年月日を新暦の日付に変換
+        
+        Parameters:
+            year (int): 旧暦の年
+            month (int): 旧暦の月
+            day (int): 旧暦の日
+            leap (bool): 閏月かどうか
+        
+        Returns:
+            date: 新暦の日付
+        """
+        return self.from_kyureki(year, month, day, leap).item()
+    
+    def new_moon_on_or_before(self, target_date: date) -> datetime:
+        """
+        指定された日以前で最も近い朔（その日を初日とする旧暦の月の朔）の日時を取得
+        
+        Parameters:
+            target_date (date): 新暦の日付
+        
+        Returns:
+            datetime: 朔の日時（JST）
+        """
+        ordinal = target_date.toordinal()
+        table = self._ensure_years(target_date.year, target_date.year)
+        if table.first_ordinal <= ordinal <= table.last_ordinal:
+            index = np.searchsorted(table.month_start, ordinal, side='right') - 1
+            time = self.astronomical.ts.tt_jd(table.new_moon_tt[index])
+            return self.astronomical.to_jst_datetimes(time)
+        
+        # エフェメリスの対応期間の端で表に含まれない日は、その日までの朔だけを求める
+        start = date.fromordinal(ordinal - 31)
+        self._check_years(start.year, target_date.year)
+        next_day = date.fromordinal(ordinal + 1)
+        new_moons = self.astronomical.find_new_moons(
+            self._jst_midnight(start.year, start.month, start.day),
+            self._jst_midnight(next_day.year, next_day.month, next_day.day)
+        )
+        datetimes = self.astronomical.to_jst_datetimes(new_moons)
+        return [dt for dt in datetimes if dt.date() <= target_date][-1]
+    
+    def calculate(self, year: int) -> List[Dict]:
+        """
+        指定された年（新暦）に始まる旧暦の月を計算
+        
+        Parameters:
+            year (int): 対象年
+        
+        Returns:
+            List[Dict]: 旧暦の月の初日（朔）のリスト。各要素は以下の形式:
+            {
+                '識別子': f"{year}旧暦{旧暦年}年{月名}",
+                '年月日時刻': "YYYY/MM/DD HH:MM:SS",
+                'datetime_jst': 朔の日時 (JST),
+                'イベント名': 月名（例: "閏6月"）
+            }
+        """
+        table = self._ensure_years(year, year)
+        first, last = date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+        if first < table.first_ordinal or table.last_ordinal < last:
+            raise ValueError(f"{year}年の旧暦の月は、エフェメリスの対応期間では求められません")
+        start = np.searchsorted(table.month_start, first)
+        stop = np.searchsorted(table.month_start[:-1], last + 1)
+        
+        datetimes = self.astronomical.to_jst_datetimes(
+            self.astronomical.ts.tt_jd(table.new_moon_tt[start:stop])
+        )
+        
+        results = []
+        for i, dt in zip(range(start, stop), datetimes):
+            name = f"{'閏' if table.leap[i] else ''}{table.month[i]}月"
+            results.append(self._create_result(
+                f"{year}旧暦{table.year[i]}年{name}",
+                dt,
+                name
+            ))
+        return results
@@ -1,53 +1,82 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 from ..core.calendar_base import CalendarBase
-from skyfield.api import utc
+from ..core.delta_t import DeltaTLike
 
 class SolarLongitudeEvent(CalendarBase):
     """太陽黄経に基づく暦要素の基底クラス"""
     
-    def __init__(self, longitude: float, delta_t: Optional[float] = None):
+    def __init__(self, longitude: float, delta_t: DeltaTLike = None, precision: str = 'exact'):
+        """
+        Parameters:
+            longitude (float): 目標の太陽黄経（度）
+            delta_t (float | str | DeltaTModel, optional): ΔT値（秒）またはΔTモデル
+            precision (str): 'exact'（エフェメリスで求める）または 'date'（解析式で求め、
+                             JSTの0時に近い場合だけエフェメリスで求め直す。日付は'exact'と一致し、
+                             時刻は数分ずれうる）
+        """
+        if precision not in ('exact', 'date'):
+            raise ValueError(f"未対応の精度です: {precision}")
         super().__init__(delta_t)
         self.target_longitude = longitude
+        self.precision = precision
+    
+    def _precision_event_type(self, name: str) -> str:
+        """日付精度の瞬間を精密な瞬間と区別したイベントキャッシュでの種類名"""
+        return f"{name}（日付精度）" if self.precision == 'date' else name
     
-    def _find_longitude_date(self, year: int, search_month: int, months_range: int = 1) -> datetime:
+    @property
+    def cache_event_type(self) -> str:
+        """イベントキャッシュでの種類名（目標の黄経で区別する）"""
+        return self._precision_event_type(f"黄経{self.target_longitude:g}度")
+    
+    def _find_longitude_date(self, year: int) -> datetime:
         """
-        指定された月の前後で目標の太陽黄経となる日時を探索
+        指定された年に目標の太陽黄経となる日時を探索
+        
+        _find_longitude_dates と同じ探索区間・解法を使うため、イベントキャッシュの
+        同じ種類名に保存される日時は、どちらから求めても同じになる。
         
         Parameters:
             year (int): 対象年
-            search_month (int): 探索の中心となる月
-            months_range (int): 探索範囲（前後の月数）
-            
+        
         Returns:
             datetime: 目標の黄経となる日時（JST）
         """
-        # 探索期間の設定
-        start_year = year
-        start_month = search_month - months_range
-        if start_month < 1:
-            start_month += 12
-            start_year -= 1
-            
-        end_year = year
-        end_month = search_month + months_range
-        if end_month > 12:
-            end_month -= 12
-            end_year += 1
+        return self._find_longitude_dates([year])[0]
+    
+    def _find_longitude_dates(self, years: List[int]) -> List[datetime]:
+        """
+        複数年について目標の太陽黄経となる日時を一括で探索
         
-        t0 = self.astronomical.ts.from_datetime(
-            datetime(start_year, start_month, 1, tzinfo=utc)
-        )
-        t1 = self.astronomical.ts.from_datetime(
-            datetime(end_year, end_month, 1, tzinfo=utc)
-        )
+        Parameters:
+            years (List[int]): 対象年のリスト
         
-        # 目標の黄経となる時刻を探索
-        time = self.astronomical.find_solar_term_date(
-            self.target_longitude, t0, t1
+        Returns:
+            List[datetime]: 各年の目標の黄経となる日時（JST）
+        """
+        if years:
+            self._check_years(min(years), max(years))
+        cached = self._load_cached_events(self.cache_event_type, years)
+        missing = [year for year in years if year not in cached]
+        if missing:
+            targets, t0, t1 = self.astronomical.solar_longitude_windows(
+                missing, [self.target_longitude]
+            )
+            times = self.astronomical.find_solar_longitude_dates(
+                targets, t0, t1, method='secant', precision=self.precision
+            )
+            found = {year: [(None, time)] for year, time in zip(missing, times)}
+            self._store_cached_events(self.cache_event_type, found)
+            cached.update(found)
+        if not years:
+            return []
+        times = self.astronomical.ts.tt_jd(
+            np.array([cached[year][0][1].whole for year in years]),
+            np.array([cached[year][0][1].tt_fraction for year in years])
         )
-        
-        return self.astronomical.to_jst_datetime(time)
+        return self.astronomical.to_jst_datetimes(times)
     
     def calculate(self, year: int) -> Dict:
         """
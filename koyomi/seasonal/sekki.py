@@ -1,18 +1,356 @@
 import pytz
+import numpy as np
+from datetime import datetime, timedelta
 from ..core.calendar_base import CalendarBase
+from ..core.delta_t import DeltaTLike
 from skyfield import almanac_east_asia as almanac_ea
 from skyfield import almanac
-from typing import List, Dict
+from skyfield.api import utc
+from typing import List, Dict, Optional, Tuple
+
+class SolarTermTable:
+    """
+    二十四節気の計算結果を列ごとに保持するクラス
+    
+    各列は時刻順に並んでおり、年ごとの切り出しは再計算なしで行える。
+    
+    Attributes:
+        indices (np.ndarray): 節気番号（0-23、0が春分。SOLAR_TERMS_JPの添字）
+        tt (np.ndarray): 節気の瞬間（TTユリウス日）
+        datetimes (List[datetime]): 節気の瞬間（JST）
+        years (np.ndarray): JSTでの年
+    """
+    
+    def __init__(
+        self,
+        indices: np.ndarray,
+        tt: np.ndarray,
+        datetimes: List[datetime],
+        years: np.ndarray
+    ):
+        self.indices = np.asarray(indices, dtype=int)
+        self.tt = np.asarray(tt, dtype=float)
+        self.datetimes = list(datetimes)
+        self.years = np.asarray(years, dtype=int)
+    
+    @classmethod
+    def empty(cls) -> 'SolarTermTable':
+        """空の表を作成"""
+        return cls(np.array([], dtype=int), np.array([]), [], np.array([], dtype=int))
+    
+    @classmethod
+    def concatenate(cls, tables: List['SolarTermTable']) -> 'SolarTermTable':
+        """時刻順に並んだ複数の表を連結"""
+        tables = [table for table in tables if len(table)]
+        if not tables:
+            return cls.empty()
+        return cls(
+            np.concatenate([table.indices for table in tables]),
+            np.concatenate([table.tt for table in tables]),
+            [dt for table in tables for dt in table.datetimes],
+            np.concatenate([table.years for table in tables])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    @property
+    def names(self) -> List[str]:
+        """節気名の列"""
+        return [almanac_ea.SOLAR_TERMS_JP[idx] for idx in self.indices]
+    
+    def _slice(self, start: int, stop: int) -> 'SolarTermTable':
+        return SolarTermTable(
+            self.indices[start:stop],
+            self.tt[start:stop],
+            self.datetimes[start:stop],
+            self.years[start:stop]
+        )
+    
+    def for_years(self, start_year: int, end_year: int) -> 'SolarTermTable':
+        """
+        指定された期間（JSTでの年）の節気を切り出す
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        """
+        start = np.searchsorted(self.years, start_year, side='left')
+        stop = np.searchsorted(self.years, end_year, side='right')
+        return self._slice(start, stop)
+    
+    def for_year(self, year: int) -> 'SolarTermTable':
+        """指定された年（JST）の節気を切り出す"""
+        return self.for_years(year, year)
+    
+    def between(self, start_tt: float, end_tt: float) -> 'SolarTermTable':
+        """指定された期間（TTユリウス日、開始を含み終了を含まない）の節気を切り出す"""
+        start = np.searchsorted(self.tt, start_tt, side='left')
+        stop = np.searchsorted(self.tt, end_tt, side='left')
+        return self._slice(start, stop)
 
 class SolarTerms(CalendarBase):
     """二十四節気を計算するクラス"""
     
-    def __init__(self, delta_t: float = 69.0):
+    # イベントキャッシュでの種類名
+    CACHE_EVENT_TYPE = '二十四節気'
+    
+    def __init__(self, delta_t: DeltaTLike = 69.0, precision: str = 'exact'):
         """
         Parameters:
-            delta_t (float): ΔT値（秒）。デフォルトは2024年の概算値
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
+            precision (str): 'exact'（エフェメリスで求める）または 'date'（解析式で求め、
+                             JSTの0時に近い節気だけエフェメリスで求め直す。日付は'exact'と一致し、
+                             時刻は数分ずれうる）
         """
+        if precision not in ('exact', 'date'):
+            raise ValueError(f"未対応の精度です: {precision}")
         super().__init__(delta_t)
+        self.precision = precision
+        # 計算済みの節気と、その対象期間（JSTでの年）
+        self._table = SolarTermTable.empty()
+        self._table_years: Optional[Tuple[int, int]] = None
+        # calculate_termsで個別に求めた節気（(年, 節気番号) → JST日時）
+        self._term_datetimes: Dict[Tuple[int, int], datetime] = {}
+    
+    @property
+    def cache_event_type(self) -> str:
+        """イベントキャッシュでの種類名（日付精度の瞬間は精密な瞬間と区別する）"""
+        if self.precision == 'date':
+            return f"{self.CACHE_EVENT_TYPE}（日付精度）"
+        return self.CACHE_EVENT_TYPE
+    
+    def _jst_new_year(self, year: int):
+        """JSTでの1月1日0時のTime objectを取得"""
+        dt = datetime(year, 1, 1, tzinfo=utc) - timedelta(hours=9)
+        return self.astronomical.ts.from_datetime(dt)
+    
+    def _sweep(self, start_year: int, end_year: int) -> SolarTermTable:
+        """
+        指定された期間（JSTでの年）の節気を求める
+        
+        全ての年がキャッシュにあればそこから作り、なければ一度のfind_discreteで求めて
+        キャッシュにない年だけを保存する（保存済みの瞬間は上書きしない）。
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        """
+        years = range(start_year, end_year + 1)
+        cached = self._load_cached_events(self.cache_event_type, years)
+        if len(cached) == len(years):
+            return self._table_from_events([event for year in years for event in cached[year]])
+        
+        if self.precision == 'date':
+            table, times = self._search_date_precision(start_year, end_year)
+        else:
+            table, times = self._search(start_year, end_year)
+        events = {year: [] for year in years if year not in cached}
+        for index, time, year in zip(table.indices, times, table.years):
+            if int(year) in events:
+                events[int(year)].append((int(index), time))
+        self._store_cached_events(self.cache_event_type, events)
+        return table
+    
+    def _search(self, start_year: int, end_year: int) -> Tuple[SolarTermTable, object]:
+        """
+        指定された期間（JSTでの年）の節気を一度のfind_discreteで求める
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        
+        Returns:
+            tuple: (SolarTermTable, 節気の瞬間のTime object)
+        """
+        t0 = self._jst_new_year(start_year)
+        t1 = self._jst_new_year(end_year + 1)
+        t, y = almanac.find_discrete(t0, t1, almanac_ea.solar_terms(self.astronomical.eph))
+        
+        datetimes = self.astronomical.to_jst_datetimes(t)
+        years = np.array([dt.year for dt in datetimes], dtype=int)
+        
+        # 期間の境界ちょうどの節気は翌年に属するため除外する
+        keep = (years >= start_year) & (years <= end_year)
+        table = SolarTermTable(
+            np.asarray(y)[keep],
+            np.atleast_1d(t.tt)[keep],
+            [dt for dt, k in zip(datetimes, keep) if k],
+            years[keep]
+        )
+        return table, t[keep]
+    
+    def _search_date_precision(self, start_year: int, end_year: int) -> Tuple[SolarTermTable, object]:
+        """
+        指定された期間（JSTでの年）の節気を解析式で一括して求める
+        
+        JSTの0時に近い節気だけエフェメリスで求め直すため、日付は_searchと一致する。
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        
+        Returns:
+            tuple: (SolarTermTable, 節気の瞬間のTime object)
+        """
+        # 各年の探索区間はその年の中に収まる（年の境界に最も近い節気は冬至と小寒）
+        targets, t0, t1 = self.astronomical.solar_longitude_windows(
+            range(start_year, end_year + 1), np.arange(0, 360, 15)
+        )
+        t = self.astronomical.find_solar_longitude_dates(targets, t0, t1, precision='date')
+        
+        order = np.argsort(t.tt)
+        t = t[order]
+        indices = np.rint(targets[order] / 15).astype(int) % 24
+        datetimes = self.astronomical.to_jst_datetimes(t)
+        years = np.array([dt.year for dt in datetimes], dtype=int)
+        
+        keep = (years >= start_year) & (years <= end_year)
+        table = SolarTermTable(
+            indices[keep],
+            t.tt[keep],
+            [dt for dt, k in zip(datetimes, keep) if k],
+            years[keep]
+        )
+        return table, t[keep]
+    
+    def _table_from_events(self, events: List[Tuple]) -> SolarTermTable:
+        """
+        キャッシュから読み出した (節気番号, Time object) のリストから表を作成
+        
+        Parameters:
+            events (List[Tuple]): 時刻順の (節気番号, Time object) のリスト
+        """
+        if not events:
+            return SolarTermTable.empty()
+        times = self.astronomical.ts.tt_jd(
+            np.array([time.whole for _, time in events]),
+            np.array([time.tt_fraction for _, time in events])
+        )
+        datetimes = self.astronomical.to_jst_datetimes(times)
+        return SolarTermTable(
+            [index for index, _ in events],
+            times.tt,
+            datetimes,
+            [dt.year for dt in datetimes]
+        )
+    
+    def _ensure_years(self, start_year: int, end_year: int) -> None:
+        """
+        指定された期間の節気が計算済みになるようにする
+        
+        計算済みの期間と重なるか隣接する場合は、不足する年だけを求めて連結する。
+        """
+        self._check_years(start_year, end_year)
+        if self._table_years is None:
+            self._table = self._sweep(start_year, end_year)
+            self._table_years = (start_year, end_year)
+            return
+        
+        cached_start, cached_end = self._table_years
+        if start_year >= cached_start and end_year <= cached_end:
+            return
+        
+        if start_year > cached_end + 1 or end_year < cached_start - 1:
+            # 離れた期間は計算し直す
+            self._table = self._sweep(start_year, end_year)
+            self._table_years = (start_year, end_year)
+            return
+        
+        tables = []
+        if start_year < cached_start:
+            tables.append(self._sweep(start_year, cached_start - 1))
+        tables.append(self._table)
+        if end_year > cached_end:
+            tables.append(self._sweep(cached_end + 1, end_year))
+        
+        self._table = SolarTermTable.concatenate(tables)
+        self._table_years = (min(start_year, cached_start), max(end_year, cached_end))
+    
+    def calculate_range(self, start_year: int, end_year: int) -> SolarTermTable:
+        """
+        指定された期間の二十四節気を一度の探索で計算
+        
+        Parameters:
+            start_year (int): 開始年
+            end_year (int): 終了年（含む）
+        
+        Returns:
+            SolarTermTable: 節気番号・瞬間・JST日時・年の列を持つ表
+        """
+        self._ensure_years(start_year, end_year)
+        return self._table.for_years(start_year, end_year)
+    
+    def calculate_window(self, start: datetime, end: datetime) -> SolarTermTable:
+        """
+        指定された期間（日時）の二十四節気を計算
+        
+        Parameters:
+            start (datetime): 開始日時（タイムゾーン付き、含む）
+            end (datetime): 終了日時（タイムゾーン付き、含まない）
+        
+        Returns:
+            SolarTermTable: 節気番号・瞬間・JST日時・年の列を持つ表
+        """
+        tz_jst = self.astronomical.tz_jst
+        self._ensure_years(start.astimezone(tz_jst).year, end.astimezone(tz_jst).year)
+        return self._table.between(
+            self.astronomical.ts.from_datetime(start).tt,
+            self.astronomical.ts.from_datetime(end).tt
+        )
+    
+    def calculate_terms(self, year: int, names: List[str]) -> List[Dict]:
+        """
+        指定された年の特定の節気だけを計算
+        
+        一年分の節気を求めず、指定された節気の黄経（15度の倍数）だけを、平均太陽から
+        見積もった日時の前後数日の区間から割線法で一括して求める。一年分の節気が
+        計算済みの場合はそこから取り出す。
+        
+        Parameters:
+            year (int): 対象年
+            names (List[str]): 節気名のリスト（例: ['春分', '秋分']）
+        
+        Returns:
+            List[Dict]: 指定された節気の日時リスト（時刻順、形式はcalculateと同じ）
+        """
+        unknown = [name for name in names if name not in almanac_ea.SOLAR_TERMS_JP]
+        if unknown:
+            raise ValueError(f"未知の節気名です: {', '.join(unknown)}")
+        indices = sorted({almanac_ea.SOLAR_TERMS_JP.index(name) for name in names})
+        self._check_years(year, year)
+        
+        if self._table_years is not None and self._table_years[0] <= year <= self._table_years[1]:
+            table = self._table.for_year(year)
+            for index, dt_jst in zip(table.indices, table.datetimes):
+                self._term_datetimes[(year, int(index))] = dt_jst
+        
+        missing = [index for index in indices if (year, index) not in self._term_datetimes]
+        if missing:
+            # 真太陽と平均太陽の差は最大約2日のため、前後3日の区間に必ず含まれる
+            targets, t0, t1 = self.astronomical.solar_longitude_windows(
+                [year], np.array(missing) * 15.0, margin_days=3.0
+            )
+            if self.precision == 'date':
+                times = self.astronomical.find_solar_longitude_dates(
+                    targets, t0, t1, precision='date'
+                )
+            else:
+                # find_discreteと同じ程度（1ミリ秒未満）まで収束させる
+                times, _ = self.astronomical.solve_solar_longitudes(
+                    targets, (t0 + t1) / 2, time_tolerance=1e-9, angle_tolerance=1e-9
+                )
+            for index, dt_jst in zip(missing, self.astronomical.to_jst_datetimes(times)):
+                self._term_datetimes[(year, index)] = dt_jst
+        
+        terms = sorted(
+            (self._term_datetimes[(year, index)], almanac_ea.SOLAR_TERMS_JP[index])
+            for index in indices
+        )
+        return [
+            self._create_result(f"{year}{name_ja}", dt_jst, name_ja)
+            for dt_jst, name_ja in terms
+        ]
     
     def calculate(self, year: int) -> List[Dict]:
         """
@@ -20,7 +358,7 @@ class SolarTerms(CalendarBase):
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             List[Dict]: 二十四節気の日時リスト。各要素は以下の形式:
             {
@@ -30,31 +368,12 @@ class SolarTerms(CalendarBase):
                 'イベント名': 節気名
             }
         """
-        # 計算期間の設定（年の前後1ヶ月を含む）
-        t0, t1 = self._get_year_range(year, 1, 1)
-        
-        # 二十四節気の計算
-        t, y = almanac.find_discrete(t0, t1, almanac_ea.solar_terms(self.astronomical.eph))
+        table = self.calculate_range(year, year)
         
-        results = []
-        for time, idx in zip(t, y):
-            # 日本時間に変換
-            dt_jst = self.astronomical.to_jst_datetime(time)
-            
-            # 指定された年のデータのみを抽出
-            if dt_jst.year == year:
-                name_ja = almanac_ea.SOLAR_TERMS_JP[idx]
-                
-                results.append(self._create_result(
-                    f"{year}{name_ja}",
-                    dt_jst,
-                    name_ja
-                ))
-        
-        # 日付でソート
-        results.sort(key=lambda x: x['datetime_jst'])
-        
-        return results
+        return [
+            self._create_result(f"{year}{name_ja}", dt_jst, name_ja)
+            for name_ja, dt_jst in zip(table.names, table.datetimes)
+        ]
     
     def print_terms(self, year: int) -> None:
         """
@@ -73,4 +392,4 @@ class SolarTerms(CalendarBase):
             print(f"{term['イベント名']:<10} {term['年月日時刻']:<30}")
         
         print("-" * 50)
-        print(f"総計: {len(terms)}件の節気\n")
\ No newline at end of file
+        print(f"総計: {len(terms)}件の節気\n")
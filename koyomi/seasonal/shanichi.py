@@ -1,16 +1,17 @@
 from typing import Dict, List
 from datetime import datetime, timedelta
 from ..core.calendar_base import CalendarBase
+from ..core.delta_t import DeltaTLike
 from .sekki import SolarTerms
 from ..cycles.eto_daily import DailyEto
 
 class Shanichi(CalendarBase):
     """社日を計算するクラス"""
     
-    def __init__(self, delta_t: float = 69.0):
+    def __init__(self, delta_t: DeltaTLike = 69.0):
         """
         Parameters:
-            delta_t (float): ΔT値（秒）。デフォルトは2024年の概算値
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
         """
         super().__init__(delta_t)
         self.sekki_calculator = SolarTerms(delta_t)
@@ -18,7 +19,7 @@ class Shanichi(CalendarBase):
     
     def _find_sekki_date(self, year: int, sekki_name: str) -> datetime:
         """二十四節気から春分・秋分の日付を取得"""
-        terms = self.sekki_calculator.calculate(year)
+        terms = self.sekki_calculator.calculate_terms(year, [sekki_name])
         for term in terms:
             if term['イベント名'] == sekki_name:
                 return term['datetime_jst']
@@ -31,7 +32,7 @@ class Shanichi(CalendarBase):
         Parameters:
             base_date (datetime): 基準となる日付
             range_days (int): 前後の探索日数
-            
+        
         Returns:
             datetime: 最も近い戊の日
         """
@@ -72,7 +73,7 @@ class Shanichi(CalendarBase):
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             List[Dict]: 社日の日付リスト
         """
@@ -96,7 +97,7 @@ class Shanichi(CalendarBase):
         results.sort(key=lambda x: x['datetime_jst'])
         
         return results
-
+    
     def print_details(self, year: int) -> None:
         """
         社日の詳細情報を表示（デバッグ用）
@@ -109,7 +110,7 @@ class Shanichi(CalendarBase):
             if not sekki_date:
                 print(f"{sekki_name}の日時が取得できませんでした。")
                 continue
-                
+            
             print(f"{sekki_name}: {sekki_date.strftime('%Y/%m/%d %H:%M:%S')}")
             
             # 最も近い戊の日を探す
@@ -1,20 +1,24 @@
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from ..core.calendar_base import CalendarBase
-from .sekki import SolarTerms
-from skyfield import almanac
-from skyfield.api import utc
+from ..core.delta_t import DeltaTLike
+from .kyureki import Kyureki
 
 class Tanabata(CalendarBase):
     """七夕の日付を計算するクラス（新暦七夕と伝統的七夕）"""
     
-    def __init__(self, delta_t: float = 69.0):
+    # イベントキャッシュでの種類名（伝統的七夕の起点となる新月）
+    CACHE_EVENT_TYPE = '七夕の新月'
+    
+    def __init__(self, delta_t: DeltaTLike = 69.0):
         """
         Parameters:
-            delta_t (float): ΔT値（秒）。デフォルトは2024年の概算値
+            delta_t (float | str | DeltaTModel): ΔT値（秒）またはΔTモデル。デフォルトは2024年の概算値
         """
         super().__init__(delta_t)
-        self.sekki_calculator = SolarTerms(delta_t)
+        # 新月は旧暦の月の表から求める（節気の計算も共有する）
+        self.kyureki = Kyureki(delta_t)
+        self.sekki_calculator = self.kyureki.sekki_calculator
     
     def _find_shosho(self, year: int) -> Optional[datetime]:
         """
@@ -22,84 +26,55 @@ class Tanabata(CalendarBase):
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Optional[datetime]: 処暑の日時。見つからない場合はNone
         """
-        terms = self.sekki_calculator.calculate(year)
+        terms = self.sekki_calculator.calculate_terms(year, ['処暑'])
         for term in terms:
             if term['イベント名'] == '処暑':
                 return term['datetime_jst']
         return None
-
-    def _find_all_new_moons(self, shosho_time: datetime) -> List[datetime]:
-        """
-        処暑を含む日までの2ヶ月前からの新月をすべて取得
-        
-        Parameters:
-            shosho_time (datetime): 処暑の日時
-            
-        Returns:
-            List[datetime]: 新月の日時リスト
+    
+    def _find_base_new_moon(self, year: int) -> Optional[datetime]:
         """
-        # 探索開始時刻（処暑の2ヶ月前）
-        start_time = self.astronomical.ts.from_datetime(
-            shosho_time - timedelta(days=60)
-        )
+        伝統的七夕の起点となる新月（処暑の日までで最も近い新月）を取得
         
-        # 探索終了時刻（処暑の翌日）
-        end_time = self.astronomical.ts.from_datetime(
-            shosho_time + timedelta(days=1)
-        )
-        
-        # 新月を取得
-        t, y = almanac.find_discrete(
-            start_time,
-            end_time,
-            almanac.moon_phases(self.astronomical.eph)
-        )
-        
-        # 新月（月相が0）のみをフィルタリングし、JSTに変換
-        new_moons = [
-            self.astronomical.to_jst_datetime(t_i)
-            for t_i, y_i in zip(t, y) if y_i == 0
-        ]
-        
-        return new_moons
-
-    def _find_nearest_new_moon(self, shosho_time: datetime, new_moons: List[datetime]) -> Optional[datetime]:
-        """
-        処暑に最も近い新月を見つける（処暑の日までで）
+        イベントキャッシュが有効な場合は、保存された新月があればそれを返す。
         
         Parameters:
-            shosho_time (datetime): 処暑の日時
-            new_moons (List[datetime]): 新月の日時リスト
-            
+            year (int): 対象年
+        
         Returns:
-            Optional[datetime]: 最も近い新月の日時。見つからない場合はNone
+            Optional[datetime]: 新月の日時。見つからない場合はNone
         """
-        shosho_date = shosho_time.date()
+        cached = self._load_cached_events(self.CACHE_EVENT_TYPE, [year])
+        if year in cached:
+            events = cached[year]
+            return self.astronomical.to_jst_datetimes(events[0][1]) if events else None
+        
         nearest_new_moon = None
-        min_diff = float('inf')
         
-        for new_moon in new_moons:
-            new_moon_date = new_moon.date()
-            time_diff = (shosho_date - new_moon_date).days
-            
-            # 新月が処暑と同じ日か前の日の場合のみ対象とする
-            if time_diff >= 0 and time_diff < min_diff:
-                min_diff = time_diff
-                nearest_new_moon = new_moon
+        # 処暑の日時を取得
+        shosho = self._find_shosho(year)
+        if shosho:
+            # 処暑を含む旧暦の月の朔（処暑の日までで最も近い新月）
+            nearest_new_moon = self.kyureki.new_moon_on_or_before(shosho.date())
+        
+        events = []
+        if nearest_new_moon:
+            events.append((None, self.astronomical.ts.from_datetime(nearest_new_moon)))
+        self._store_cached_events(self.CACHE_EVENT_TYPE, {year: events})
         
         return nearest_new_moon
-
+    
     def calculate_modern(self, year: int) -> Dict:
         """
         新暦の七夕（7月7日）を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Dict: 計算結果
         """
@@ -109,29 +84,18 @@ class Tanabata(CalendarBase):
             tanabata_date,
             "新暦七夕"
         )
-
+    
     def calculate_traditional(self, year: int) -> Optional[Dict]:
         """
         伝統的七夕（処暑前の最も近い新月から数えて7日目）を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             Optional[Dict]: 計算結果。計算できない場合はNone
         """
-        # 処暑の日時を取得
-        shosho = self._find_shosho(year)
-        if not shosho:
-            return None
-        
-        # 新月を取得
-        new_moons = self._find_all_new_moons(shosho)
-        if not new_moons:
-            return None
-        
-        # 処暑に最も近い新月を見つける
-        nearest_new_moon = self._find_nearest_new_moon(shosho, new_moons)
+        nearest_new_moon = self._find_base_new_moon(year)
         if not nearest_new_moon:
             return None
         
@@ -143,14 +107,14 @@ class Tanabata(CalendarBase):
             tanabata_date,
             "伝統的七夕"
         )
-
+    
     def calculate(self, year: int) -> List[Dict]:
         """
         指定された年の新暦と伝統的七夕を計算
         
         Parameters:
             year (int): 対象年
-            
+        
         Returns:
             List[Dict]: 七夕の日付リスト
         """
@@ -1,8 +1,10 @@
-from typing import Dict, List, Union
-import pandas as pd
+from typing import Dict, List, Mapping, Union, TYPE_CHECKING
 from datetime import datetime, date
 import os
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class CalendarExporter:
     """暦データのエクスポート機能を提供するクラス"""
     
@@ -14,11 +16,11 @@ class CalendarExporter:
         return dt
     
     @staticmethod
-    def _flatten_date(data: Dict, prefix: str = '') -> Dict:
-        """ネストされた辞書を平坦化"""
+    def _flatten_date(data: Mapping, prefix: str = '') -> Dict:
+        """ネストされた辞書（干支の計算結果などのMappingを含む）を平坦化"""
         flattened = {}
         for key, value in data.items():
-            if isinstance(value, dict):
+            if isinstance(value, Mapping):
                 nested = CalendarExporter._flatten_date(value, f"{prefix}{key}_")
                 flattened.update(nested)
             else:
@@ -29,14 +31,18 @@ class CalendarExporter:
         return flattened
 
     @staticmethod
-    def create_year_summary_df(year_info: Dict) -> pd.DataFrame:
+    def create_year_summary_df(year_info: Dict) -> 'pd.DataFrame':
         """年間サマリーをDataFrameに変換"""
+        import pandas as pd
+        
         flattened = CalendarExporter._flatten_date(year_info)
         return pd.DataFrame([flattened])
 
     @staticmethod
-    def create_daily_events_df(daily_events: Dict) -> Dict[str, pd.DataFrame]:
+    def create_daily_events_df(daily_events: Dict) -> Dict[str, 'pd.DataFrame']:
         """日単位イベントをDataFrameに変換"""
+        import pandas as pd
+        
         dfs = {}
         
         # 日付を日付のみの形式に変換する関数
@@ -91,8 +97,12 @@ class CalendarExporter:
             
             dfs['土用'] = pd.DataFrame(doyo_data)
 
-        # 八専
-        if '八専' in daily_events:
+        # 八専（期間の表があれば初日をそのまま使う）
+        if '八専期間' in daily_events:
+            periods = daily_events['八専期間']
+            hassen_periods = [date.fromordinal(start) for start in periods.clipped_start.tolist()]
+            dfs['八専'] = pd.DataFrame({"八専開始日": hassen_periods})
+        elif '八専' in daily_events:
             hassen_periods = []
             current_period = None
             sorted_events = sorted(daily_events['八専'], key=lambda x: x['日付'])
@@ -141,8 +151,10 @@ class CalendarExporter:
         return dfs
     
     @staticmethod
-    def create_monthly_events_df(monthly_info: List[Dict], daily_events: Dict = None) -> Dict[str, pd.DataFrame]:
+    def create_monthly_events_df(monthly_info: List[Dict], daily_events: Dict = None) -> Dict[str, 'pd.DataFrame']:
         """月別イベントをDataFrameに変換"""
+        import pandas as pd
+        
         dfs = {}
         all_sekki = []
         all_zassetsu = []
@@ -220,8 +232,10 @@ class CalendarFileExporter:
         os.makedirs(output_dir, exist_ok=True)
         self.exporter = CalendarExporter()
     
-    def _save_excel(self, dfs: Dict[str, pd.DataFrame], filename: str):
+    def _save_excel(self, dfs: Dict[str, 'pd.DataFrame'], filename: str):
         """DataFrameをExcelファイルとして保存"""
+        import pandas as pd
+        
         with pd.ExcelWriter(
             os.path.join(self.output_dir, filename),
             engine='openpyxl',
@@ -262,8 +276,10 @@ class CalendarFileExporter:
                                 date_cell.number_format = 'yyyy/mm/dd'
 
     
-    def _save_csv(self, dfs: Dict[str, pd.DataFrame], base_filename: str):
+    def _save_csv(self, dfs: Dict[str, 'pd.DataFrame'], base_filename: str):
         """DataFrameをCSVファイルとして保存"""
+        import pandas as pd
+        
         for name, df in dfs.items():
             if not df.empty:
                 df_formatted = df.copy()
@@ -0,0 +1,108 @@
+from koyomi.core.astronomical import AstronomicalCalculator
+from koyomi.core.chebyshev import SolarLongitudeChebyshev
+from koyomi.seasonal.doyo import Doyo
+import numpy as np
+import os
+import tempfile
+import time
+
+def test_batch_longitude_search():
+    """一括探索で求めた時刻の太陽黄経が目標と一致することを確認"""
+    calculator = AstronomicalCalculator(69.0)
+    
+    years = range(2000, 2030)
+    targets, t0, t1 = calculator.solar_longitude_windows(years, [0.0, 80.0, 100.0, 297.0])
+    times = calculator.find_solar_longitude_dates(targets, t0, t1)
+    
+    lon = calculator.get_solar_longitude(times)
+    diff = (lon - targets + 180.0) % 360.0 - 180.0
+    print(f"最大誤差: {np.max(np.abs(diff)) * 3600:.3f}秒角")
+    assert np.all(np.abs(diff) < 1e-4)
+    
+    # 年の順に並んでいること
+    assert np.all(np.diff(times.tt.reshape(len(years), 4), axis=0) > 0)
+
+def test_secant_solver():
+    """割線法が少ない評価回数で二分探索と同じ時刻に収束することを確認"""
+    calculator = AstronomicalCalculator(69.0)
+    
+    targets, t0, t1 = calculator.solar_longitude_windows(range(2000, 2030), np.arange(0, 360, 15))
+    bisect_times = calculator.find_solar_longitude_dates(targets, t0, t1, tolerance=1e-7)
+    secant_times, info = calculator.solve_solar_longitudes(targets, (t0 + t1) / 2)
+    
+    print(f"評価回数の分布: {np.bincount(info['評価回数'])}")
+    assert np.max(info['評価回数']) <= 4
+    assert np.max(np.abs(secant_times.tt - bisect_times.tt)) * 86400 < 0.1
+    
+    # 探索開始時刻以降で最初の通過を求める
+    start = calculator.ts.utc(2023, 7, 1)
+    end = calculator.ts.utc(2025, 6, 30)
+    solved = calculator.find_solar_term_date(297.0, start, end, method='secant')
+    assert solved.utc_strftime('%Y-%m-%d') == '2024-01-17'
+    assert calculator.last_solver_info['評価回数'] <= 4
+    assert calculator.find_solar_term_date(297.0, start, calculator.ts.utc(2024, 1, 10), method='secant') is None
+
+def test_chebyshev_model():
+    """チェビシェフ近似がskyfieldの黄経と一致し、保存・読み込みできることを確認"""
+    calculator = AstronomicalCalculator(69.0)
+    start = calculator.ts.utc(2020, 1, 1).tt
+    model = SolarLongitudeChebyshev.fit(calculator, start, start + 32 * 40)
+    print(f"最大誤差: {model.max_error * 3600:.4f}秒角")
+    assert model.max_error * 3600 < 0.01
+    
+    tt = np.random.default_rng(0).uniform(model.start_jd, model.end_jd, 2000)
+    reference = calculator.get_solar_longitude(calculator.ts.tt_jd(tt))
+    diff = (model.evaluate(tt) - reference + 180.0) % 360.0 - 180.0
+    assert np.max(np.abs(diff)) * 3600 < 0.01
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model.npz')
+        model.save(path)
+        loaded = SolarLongitudeChebyshev.load(path)
+    assert np.array_equal(loaded.evaluate(tt), model.evaluate(tt))
+    assert loaded.ephemeris == 'de421'
+    
+    # 係数ファイルはディレクトリを設定した場合だけ保存する
+    with tempfile.TemporaryDirectory() as directory:
+        SolarLongitudeChebyshev.set_cache_dir(directory)
+        try:
+            SolarLongitudeChebyshev._cache.clear()
+            calculator.solar_longitude_model
+            assert os.listdir(directory) == ['sun_longitude_de421.npz']
+        finally:
+            SolarLongitudeChebyshev.set_cache_dir(None)
+            SolarLongitudeChebyshev._cache.clear()
+
+def test_doyo_range():
+    """200年分の土用を一括で計算"""
+    doyo = Doyo()
+    
+    start = time.perf_counter()
+    results = doyo.calculate_range(1900, 2049)
+    elapsed = time.perf_counter() - start
+    print(f"1900-2049年の土用: {len(results)}件 ({elapsed:.2f}秒)")
+    
+    assert len(results) == 150 * 4
+    assert [r['イベント名'] for r in doyo.calculate(2024)] == ['冬土用', '春土用', '夏土用', '秋土用']
+
+def test_batch_jst_conversion():
+    """Time配列の日本標準時への一括変換が1件ずつの変換と一致することを確認"""
+    calculator = AstronomicalCalculator(69.0)
+    start = calculator.ts.utc(1960, 1, 1).tt
+    times = calculator.ts.tt_jd(np.random.default_rng(0).uniform(start, start + 365.25 * 80, 2000))
+    
+    expected = [calculator.to_jst_datetime(t) for t in times]
+    assert calculator.to_jst_datetimes(times) == expected
+    assert calculator.to_jst_datetime64(times).dtype == np.dtype('datetime64[us]')
+    assert calculator.to_jst_datetime64(times)[0] == np.datetime64(expected[0].replace(tzinfo=None))
+    
+    # スカラーのTime
+    assert calculator.to_jst_datetimes(times[0]) == expected[0]
+    assert calculator.to_jst_datetimes(calculator.ts.utc(2024, 12, 31, 15)).strftime('%Y-%m-%d %H:%M %Z') == '2025-01-01 00:00 JST'
+
+if __name__ == "__main__":
+    test_batch_longitude_search()
+    test_secant_solver()
+    test_chebyshev_model()
+    test_doyo_range()
+    test_batch_jst_conversion()
@@ -0,0 +1,53 @@
+from koyomi.cycles.business_calendar import BusinessCalendar
+from datetime import date
+import numpy as np
+import pytest
+import time
+
+def test_business_calendar():
+    """営業日の計算がnumpyの営業日関数（祝日を指定）と一致することを確認"""
+    start = time.perf_counter()
+    calendar = BusinessCalendar(2000, 2040)
+    print(f"2000-2040年の営業日カレンダー: {time.perf_counter() - start:.3f}秒")
+    
+    holidays = np.array(
+        [h['日付'] for year in range(2000, 2041) for h in calendar.holiday.calculate(year)],
+        dtype='datetime64[D]'
+    )
+    rng = np.random.default_rng(0)
+    first, last = np.datetime64('2001-01-01'), np.datetime64('2039-01-01')
+    dates = first + rng.integers(0, (last - first).astype(int), 1_000_000)
+    ends = dates + rng.integers(-30, 30, len(dates))
+    offsets = rng.integers(-20, 20, len(dates))
+    
+    start = time.perf_counter()
+    counts = calendar.business_days_between(dates, ends)
+    settled = calendar.add_business_days(dates, offsets)
+    print(f"100万件の営業日計算: {time.perf_counter() - start:.3f}秒")
+    
+    assert np.array_equal(counts, np.busday_count(dates, ends, holidays=holidays))
+    assert np.array_equal(settled, np.busday_offset(dates, offsets, roll='forward', holidays=holidays))
+    assert np.array_equal(calendar.is_business_day(dates), np.is_busday(dates, holidays=holidays))
+    assert np.array_equal(
+        calendar.next_business_day(dates),
+        np.busday_offset(dates + 1, 0, roll='forward', holidays=holidays)
+    )
+    assert np.array_equal(
+        calendar.previous_business_day(dates),
+        np.busday_offset(dates - 1, 0, roll='backward', holidays=holidays)
+    )
+    
+    # dateを渡すとdateで返す（2024年の年末年始・成人の日）
+    assert calendar.next_business_day(date(2024, 1, 5)) == date(2024, 1, 9)
+    assert calendar.previous_business_day(date(2024, 1, 9)) == date(2024, 1, 5)
+    assert calendar.add_business_days(date(2024, 5, 2), 1) == date(2024, 5, 7)
+    assert calendar.business_days_between(date(2024, 1, 1), date(2025, 1, 1)) == 248
+    assert calendar.is_business_day(date(2024, 2, 12)) is False
+    
+    with pytest.raises(ValueError):
+        calendar.next_business_day(date(1999, 12, 31))
+    with pytest.raises(ValueError):
+        calendar.add_business_days(date(2040, 12, 28), 10)
+
+if __name__ == "__main__":
+    test_business_calendar()
@@ -0,0 +1,63 @@
+from koyomi.core import daynumber
+from koyomi.cycles.eto_daily import DailyEto
+from datetime import date
+import numpy as np
+import time
+
+def test_daynumber():
+    """通日とdate・datetime64・ユリウス通日・年月日の相互変換を確認"""
+    ordinals = np.random.default_rng(0).integers(1, date(9999, 12, 31).toordinal(), 100_000)
+    dates = daynumber.to_dates(ordinals)
+    assert [d.toordinal() for d in dates] == ordinals.tolist()
+    assert np.array_equal(daynumber.to_ordinals(daynumber.to_datetime64(ordinals)), ordinals)
+    assert np.array_equal(daynumber.weekdays(ordinals), [d.weekday() for d in dates])
+    
+    year, month, day = daynumber.ordinals_to_gregorian(ordinals)
+    assert [(int(y), int(m), int(d)) for y, m, d in zip(year, month, day)] == \
+        [(d.year, d.month, d.day) for d in dates]
+    
+    # 紀元前・ユリウス暦を含めた往復変換
+    ordinals = np.arange(-3_000_000, 3_000_000, 7)
+    assert np.array_equal(daynumber.gregorian_to_ordinals(*daynumber.ordinals_to_gregorian(ordinals)), ordinals)
+    assert np.array_equal(daynumber.julian_to_ordinals(*daynumber.ordinals_to_julian(ordinals)), ordinals)
+    
+    assert daynumber.to_jdn(date(2000, 1, 1).toordinal()) == 2451545
+    assert daynumber.from_jdn(0) == daynumber.julian_to_ordinals(-4712, 1, 1)
+    # グレゴリオ暦への改暦（ユリウス暦1582年10月4日の翌日が10月15日）
+    assert daynumber.julian_to_ordinals(1582, 10, 5) == date(1582, 10, 15).toordinal()
+    # 紀元前1年（0年）は閏年
+    assert daynumber.gregorian_to_ordinals(1, 1, 1) - daynumber.gregorian_to_ordinals(0, 1, 1) == 366
+    assert len(daynumber.year_ordinals(2024)) == 366
+    assert len(daynumber.month_ordinals(2023, 2)) == 28
+    
+    # 干支は通日の配列のまま計算できる
+    eto = DailyEto()
+    assert eto.kanshi_indices(date(2024, 1, 1).toordinal()) == 0
+    assert eto.calculate_single_day(date(2024, 1, 1))['干支'] == '甲子'
+
+def test_weekdays():
+    """曜日の生成・第n曜日・ISO週番号がdateの計算と一致することを確認"""
+    start = time.perf_counter()
+    sundays, months, nths, weeks = daynumber.weekdays_in_years(6, 1900, 2099)
+    print(f"200年分の日曜日: {time.perf_counter() - start:.4f}秒")
+    
+    dates = daynumber.to_dates(sundays)
+    assert dates[0] == date(1900, 1, 7) and dates[-1] == date(2099, 12, 27)
+    assert np.all(np.diff(sundays) == 7)
+    assert months.tolist() == [d.month for d in dates]
+    assert nths.tolist() == [(d.day - 1) // 7 + 1 for d in dates]
+    assert weeks.tolist() == [d.isocalendar()[1] for d in dates]
+    
+    ordinals = np.arange(date(1999, 12, 1).toordinal(), date(2031, 1, 31).toordinal())
+    iso_years, iso_weeks = daynumber.iso_weeks(ordinals)
+    assert list(zip(iso_years.tolist(), iso_weeks.tolist())) == \
+        [tuple(d.isocalendar())[:2] for d in daynumber.to_dates(ordinals)]
+    
+    # 第2月曜日・最終月曜日・はみ出し
+    results = daynumber.nth_weekday_ordinals(2024, [1, 5, 12, 2], [2, -1, -1, 5], [0, 0, 1, 0])
+    assert daynumber.to_dates(results) == [
+        date(2024, 1, 8), date(2024, 5, 27), date(2024, 12, 31), date(2024, 3, 4)
+    ]
+
+if __name__ == "__main__":
+    test_daynumber()
@@ -0,0 +1,38 @@
+from koyomi.core.delta_t import (
+    ConstantDeltaT, EspenakMeeusDeltaT, SeriesDeltaT, SkyfieldDeltaT, J2000, JULIAN_YEAR
+)
+from koyomi.core.ephemeris import EphemerisRegistry
+from koyomi.facade import KoyomiFacade
+import numpy as np
+
+def test_delta_t_models():
+    """ΔTモデルを時刻の配列で一括評価し、同じモデルはタイムスケールを共有することを確認"""
+    years = np.linspace(1900, 2020, 121)
+    tt = J2000 + (years - 2000) * JULIAN_YEAR
+    
+    polynomial = EspenakMeeusDeltaT()(tt)
+    table = SkyfieldDeltaT()(tt)
+    print(f"1900-2020年の多項式と表の最大差: {np.max(np.abs(polynomial - table)):.2f}秒")
+    assert polynomial.shape == tt.shape
+    assert np.max(np.abs(polynomial - table)) < 5.0
+    
+    assert np.array_equal(ConstantDeltaT(69.0)(tt), np.full(tt.shape, 69.0))
+    series = SeriesDeltaT([1900, 2000], [0.0, 64.0])
+    assert np.isclose(series(J2000 - 50 * JULIAN_YEAR), 32.0)
+    
+    # タイムスケールはモデルの key ごとに一度だけ作られる
+    EphemerisRegistry.clear()
+    ts = EphemerisRegistry.get_timescale('espenak-meeus')
+    assert EphemerisRegistry.get_timescale(EspenakMeeusDeltaT()) is ts
+    assert np.isclose(ts.utc(2000, 1, 1).delta_t, EspenakMeeusDeltaT()(ts.utc(2000, 1, 1).tt), atol=1e-6)
+    assert EphemerisRegistry.get_timescale(69) is EphemerisRegistry.get_timescale(69.0)
+    
+    # ファサードは全ての計算クラスに同じΔTを渡す
+    koyomi = KoyomiFacade(delta_t='espenak-meeus')
+    assert koyomi.holiday.sekki_calculator.astronomical.ts is ts
+    assert koyomi.tanabata.kyureki.astronomical.ts is ts
+    assert koyomi.doyo_calculator.astronomical.ts is ts
+    assert EphemerisRegistry.load_counts()['timescale'] == 2
+
+if __name__ == "__main__":
+    test_delta_t_models()
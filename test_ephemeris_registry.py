@@ -0,0 +1,94 @@
+from koyomi.core.ephemeris import EphemerisRegistry, extract_ephemeris_subset
+from koyomi.core.astronomical import AstronomicalCalculator
+from koyomi.facade import KoyomiFacade
+from koyomi.seasonal.sekki import SolarTerms
+from koyomi.seasonal.kyureki import Kyureki
+import numpy as np
+import os
+import tempfile
+import time
+
+def test_facade_shares_ephemeris():
+    """ファサードの初期化でエフェメリスが一度しか読み込まれないことを確認"""
+    EphemerisRegistry.clear()
+    
+    start = time.perf_counter()
+    koyomi = KoyomiFacade()
+    elapsed = time.perf_counter() - start
+    
+    print(f"ファサード初期化: {elapsed * 1000:.1f}ms")
+    
+    # 天文計算は初めて使うときまで読み込まれない
+    assert EphemerisRegistry.load_counts() == {'ephemeris': 0, 'timescale': 0}
+    
+    # 同じΔTの計算クラスは同じオブジェクトを共有する
+    assert koyomi.sekki.astronomical.eph is koyomi.holiday.astronomical.eph
+    assert koyomi.sekki.astronomical.ts is koyomi.doyo_calculator.astronomical.ts
+    counts = EphemerisRegistry.load_counts()
+    print(f"読み込み回数: {counts}")
+    # 全ての計算クラスが同じΔTを使うため、タイムスケールは1つだけ
+    assert counts == {'ephemeris': 1, 'timescale': 1}
+    
+    # 2回目以降は読み込みが発生しない
+    KoyomiFacade().tanabata.astronomical
+    assert EphemerisRegistry.load_counts() == counts
+
+def test_ephemeris_subset():
+    """抜粋したエフェメリスで元のファイルと同じ太陽黄経が得られることを確認"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'subset.bsp')
+        extract_ephemeris_subset('de421.bsp', path, 2000, 2030)
+        print(f"抜粋ファイル: {os.path.getsize(path) / 1024:.0f}KB "
+              f"(元: {os.path.getsize('de421.bsp') / 1024:.0f}KB)")
+        assert os.path.getsize(path) < os.path.getsize('de421.bsp') / 3
+        
+        full = AstronomicalCalculator(69.0)
+        subset = AstronomicalCalculator(69.0, ephemeris_file=path)
+        assert {segment.target for segment in subset.eph.segments} == {3, 5, 6, 10, 399, 301}
+        
+        times = full.ts.utc(2024, 1, np.arange(1, 366))
+        assert np.allclose(full.get_solar_longitude(times), subset.get_solar_longitude(times), atol=1e-9)
+        
+        subset.eph.close()
+        EphemerisRegistry.clear()
+
+def test_ephemeris_range():
+    """対応期間外の年は計算を始める前に拒否し、必要なセグメントだけを読み込むことを確認"""
+    EphemerisRegistry.clear()
+    
+    for calculate in (lambda: SolarTerms().calculate(1850), lambda: Kyureki().calculate(2053)):
+        try:
+            calculate()
+        except ValueError as e:
+            print(e)
+        else:
+            raise AssertionError("対応期間外の年でValueErrorが送出されていません")
+    assert EphemerisRegistry.load_counts()['ephemeris'] == 0
+    # de421のカタログの期間はファイルのセグメント情報と一致する
+    assert EphemerisRegistry.resolve('de421', 1900, 2052) == 'de421.bsp'
+    
+    # DE441は対象期間に応じて片方のファイルだけを使う
+    assert EphemerisRegistry.resolve('de441', 1600, 1700) == 'de441_part-1.bsp'
+    assert EphemerisRegistry.resolve('de441', 2100, 2300) == 'de441_part-2.bsp'
+    assert EphemerisRegistry.resolve('de440s', 1850, 2149) == 'de440s.bsp'
+    try:
+        EphemerisRegistry.resolve('de441', 1960, 1980)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("ファイルの境界をまたぐ期間でValueErrorが送出されていません")
+    
+    # 太陽・地球の計算に使うセグメントだけがメモリマップされる
+    sekki = SolarTerms()
+    sekki.calculate(2024)
+    mapped = {
+        segment.spk_segment.target for segment in sekki.astronomical.eph.segments
+        if '_data' in segment.spk_segment.__dict__
+    }
+    print(f"読み込まれたセグメント: {sorted(mapped)}")
+    assert mapped <= {3, 5, 6, 10, 399}
+
+if __name__ == "__main__":
+    test_facade_shares_ephemeris()
+    test_ephemeris_subset()
+    test_ephemeris_range()
@@ -1,5 +1,9 @@
 from koyomi.cycles.eto_daily import DailyEto
 from datetime import date
+import numpy as np
+import subprocess
+import sys
+import time
 
 def test_monthly_first_days_eto():
     """各月1日の干支を確認するテスト"""
@@ -18,6 +22,40 @@ def test_monthly_first_days_eto():
             date_str = result['日付'].strftime('%Y/%m/%d')
             print(f"{date_str}  {result['干支']}    {result['読み']}    {result['通日']:2d}/60")
 
+def test_calculate_range():
+    """期間の干支を番号の列で一括計算し、辞書形式にも変換できることを確認"""
+    calculator = DailyEto()
+    
+    start = time.perf_counter()
+    table = calculator.calculate_range(date(1950, 1, 1), date(2049, 12, 31))
+    elapsed = time.perf_counter() - start
+    nbytes = sum(a.nbytes for a in (table.ordinals, table.kanshi, table.jikkan, table.junishi))
+    print(f"100年分の日干支: {elapsed * 1000:.2f}ミリ秒, {nbytes / 1024:.0f}KB")
+    assert len(table) == 36525
+    assert nbytes < 512 * 1024
+    
+    index = date(2024, 1, 1).toordinal() - date(1950, 1, 1).toordinal()
+    assert table.names[index] == '甲子'
+    assert table.dates[index] == np.datetime64('2024-01-01')
+    assert np.array_equal(table.jikkan, table.kanshi % 10)
+    assert np.array_equal(table.junishi, table.kanshi % 12)
+    assert table[index] == calculator.calculate_single_day(date(2024, 1, 1))
+    
+    # 辞書形式は calculate_year と同じ
+    year = calculator.calculate_range(date(2024, 1, 1), date(2024, 12, 31))
+    assert year.to_dicts() == calculator.calculate_year(2024)
+
+def test_import_without_astronomy():
+    """日干支の計算がskyfield・pandasやエフェメリスを読み込まないことを確認"""
+    code = (
+        "import sys\n"
+        "from koyomi.cycles.eto_daily import DailyEto\n"
+        "DailyEto().calculate_year(2024)\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'skyfield', 'pandas', 'jplephem'}))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
 if __name__ == "__main__":
     # test_monthly_first_days_eto()
     eto_data = DailyEto().calculate_year(2024)
@@ -1,4 +1,8 @@
 from koyomi.cycles.eto_month import MonthEto
+from koyomi.cycles.kanshi import KANSHI_BY_NAME
+from datetime import date, timedelta
+import numpy as np
+import time
 
 def test_month_eto():
     calculator = MonthEto()
@@ -14,5 +18,42 @@ def test_month_eto():
     print(f"年干支: {result['年干支']}")
     print(f"月干支: {result['月干支']}")
 
+def test_setsu_month():
+    """節月の月干支が節入りの瞬間・日で切り替わり、一括判定と一致することを確認"""
+    calculator = MonthEto('節月')
+    
+    # 2024年（甲辰）の正月は丙寅、2023年（癸卯）の十二月（2024年1月）は乙丑
+    assert calculator.calculate_datetime(date(2024, 2, 3))['月干支'] == '乙丑'
+    assert calculator.calculate_datetime(date(2024, 2, 4))['月干支'] == '丙寅'
+    assert calculator.calculate_datetime(date(2024, 1, 1))['月干支'] == '甲子'
+    
+    starts, expected = [], []
+    for year in range(2020, 2026):
+        for month in range(1, 13):
+            result = calculator.calculate(year, month)
+            assert result['月干支'] == calculator._get_month_zodiac(month, result['年干支'][0])
+            starts.append(result['節入り'].replace(tzinfo=None))
+            expected.append(KANSHI_BY_NAME[result['月干支']].index)
+    starts = np.array(starts, dtype='datetime64[us]')
+    expected = np.array(expected)
+    assert np.array_equal(calculator.kanshi_indices(starts), expected)
+    assert np.array_equal(calculator.kanshi_indices(starts - np.timedelta64(1, 's')), (expected - 1) % 60)
+    assert np.array_equal(calculator.kanshi_indices(starts.astype('datetime64[D]')), expected)
+    
+    # 100万件の日時の一括判定
+    times = np.datetime64('2020-02-05') + np.random.default_rng(0).integers(
+        0, 5 * 365 * 86400, 1_000_000
+    ).astype('timedelta64[s]')
+    start = time.perf_counter()
+    indices = calculator.kanshi_indices(times)
+    print(f"100万件の節月の月干支: {time.perf_counter() - start:.3f}秒")
+    assert np.array_equal(indices, expected[np.searchsorted(starts, times, side='right') - 1])
+    
+    # 暦月は暦の月ごと
+    months = MonthEto()
+    days = np.array([date(2024, month, 1) + timedelta(days=20) for month in range(1, 13)])
+    assert [KANSHI_BY_NAME[r['月干支']].index for r in months.calculate_year(2024)] == \
+        months.kanshi_indices(days).tolist()
+
 if __name__ == "__main__":
     test_month_eto()
\ No newline at end of file
@@ -0,0 +1,85 @@
+from koyomi.core.event_cache import EventCache
+from koyomi.seasonal.sekki import SolarTerms
+from koyomi.seasonal.doyo import Doyo
+from koyomi.seasonal.tsuyu import Tsuyuiri
+from koyomi.seasonal.hange import Hangesho
+from koyomi.seasonal.tanabata import Tanabata
+from jplephem.spk import Segment
+from datetime import timedelta
+import os
+import sqlite3
+import tempfile
+
+def calculate_all(year):
+    return (
+        SolarTerms().calculate(year)
+        + Doyo().calculate(year)
+        + [Tsuyuiri().calculate(year)]
+        + Tanabata().calculate(year)
+    )
+
+def test_event_cache():
+    """キャッシュから読み出した結果が計算結果と一致し、エフェメリスを評価しないことを確認"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.sqlite3')
+        
+        expected = calculate_all(2024)
+        EventCache.enable(path)
+        try:
+            assert calculate_all(2024) == expected
+            
+            # 保存済みの年はエフェメリスを一度も評価しない
+            calls = []
+            original = Segment.compute_and_differentiate
+            def counting(self, *args, **kwargs):
+                calls.append(self.target)
+                return original(self, *args, **kwargs)
+            Segment.compute_and_differentiate = counting
+            try:
+                assert calculate_all(2024) == expected
+            finally:
+                Segment.compute_and_differentiate = original
+            print(f"キャッシュからの計算でのエフェメリス評価: {len(calls)}回")
+            assert calls == []
+            
+            # ΔTが異なる場合は別のエントリになる
+            cache = EventCache.active()
+            assert cache.get_years('二十四節気', [2024], 70.0, 'de421.bsp') == {}
+            assert len(cache.get_years('二十四節気', [2024], 69.0, 'de421.bsp')[2024]) == 24
+        finally:
+            EventCache.disable()
+        
+        # 古い版のエントリは読み出さない
+        connection = sqlite3.connect(path)
+        with connection:
+            connection.execute("UPDATE events SET version = version + 1")
+        connection.close()
+        cache = EventCache(path)
+        assert cache.get_years('二十四節気', [2024], 69.0, 'de421.bsp') == {}
+        cache.close()
+
+def test_longitude_entry_points():
+    """単年と複数年の探索が同じ種類名に同じ日時を保存し、呼び出し順によらないことを確認"""
+    expected = Tsuyuiri()._find_longitude_dates([2025, 2026])
+    with tempfile.TemporaryDirectory() as directory:
+        EventCache.enable(os.path.join(directory, 'events.sqlite3'))
+        try:
+            single = Tsuyuiri().calculate(2025)['datetime_jst']
+            assert Tsuyuiri()._find_longitude_dates([2025, 2026]) == expected
+            assert single == expected[0]
+        finally:
+            EventCache.disable()
+
+def test_fixed_jst_offset():
+    """1948〜1951年の夏（サマータイム期間）の日時も、計算・キャッシュとも+09:00になることを確認"""
+    with tempfile.TemporaryDirectory() as directory:
+        EventCache.enable(os.path.join(directory, 'events.sqlite3'))
+        try:
+            for _ in range(2):
+                for dt in [Tsuyuiri().calculate(1949)['datetime_jst'], Hangesho().calculate(1949)['datetime_jst']]:
+                    assert dt.utcoffset() == timedelta(hours=9)
+        finally:
+            EventCache.disable()
+
+if __name__ == "__main__":
+    test_event_cache()
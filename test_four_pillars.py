@@ -0,0 +1,60 @@
+from koyomi.cycles.four_pillars import FourPillars
+from koyomi.cycles.eto_daily import DailyEto
+from koyomi.cycles.eto_month import MonthEto
+from koyomi.cycles.kanshi import KANSHI_BY_NAME, JUNISHI, kanshi_of
+from datetime import datetime, timedelta
+import numpy as np
+import pytest
+import time
+
+def test_four_pillars():
+    """四柱の一括計算が立春・節入り・23時の子の刻で切り替わり、個別の計算と一致することを確認"""
+    calculator = FourPillars()
+    
+    # 立春（2024年2月4日17時27分）の前後
+    assert calculator.calculate(datetime(2024, 2, 4, 17, 27)) == {
+        '日時': datetime(2024, 2, 4, 17, 27),
+        '年柱': '癸卯', '月柱': '乙丑', '日柱': '戊戌', '時柱': '辛酉'
+    }
+    after = calculator.calculate(datetime(2024, 2, 4, 17, 28))
+    assert (after['年柱'], after['月柱']) == ('甲辰', '丙寅')
+    # 23時からは翌日の子の刻
+    assert calculator.calculate(datetime(2024, 1, 1, 23, 30))['日柱'] == '乙丑'
+    assert calculator.calculate(datetime(2024, 1, 1, 23, 30))['時柱'] == '丙子'
+    assert FourPillars(late_rat_next_day=False).calculate(datetime(2024, 1, 1, 23, 30))['日柱'] == '甲子'
+    
+    # エフェメリスの最初の年（1月の小寒より前でなければ前年の節は使わない）
+    assert FourPillars().calculate(datetime(1900, 6, 1, 12)) == {
+        '日時': datetime(1900, 6, 1, 12),
+        '年柱': '庚子', '月柱': '辛巳', '日柱': '乙巳', '時柱': '壬午'
+    }
+    with pytest.raises(ValueError):
+        FourPillars().calculate(datetime(1900, 1, 2, 12))
+    
+    # 個別の計算との比較
+    rng = np.random.default_rng(0)
+    times = np.datetime64('1990-01-01') + rng.integers(0, 40 * 365 * 86400, 2000).astype('timedelta64[s]')
+    pillars = calculator.calculate_arrays(times)
+    months = MonthEto('節月')
+    days = DailyEto()
+    for i, value in enumerate(times.tolist()):
+        setsu_year, _ = months.setsu_months(value)
+        assert kanshi_of(int(setsu_year) - 4).index == pillars['年柱'][i]
+        assert KANSHI_BY_NAME[months.calculate_datetime(value)['月干支']].index == pillars['月柱'][i]
+        day = (value + timedelta(hours=1)).date()
+        assert KANSHI_BY_NAME[days.calculate_single_day(day)['干支']].index == pillars['日柱'][i]
+        assert JUNISHI[pillars['時柱'][i] % 12] == JUNISHI[(value.hour + 1) % 24 // 2]
+    
+    # 100万件の一括計算
+    times = np.datetime64('1950-01-01') + rng.integers(0, 100 * 365 * 86400, 1_000_000).astype('timedelta64[s]')
+    calculator.calculate_arrays(times)  # 節の計算を済ませておく
+    start = time.perf_counter()
+    calculator.calculate_arrays(times)
+    print(f"100万件の四柱: {time.perf_counter() - start:.3f}秒")
+
+def main():
+    calculator = FourPillars()
+    print(calculator.format_pillars(datetime(2024, 2, 4, 17, 28)))
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 from koyomi.cycles.hassen import Hassen
+from koyomi.cycles.eto_daily import DailyEto
 from datetime import date
+import numpy as np
+import time
 
 def test_hassen():
     calculator = Hassen()
@@ -23,5 +26,29 @@ def test_hassen():
     else:
         print("八専期間ではありません")
 
+def test_calculate_periods():
+    """八専の期間を60日周期から直接求め、日ごとの干支と一致することを確認"""
+    calculator = Hassen()
+    
+    start = time.perf_counter()
+    periods = calculator.calculate_periods(date(1700, 1, 1), date(2299, 12, 31))
+    print(f"600年分の八専の期間: {len(periods)}期間 ({(time.perf_counter() - start) * 1e6:.0f}マイクロ秒)")
+    
+    eto = DailyEto()
+    assert np.all(eto.kanshi_indices(periods.start) == 48)
+    assert np.all(eto.kanshi_indices(periods.end) == 59)
+    assert np.all(eto.kanshi_indices(periods.mabi) == [49, 52, 54, 58])
+    # 範囲の前後にはみ出す期間も含む
+    assert periods.start[0] <= date(1700, 1, 1).toordinal() + 11
+    assert periods.end[-1] >= date(2299, 12, 31).toordinal() - 11
+    assert np.all(np.diff(periods.start) == 60)
+    
+    # 年の八専の日は、範囲内に切り詰めた期間の日と一致する
+    periods = calculator.calculate_periods(date(2024, 1, 1), date(2024, 12, 31))
+    days = calculator.calculate_year(2024)
+    assert [d['日付'] for d in days if d['種類'] == '間日'] == \
+        [d for p in periods.to_dicts() for d in p['間日'] if d.year == 2024]
+    assert len(days) == int(np.sum(periods.clipped_end - periods.clipped_start + 1))
+
 if __name__ == "__main__":
     test_hassen()
\ No newline at end of file
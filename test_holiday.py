@@ -1,5 +1,135 @@
 from koyomi.cycles.holiday import Holiday
+from koyomi.cycles.holiday_overlay import HolidayOverlay
+from koyomi.cycles.business_calendar import BusinessCalendar
 from datetime import date
+import json
+import numpy as np
+import pytest
+import time
+
+def test_law_versions():
+    """祝日法の改正ごとの規則がその年だけに適用されることを確認"""
+    calculator = Holiday()
+    
+    def holidays(year):
+        return {h['日付']: h['名称'] if h['名称'] != '休日' else h['種類'] for h in calculator.calculate(year)}
+    
+    # 施行前の祝日はない
+    assert list(holidays(1948)) == [date(1948, 9, 23), date(1948, 11, 3), date(1948, 11, 23)]
+    assert holidays(1998)[date(1998, 1, 15)] == '成人の日'
+    assert holidays(1988)[date(1988, 4, 29)] == '天皇誕生日'
+    assert holidays(1988)[date(1988, 5, 4)] == '国民の休日'
+    assert holidays(1989)[date(1989, 12, 23)] == '天皇誕生日'
+    assert holidays(1989)[date(1989, 2, 24)] == '昭和天皇の大喪の礼'
+    # 振替休日は1973年4月12日から
+    assert holidays(1973)[date(1973, 4, 30)] == '天皇誕生日の振替休日'
+    assert date(1972, 1, 3) not in holidays(1972)
+    
+    # 2019年は天皇誕生日がなく、即位の日の前後が国民の休日
+    year_2019 = holidays(2019)
+    assert '天皇誕生日' not in year_2019.values()
+    assert year_2019[date(2019, 4, 30)] == year_2019[date(2019, 5, 2)] == '国民の休日'
+    assert year_2019[date(2019, 10, 22)] == '即位礼正殿の儀'
+    
+    # 東京オリンピック・パラリンピックによる移動
+    year_2020 = holidays(2020)
+    assert year_2020[date(2020, 7, 23)] == '海の日'
+    assert year_2020[date(2020, 7, 24)] == 'スポーツの日'
+    assert year_2020[date(2020, 8, 10)] == '山の日'
+    assert date(2020, 10, 12) not in year_2020
+    year_2021 = holidays(2021)
+    assert year_2021[date(2021, 8, 9)] == '山の日の振替休日'
+    assert holidays(2024)[date(2024, 10, 14)] == 'スポーツの日'
+    assert holidays(2019)[date(2019, 10, 14)] == '体育の日'
+
+def test_is_holiday():
+    """ビット列による一括判定が年ごとの表と一致することを確認"""
+    calculator = Holiday()
+    ordinals = np.random.default_rng(0).integers(
+        date(1950, 1, 1).toordinal(), date(2049, 12, 31).toordinal(), 1_000_000
+    )
+    start = time.perf_counter()
+    result = calculator.is_holiday(ordinals)
+    print(f"100万日の祝日判定: {time.perf_counter() - start:.3f}秒")
+    
+    holidays = [h['日付'].toordinal() for year in range(1950, 2050) for h in calculator.calculate(year)]
+    assert np.array_equal(result, np.isin(ordinals, holidays))
+    assert np.array_equal(calculator.is_holiday((ordinals - 719163).astype('datetime64[D]')), result)
+    assert calculator.is_holiday(date(2024, 2, 12)) is True
+    assert calculator.is_holiday(date(2024, 2, 13)) is False
+    assert calculator.is_holiday(date(1900, 1, 1)) is False
+
+def test_overlays(tmp_path):
+    """独自の休日の定義がファイルから読み込まれ、祝日と同じ表・ビット列に反映されることを確認"""
+    path = tmp_path / 'company.json'
+    path.write_text(json.dumps({
+        '名称': '会社休日',
+        '休業日': [
+            {'名称': '年末年始', '開始': '12-29', '終了': '01-03'},
+            {'名称': 'お盆休み', '開始': '08-13', '終了': '08-16'},
+            {'名称': '創立記念日', '月': 6, '日': 1, '開始年': 2024},
+            {'名称': '秋の休業日', '月': 11, '週': 3, '曜日': 4},
+            {'名称': '臨時休業', '日付': '2024-05-02'}
+        ],
+        '出勤日': [
+            {'名称': '決算業務', '月': 3, '日': 20}
+        ]
+    }, ensure_ascii=False), encoding='utf-8')
+    overlay = HolidayOverlay.from_file(str(path))
+    national = Holiday()
+    company = Holiday(overlays=[overlay])
+    
+    holidays = {h['日付']: (h['名称'], h['種類']) for h in company.calculate(2024)}
+    assert holidays[date(2024, 1, 2)] == ('年末年始', '会社休日')
+    assert holidays[date(2024, 1, 1)] == ('元日', '祝日')
+    assert holidays[date(2024, 12, 31)] == ('年末年始', '会社休日')
+    assert holidays[date(2024, 6, 1)] == ('創立記念日', '会社休日')
+    assert holidays[date(2024, 11, 15)] == ('秋の休業日', '会社休日')
+    assert date(2024, 3, 20) not in holidays
+    assert date(2023, 6, 1) not in {h['日付'] for h in company.calculate(2023)}
+    
+    # ビット列の和・差
+    ordinals = np.arange(date(2000, 1, 1).toordinal(), date(2040, 12, 31).toordinal() + 1)
+    national_bits = national.bitset(2000, 2040)
+    company_bits = company.bitset(2000, 2040)
+    extra = company_bits - national_bits
+    assert np.array_equal(company.is_holiday(ordinals), company_bits.is_holiday(ordinals))
+    assert np.array_equal((company_bits & national_bits).is_holiday(ordinals),
+                          national.is_holiday(ordinals) & company.is_holiday(ordinals))
+    assert np.array_equal((national_bits | extra).is_holiday(ordinals),
+                          national.is_holiday(ordinals) | extra.is_holiday(ordinals))
+    assert extra.is_holiday(date(2024, 8, 14)) is True
+    assert extra.is_holiday(date(2024, 8, 12)) is False  # 振替休日（国民の休日側）
+    
+    # 一括判定の時間は定義の有無で変わらない
+    dates = np.random.default_rng(0).choice(ordinals, 1_000_000)
+    timings = []
+    for calculator in (national, company):
+        start = time.perf_counter()
+        calculator.is_holiday(dates)
+        timings.append(time.perf_counter() - start)
+    print(f"100万日の判定: 祝日のみ {timings[0]:.3f}秒, 独自の休日あり {timings[1]:.3f}秒")
+    
+    business = BusinessCalendar(2024, 2025, holiday=company)
+    assert business.next_business_day(date(2024, 12, 27)) == date(2025, 1, 6)
+    
+    with pytest.raises(ValueError):
+        HolidayOverlay('不正', [{'名称': '日付なし'}])
+    
+    # 閏日で終わる期間と、終了年に始まって翌年に続く期間
+    bounded = HolidayOverlay('期間', [
+        {'名称': '月末', '開始': '02-28', '終了': '02-29'},
+        {'名称': '年末年始', '開始': '12-29', '終了': '01-03', '終了年': 2029}
+    ])
+    month_end = {
+        year: [date.fromordinal(o) for o, name in sorted(bounded.closure_dates(year).items()) if name == '月末']
+        for year in (2023, 2024)
+    }
+    assert month_end == {2023: [date(2023, 2, 28)], 2024: [date(2024, 2, 28), date(2024, 2, 29)]}
+    assert [date.fromordinal(o) for o in sorted(bounded.closure_dates(2030))] == [
+        date(2030, 1, 1), date(2030, 1, 2), date(2030, 1, 3), date(2030, 2, 28)
+    ]
+    assert date(2030, 12, 31).toordinal() not in bounded.closure_dates(2030)
 
 def main():
     calculator = Holiday()
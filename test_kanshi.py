@@ -0,0 +1,53 @@
+from koyomi.cycles.kanshi import KANSHI_TABLE, KANSHI_BY_NAME, Kanshi, kanshi_index
+from koyomi.cycles.eto_daily import DailyEto
+from koyomi.cycles.eto_year import YearEto
+from koyomi.cycles.nattoin import Nattoin
+from koyomi.utils.export import CalendarExporter
+from datetime import date
+import pickle
+import pytest
+
+def test_kanshi_table():
+    """六十干支の表の内容と、日・年の干支が表の要素を参照することを確認"""
+    assert len(KANSHI_TABLE) == 60
+    assert [k.kanji for k in KANSHI_TABLE[:3]] == ['甲子', '乙丑', '丙寅']
+    assert KANSHI_TABLE[-1].kanji == '癸亥'
+    for k in KANSHI_TABLE:
+        assert kanshi_index(k.jikkan['番号'], k.junishi['番号']) == k.index
+        assert KANSHI_BY_NAME[k.kanji] is k
+    assert KANSHI_BY_NAME['甲辰']['納音']['漢字'] == '覆燈火'
+    assert KANSHI_BY_NAME['甲辰']['納音']['対応干支'] == ('甲辰', '乙巳')
+    assert KANSHI_BY_NAME['癸丑'].gogyo == '水土'
+    assert [k.kanji for k in KANSHI_TABLE if k.hassen == '間日'] == ['癸丑', '丙辰', '戊午', '壬戌']
+    assert sum(k.hassen is not None for k in KANSHI_TABLE) == 12
+    with pytest.raises(AttributeError):
+        KANSHI_TABLE[0].kanji = '乙丑'
+    with pytest.raises(AttributeError):
+        KANSHI_TABLE[0].nattoin['対応干支'].append('丙寅')
+    assert pickle.loads(pickle.dumps(KANSHI_TABLE[5])) is KANSHI_TABLE[5]
+    
+    # 日の干支は従来の辞書と同じキーを持つ
+    day = DailyEto().calculate_single_day(date(2024, 1, 1))
+    assert day.kanshi is KANSHI_TABLE[0]
+    assert dict(day) == {
+        '日付': date(2024, 1, 1),
+        '干支': '甲子',
+        '読み': 'きのえね',
+        '十干': {'漢字': '甲', '読み': 'きのえ', '番号': 0},
+        '十二支': {'漢字': '子', '読み': 'ね', '番号': 0},
+        '通日': 1
+    }
+    
+    # 年の干支の十干・十二支の番号は1始まり
+    year = YearEto().calculate(2024)
+    assert year.kanshi is KANSHI_BY_NAME['甲辰']
+    assert year['十干']['番号'] == 1 and year['十二支']['番号'] == 5
+    assert year['六十干支番号'] == 41
+    assert Nattoin().calculate(2024)['納音'] is year.kanshi.nattoin
+    
+    flattened = CalendarExporter._flatten_date({'干支': year})
+    assert flattened['干支_干支'] == '甲辰'
+    assert flattened['干支_十二支_漢字'] == '辰'
+
+if __name__ == "__main__":
+    test_kanshi_table()
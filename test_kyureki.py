@@ -0,0 +1,75 @@
+from koyomi.seasonal.kyureki import Kyureki
+from koyomi.seasonal.tanabata import Tanabata
+from datetime import date, timedelta
+import numpy as np
+import pytest
+import time
+
+def test_kyureki_conversion():
+    """旧暦の月・閏月が暦と一致し、新暦と旧暦の一括変換が往復することを確認"""
+    kyureki = Kyureki()
+    
+    start = time.perf_counter()
+    table = kyureki.calculate_table(2000, 2035)
+    print(f"2000-2035年の旧暦の表: {len(table)}か月 ({time.perf_counter() - start:.2f}秒)")
+    
+    # 旧正月・閏月
+    assert kyureki.convert(date(2024, 2, 10))['表記'] == '1月1日'
+    assert kyureki.convert(date(2023, 3, 22))['表記'] == '閏2月1日'
+    assert kyureki.convert(date(2025, 7, 25))['表記'] == '閏6月1日'
+    assert kyureki.convert(date(2033, 12, 22))['表記'] == '閏11月1日'
+    assert kyureki.to_date(2025, 6, 1, leap=True) == date(2025, 7, 25)
+    assert kyureki.to_date(2024, 7, 7) == date(2024, 8, 10)
+    
+    assert set(np.unique(table.month_length)) == {29, 30}
+    leap_months = [(int(y), int(m)) for y, m in zip(table.year[table.leap], table.month[table.leap])]
+    assert leap_months[:13] == [
+        (2001, 4), (2004, 2), (2006, 7), (2009, 5), (2012, 3), (2014, 9), (2017, 5),
+        (2020, 4), (2023, 2), (2025, 6), (2028, 5), (2031, 3), (2033, 11)
+    ]
+    
+    ordinals = np.random.default_rng(0).integers(
+        date(2000, 1, 1).toordinal(), date(2035, 12, 31).toordinal(), 1_000_000
+    )
+    start = time.perf_counter()
+    result = kyureki.to_kyureki(ordinals)
+    back = kyureki.from_kyureki(result['年'], result['月'], result['日'], result['閏月'])
+    elapsed = time.perf_counter() - start
+    print(f"100万日の往復変換: {elapsed:.3f}秒")
+    assert elapsed < 1.0
+    assert np.array_equal(back.astype(np.int64), ordinals - date(1970, 1, 1).toordinal())
+    
+    # 伝統的七夕は旧暦の表の朔から求める
+    new_moon = kyureki.new_moon_on_or_before(date(2024, 8, 22))
+    assert new_moon.strftime('%Y/%m/%d %H:%M') == '2024/08/04 20:13'
+
+def test_table_growth():
+    """1年ずつ広げた表がまとめて作った表と一致し、エフェメリスの端の年も朔を求められることを確認"""
+    kyureki = Kyureki()
+    start = time.perf_counter()
+    for year in range(1990, 2010):
+        kyureki.calculate(year)
+    for year in range(1989, 1979, -1):
+        kyureki.calculate(year)
+    print(f"1年ずつ30年分: {time.perf_counter() - start:.2f}秒")
+    
+    whole = Kyureki().calculate_table(*kyureki._table_years)
+    assert np.array_equal(kyureki._table.month_start, whole.month_start)
+    assert np.array_equal(kyureki._table.month_key, whole.month_key)
+    
+    # de421の最初と最後の年（前年・翌年の冬至は対応期間外）
+    assert Kyureki().new_moon_on_or_before(date(1900, 8, 23)).strftime('%Y/%m/%d') == '1900/07/26'
+    assert Kyureki().new_moon_on_or_before(date(2052, 8, 22)).strftime('%Y/%m/%d') == '2052/07/26'
+    assert Kyureki().convert(date(2052, 11, 1))['表記'] == '9月10日'
+    with pytest.raises(ValueError):
+        Kyureki().calculate(2052)
+
+def test_fixed_jst_offset():
+    """サマータイムのあった1949年の朔・伝統的七夕も+09:00で返ることを確認"""
+    kyureki = Kyureki()
+    assert all(month['datetime_jst'].utcoffset() == timedelta(hours=9) for month in kyureki.calculate(1949))
+    assert kyureki.new_moon_on_or_before(date(1949, 8, 1)).utcoffset() == timedelta(hours=9)
+    assert Tanabata().calculate(1949)[1]['datetime_jst'].utcoffset() == timedelta(hours=9)
+
+if __name__ == "__main__":
+    test_kyureki_conversion()
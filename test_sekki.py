@@ -0,0 +1,101 @@
+from koyomi.seasonal.sekki import SolarTerms
+from koyomi.seasonal.hange import Hangesho
+from koyomi.cycles.holiday import Holiday
+from jplephem.spk import Segment
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+import time
+
+def test_solar_terms_range():
+    """複数年の節気を一度の探索で求め、年ごとの計算と一致することを確認"""
+    sekki = SolarTerms()
+    
+    start = time.perf_counter()
+    table = sekki.calculate_range(2000, 2029)
+    elapsed = time.perf_counter() - start
+    print(f"2000-2029年の節気: {len(table)}件 ({elapsed:.2f}秒)")
+    
+    assert len(table) == 30 * 24
+    assert np.all(np.diff(table.tt) > 0)
+    assert np.array_equal(np.bincount(table.years - 2000), np.full(30, 24))
+    
+    terms = sekki.calculate(2024)
+    assert [t['イベント名'] for t in terms] == table.for_year(2024).names
+    assert terms[5]['年月日時刻'] == '2024/03/20 12:06:24'
+    
+    # 計算済みの期間は再探索せず、隣接する年は不足分だけを探索する
+    sweeps = []
+    original = sekki._sweep
+    def recording_sweep(start_year, end_year):
+        sweeps.append((start_year, end_year))
+        return original(start_year, end_year)
+    sekki._sweep = recording_sweep
+    sekki.calculate(2015)
+    sekki.calculate_range(2028, 2031)
+    assert sweeps == [(2030, 2031)]
+    assert sekki._table_years == (2000, 2031)
+    
+    # 日時で指定した期間の切り出し
+    jst = timezone(timedelta(hours=9))
+    window = sekki.calculate_window(datetime(2024, 3, 1, tzinfo=jst), datetime(2024, 4, 1, tzinfo=jst))
+    assert window.names == ['啓蟄', '春分']
+
+def test_date_precision():
+    """日付精度の節気が精密な節気と同じ日付になり、多くの年でエフェメリスを使わないことを確認"""
+    exact = SolarTerms().calculate_range(2000, 2029)
+    
+    start = time.perf_counter()
+    dated = SolarTerms(precision='date').calculate_range(2000, 2029)
+    print(f"2000-2029年の節気（日付精度）: {len(dated)}件 ({time.perf_counter() - start:.3f}秒)")
+    
+    assert np.array_equal(dated.indices, exact.indices)
+    assert [dt.date() for dt in dated.datetimes] == [dt.date() for dt in exact.datetimes]
+    assert np.max(np.abs(dated.tt - exact.tt)) * 1440 < 4
+    
+    # JSTの0時から離れた節気しかない年はエフェメリスを一度も評価しない
+    calls = []
+    original = Segment.compute_and_differentiate
+    def counting(self, *args, **kwargs):
+        calls.append(self.target)
+        return original(self, *args, **kwargs)
+    Segment.compute_and_differentiate = counting
+    try:
+        sekki = SolarTerms(precision='date')
+        sekki.calculate(2027)
+        assert sekki.astronomical.last_solver_info['精密計算件数'] == 0
+        assert calls == []
+    finally:
+        Segment.compute_and_differentiate = original
+    
+    assert Hangesho(precision='date').calculate(2024)['datetime_jst'].date() == \
+        Hangesho().calculate(2024)['datetime_jst'].date()
+    
+    # 補正項を当てはめた期間外の節気は全てエフェメリスで求める
+    sekki = SolarTerms(precision='date')
+    sekki.astronomical.SOLAR_PERTURBATIONS_RANGE = (2415020.5, exact.tt[0] - 1)
+    outside = sekki.calculate_range(2000, 2000)
+    assert sekki.astronomical.last_solver_info['精密計算件数'] == len(outside)
+    assert np.max(np.abs(outside.tt - exact.for_year(2000).tt)) * 86400 < 0.1
+
+def test_calculate_terms():
+    """指定した節気だけを求め、一年分の節気と一致することを確認"""
+    sekki = SolarTerms()
+    terms = sekki.calculate_terms(2024, ['秋分', '立春', '春分'])
+    assert [t['イベント名'] for t in terms] == ['立春', '春分', '秋分']
+    assert sekki._table_years is None
+    
+    full = {t['イベント名']: t['datetime_jst'] for t in SolarTerms().calculate(2024)}
+    for term in terms:
+        assert abs((term['datetime_jst'] - full[term['イベント名']]).total_seconds()) < 0.1
+    
+    # 祝日の計算は春分・秋分だけを求め、一年分の節気を探索しない
+    holiday = Holiday()
+    names = {h['名称']: h['日付'] for h in holiday.calculate(2024)}
+    assert holiday.sekki_calculator._table_years is None
+    assert names['春分の日'] == date(2024, 3, 20)
+    assert names['秋分の日'] == date(2024, 9, 22)
+
+if __name__ == "__main__":
+    test_solar_terms_range()
+    test_date_precision()
+    test_calculate_terms()
@@ -1,4 +1,27 @@
 from koyomi.cycles.specific_eto import SpecificEto
+from koyomi.cycles.eto_daily import DailyEto
+from datetime import date
+import numpy as np
+import pytest
+
+def test_calculate_range():
+    """60日周期の剰余で求めた特定干支の日が、全日の干支と一致することを確認"""
+    calculator = SpecificEto()
+    
+    # 1900〜2100年の庚申待ちの夜
+    start, end = date(1900, 1, 1).toordinal(), date(2100, 12, 31).toordinal()
+    results = calculator.calculate_range(start, end, ['庚申', '甲子', '癸亥'])
+    
+    ordinals = np.arange(start, end + 1)
+    indices = DailyEto().kanshi_indices(ordinals)
+    for eto, index in [('庚申', 56), ('甲子', 0), ('癸亥', 59)]:
+        assert np.array_equal(results[eto], ordinals[indices == index])
+    assert len(results['庚申']) == 1223
+    
+    assert calculator.calculate_year(2024)['甲子'][0] == date(2024, 1, 1)
+    assert len(calculator.calculate_range(date(2024, 1, 2), date(2024, 2, 29), ['甲子'])['甲子']) == 0
+    with pytest.raises(ValueError):
+        calculator.calculate_range(start, end, ['甲丑'])
 
 def main():
     calculator = SpecificEto()